@@ -9,6 +9,8 @@ Key Components:
     - **registry**: FACTS (Functional And Configuration Tracking System) registry
     - **response**: Standardized response objects for API operations
     - **exceptions**: Custom exception classes for database operations
+    - **tenant**: Concurrent provisioning and teardown of a client's tables and the shared tables
+    - **warm**: Lambda init-phase warm-up of models, connections and hot registry reads
 
 Architecture Overview::
 
@@ -141,3 +143,16 @@ Note:
 """
 
 __version__ = "0.1.2-pre.28+1d11573"
+
+from .lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "TableFactory": ".models",
+        "provision_tenant": ".tenant",
+        "provision_global_tables": ".tenant",
+        "teardown_tenant": ".tenant",
+        "warmup": ".warm",
+    },
+)
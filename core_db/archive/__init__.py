@@ -0,0 +1,42 @@
+"""Cold archive export of events and items.
+
+Streams deployment events and CMDB items out of DynamoDB by time range into gzip-compressed
+newline-delimited JSON or columnar JSON chunks on the local storage volume or in S3, and
+optionally batch-deletes the archived rows.  Jobs are resumable through a persisted cursor.
+
+Key Classes:
+    - **ArchiveActions**: Runs archive jobs for events and items
+    - **ArchiveCursor**: Persisted progress of an archive job
+    - **ArchiveStore**: Reads and writes archive objects locally or in S3
+
+Example:
+    >>> from core_db.archive import ArchiveActions
+    >>> cursor = ArchiveActions.archive_events(client="acme", latest_time="2023-01-01T00:00:00Z", delete=True)
+    >>> cursor.completed
+    True
+"""
+
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ArchiveActions": ".archiver",
+        "ArchiveCursor": ".archiver",
+        "ArchiveStore": ".archiver",
+        "encode_chunk": ".archiver",
+        "decode_chunk": ".archiver",
+        "CHUNK_FORMAT_NDJSON": ".archiver",
+        "CHUNK_FORMAT_COLUMNAR": ".archiver",
+    },
+)
+
+__all__ = [
+    "ArchiveActions",
+    "ArchiveCursor",
+    "ArchiveStore",
+    "encode_chunk",
+    "decode_chunk",
+    "CHUNK_FORMAT_NDJSON",
+    "CHUNK_FORMAT_COLUMNAR",
+]
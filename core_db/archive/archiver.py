@@ -0,0 +1,619 @@
+"""Cold archive export for the events and items tables.
+
+Deployment events and CMDB items accumulate indefinitely.  Compliance requires that they are
+retained for years, but keeping them in DynamoDB is costly and every scan of the live tables
+gets slower as they grow.  This module streams records out of the tables by time range and
+writes them as gzip-compressed chunks to the storage location returned by
+:func:`core_db.facter.facter.get_store_url` (the local storage volume or an S3 bucket,
+depending on ``util.is_use_s3()``).  Archived rows may optionally be removed from the table
+with batched deletes once their chunk has been written.
+
+Two chunk formats are supported:
+
+    - **ndjson**: one JSON document per line (``part-000000.ndjson.gz``).  Easy to grep,
+      stream, and load into Athena or any JSON-lines reader.
+    - **columnar**: one JSON document per chunk holding a column list and one value array
+      per column (``part-000000.columnar.json.gz``).  This is a dependency-free, Parquet-like
+      layout that compresses considerably better because similar values sit together.
+
+Progress is persisted in an :class:`ArchiveCursor` document (``_cursor.json``) stored next to
+the chunks.  The cursor is saved after every chunk, so an interrupted job (Lambda timeout,
+throttling, crash) resumes from the last completed chunk when invoked again with the same
+arguments.  Each chunk is written, then recorded in the cursor, and only then are its rows
+deleted, so a deleted row is always in a chunk the cursor points to.  A job interrupted
+between saving the cursor and deleting leaves that chunk's rows in the table; they are
+archived again (not lost) by a later job over the same range.  A new job never reuses the
+chunk names of the job before it.
+
+Examples:
+    >>> from core_db.archive import ArchiveActions
+    >>> cursor = ArchiveActions.archive_events(
+    ...     client="acme",
+    ...     latest_time="2023-01-01T00:00:00Z",
+    ...     delete=True,
+    ... )
+    >>> cursor.completed, cursor.record_count
+    (True, 15230)
+
+    >>> cursor = ArchiveActions.archive_items(
+    ...     client="acme",
+    ...     item_type="build",
+    ...     latest_time="2023-01-01T00:00:00Z",
+    ...     chunk_format="columnar",
+    ... )
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import gzip
+import json
+import os
+
+import boto3
+from botocore.exceptions import ClientError
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pynamodb.exceptions import ScanError, DeleteError, PutError
+
+import core_logging as log
+import core_framework as util
+from core_framework.constants import (
+    SCOPE_PORTFOLIO,
+    SCOPE_APP,
+    SCOPE_BRANCH,
+    SCOPE_BUILD,
+    SCOPE_COMPONENT,
+)
+
+from ..models import Paginator
+from ..pagefill import fill_page
+from ..event.models import EventItem
+from ..item.models import ItemModelRecord
+from ..item.portfolio.models import PortfolioItem
+from ..item.app.models import AppItem
+from ..item.branch.models import BranchItem
+from ..item.build.models import BuildItem
+from ..item.component.models import ComponentItem
+from ..facter.facter import get_store_url
+
+from ..exceptions import (
+    BadRequestException,  # http 400
+    UnknownException,  # http 500
+)
+
+ARCHIVE_FOLDER = "archive"
+"""Folder within the artefact bucket (or storage volume) that holds all archives."""
+
+CURSOR_FILE = "_cursor.json"
+"""Name of the resumable cursor document stored alongside the chunks."""
+
+CHUNK_FORMAT_NDJSON = "ndjson"
+CHUNK_FORMAT_COLUMNAR = "columnar"
+
+CHUNK_EXTENSIONS = {
+    CHUNK_FORMAT_NDJSON: "ndjson.gz",
+    CHUNK_FORMAT_COLUMNAR: "columnar.json.gz",
+}
+
+ITEM_RECORD_TYPES: Dict[str, type[ItemModelRecord]] = {
+    SCOPE_PORTFOLIO: PortfolioItem,
+    SCOPE_APP: AppItem,
+    SCOPE_BRANCH: BranchItem,
+    SCOPE_BUILD: BuildItem,
+    SCOPE_COMPONENT: ComponentItem,
+}
+"""Record type used to deserialize each item type found in the items table."""
+
+
+class ArchiveCursor(BaseModel):
+    """Persisted progress of an archive job.
+
+    Attributes:
+        kind (str): What is being archived, ``"events"`` or ``"items/<item_type>"``
+        client (str): Client whose tables are being archived
+        earliest_time (datetime, optional): Start of the archived time range
+        latest_time (datetime, optional): End of the archived time range
+        chunk_format (str): Chunk encoding, ``"ndjson"`` or ``"columnar"``
+        cursor (str, optional): Paginator cursor of the next page to read
+        chunk_index (int): Index of the next chunk to write
+        record_count (int): Number of records written so far
+        deleted_count (int): Number of records deleted from the table so far
+        chunks (list[str]): Names of the chunks written so far
+        completed (bool): True when the whole time range has been archived
+    """
+
+    model_config = ConfigDict(populate_by_name=True, validate_assignment=True)
+
+    kind: str = Field(..., alias="Kind", description="What is being archived (events or items/<item_type>)")
+    client: str = Field(..., alias="Client", description="Client whose tables are being archived")
+    earliest_time: Optional[datetime] = Field(None, alias="EarliestTime", description="Start of the archived time range")
+    latest_time: Optional[datetime] = Field(None, alias="LatestTime", description="End of the archived time range")
+    chunk_format: str = Field(CHUNK_FORMAT_NDJSON, alias="ChunkFormat", description="Chunk encoding (ndjson or columnar)")
+    cursor: Optional[str] = Field(None, alias="Cursor", description="Paginator cursor of the next page to read")
+    chunk_index: int = Field(0, alias="ChunkIndex", description="Index of the next chunk to write")
+    record_count: int = Field(0, alias="RecordCount", description="Number of records written so far")
+    deleted_count: int = Field(0, alias="DeletedCount", description="Number of records deleted so far")
+    chunks: List[str] = Field(default_factory=list, alias="Chunks", description="Names of the chunks written so far")
+    completed: bool = Field(False, alias="Completed", description="True when the whole time range has been archived")
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(tz=timezone.utc),
+        alias="UpdatedAt",
+        description="When the cursor was last saved",
+    )
+
+    @field_validator("chunk_format")
+    @classmethod
+    def validate_chunk_format(cls, value: str) -> str:
+        """Only the formats in ``CHUNK_EXTENSIONS`` are supported."""
+        if value not in CHUNK_EXTENSIONS:
+            raise ValueError(f"Unsupported chunk format '{value}'. Use one of {sorted(CHUNK_EXTENSIONS)}")
+        return value
+
+    @field_validator("earliest_time", "latest_time", mode="before")
+    @classmethod
+    def validate_times(cls, value: Any) -> Optional[datetime]:
+        """Accept ISO8601 strings as well as datetimes."""
+        return Paginator.validate_date(value)
+
+    def matches(self, other: "ArchiveCursor") -> bool:
+        """Return True if ``other`` describes the same archive job as this cursor.
+
+        A persisted cursor is only resumed when the job parameters are identical;
+        otherwise the chunks on disk belong to a different job.
+        """
+        return (
+            self.kind == other.kind
+            and self.client == other.client
+            and self.earliest_time == other.earliest_time
+            and self.latest_time == other.latest_time
+            and self.chunk_format == other.chunk_format
+        )
+
+    def chunk_name(self) -> str:
+        """Return the file name of the next chunk to write."""
+        return f"part-{self.chunk_index:06d}.{CHUNK_EXTENSIONS[self.chunk_format]}"
+
+
+class ArchiveStore:
+    """Reads and writes archive objects in a local folder or an S3 prefix.
+
+    The location is a URL in the form produced by ``get_store_url``: either a filesystem
+    path or ``s3://bucket/prefix``.
+    """
+
+    def __init__(self, location: str, region: str | None = None):
+        self.location = location.rstrip("/\\")
+        self.is_s3 = self.location.startswith("s3:")
+        if self.is_s3:
+            bucket, _, prefix = self.location[3:].lstrip("/").partition("/")
+            self.bucket = bucket
+            self.prefix = prefix.strip("/")
+            self._s3 = boto3.client("s3", region_name=region)
+
+    def _key(self, name: str) -> str:
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def put(self, name: str, body: bytes, content_type: str = "application/octet-stream") -> str:
+        """Write an object and return its full location."""
+        if self.is_s3:
+            key = self._key(name)
+            self._s3.put_object(Bucket=self.bucket, Key=key, Body=body, ContentType=content_type)
+            return f"s3://{self.bucket}/{key}"
+
+        path = os.path.join(self.location, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write then rename so a crash never leaves a truncated object behind
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        return path
+
+    def get(self, name: str) -> bytes | None:
+        """Read an object, returning None if it does not exist."""
+        if self.is_s3:
+            try:
+                response = self._s3.get_object(Bucket=self.bucket, Key=self._key(name))
+                return response["Body"].read()
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                    return None
+                raise
+
+        path = os.path.join(self.location, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def encode_chunk(rows: List[Dict[str, Any]], chunk_format: str) -> bytes:
+    """Encode a list of JSON-ready rows as a gzip-compressed chunk.
+
+    Args:
+        rows (list[dict]): Records already converted to JSON-compatible values
+        chunk_format (str): ``"ndjson"`` or ``"columnar"``
+
+    Returns:
+        bytes: The compressed chunk
+    """
+    if chunk_format == CHUNK_FORMAT_COLUMNAR:
+        columns: List[str] = []
+        for row in rows:
+            for key in row:
+                if key not in columns:
+                    columns.append(key)
+        document = {
+            "Columns": columns,
+            "Count": len(rows),
+            "Data": {column: [row.get(column) for row in rows] for column in columns},
+        }
+        payload = json.dumps(document, separators=(",", ":")).encode("utf-8")
+    else:
+        payload = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode("utf-8")
+
+    return gzip.compress(payload)
+
+
+def decode_chunk(body: bytes, chunk_format: str) -> List[Dict[str, Any]]:
+    """Decode a chunk produced by :func:`encode_chunk` back into a list of rows.
+
+    Args:
+        body (bytes): The compressed chunk
+        chunk_format (str): ``"ndjson"`` or ``"columnar"``
+
+    Returns:
+        list[dict]: The archived rows.  Columnar rows omit columns that were absent (None).
+    """
+    payload = gzip.decompress(body).decode("utf-8")
+
+    if chunk_format == CHUNK_FORMAT_COLUMNAR:
+        document = json.loads(payload)
+        data = document["Data"]
+        rows = []
+        for i in range(document["Count"]):
+            rows.append({column: data[column][i] for column in document["Columns"] if data[column][i] is not None})
+        return rows
+
+    return [json.loads(line) for line in payload.splitlines() if line]
+
+
+class ArchiveActions:
+    """Archive events and items to compressed chunks and optionally purge them from DynamoDB."""
+
+    @classmethod
+    def get_archive_url(cls, client: str) -> str:
+        """Return the default archive location for a client.
+
+        The archive lives in the ``archive`` folder of the client's artefact bucket.
+
+        Args:
+            client (str): Client identifier
+
+        Returns:
+            str: Local path or ``s3://`` URL of the archive root
+        """
+        bucket_name = util.get_artefact_bucket_name(client)
+        bucket_region = util.get_artefact_bucket_region()
+        sep = "/" if util.is_use_s3() else os.path.sep
+        return sep.join([get_store_url(bucket_name, bucket_region), ARCHIVE_FOLDER])
+
+    @classmethod
+    def archive_events(
+        cls,
+        *,
+        client: str,
+        earliest_time: datetime | str | None = None,
+        latest_time: datetime | str | None = None,
+        **kwargs,
+    ) -> ArchiveCursor:
+        """Archive events in a time range.
+
+        Scans the events table with a timestamp filter, filling each chunk with up to
+        ``chunk_size`` events (see :func:`core_db.pagefill.fill_page`).  The scan does not
+        depend on the event-day-index, so events written before EventDay existed are archived too.
+
+        Args:
+            client (str): Client identifier
+            earliest_time (datetime | str, optional): Archive events at or after this time
+            latest_time (datetime | str, optional): Archive events at or before this time
+            **kwargs: Options shared with :meth:`archive_items`:
+
+                - chunk_format (str): ``"ndjson"`` (default) or ``"columnar"``
+                - chunk_size (int): Records read per page / chunk.  Defaults to 1000.
+                - delete (bool): Remove archived rows from the table.  Defaults to False.
+                - max_chunks (int, optional): Stop after this many chunks (resume later)
+                - archive_url (str, optional): Override the archive root location
+                - restart (bool): Ignore any persisted cursor and start over.  Defaults to False.
+
+        Returns:
+            ArchiveCursor: The job progress.  ``completed`` is False if ``max_chunks`` stopped the job early.
+
+        Raises:
+            BadRequestException: If the client or options are invalid
+            UnknownException: If reading, writing, or deleting fails
+        """
+        if not client:
+            raise BadRequestException("Client identifier is required to archive events.")
+
+        model_class = EventItem.model_class(client)
+
+        def read_page(cursor: ArchiveCursor, limit: int) -> Tuple[List[EventItem], str | None]:
+            paginator = Paginator(limit=limit, cursor=cursor.cursor)
+
+            scan_args = paginator.get_fill_args(scan=True)
+            if cursor.earliest_time and cursor.latest_time:
+                scan_args["filter_condition"] = model_class.timestamp.between(cursor.earliest_time, cursor.latest_time)
+            elif cursor.earliest_time:
+                scan_args["filter_condition"] = model_class.timestamp >= cursor.earliest_time
+            elif cursor.latest_time:
+                scan_args["filter_condition"] = model_class.timestamp <= cursor.latest_time
+
+            try:
+                items, last_evaluated_key = fill_page(model_class.scan(**scan_args), limit=limit)
+                data = [EventItem.from_model(item) for item in items]
+            except ScanError as e:
+                raise UnknownException("Database operation failed while scanning events") from e
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = last_evaluated_key
+            return data, paginator.cursor
+
+        def key_of(record: EventItem):
+            return model_class(prn=record.prn, timestamp=record.timestamp)
+
+        return cls._archive(
+            kind="events",
+            client=client,
+            earliest_time=earliest_time,
+            latest_time=latest_time,
+            read_page=read_page,
+            key_of=key_of,
+            model_class=model_class,
+            **kwargs,
+        )
+
+    @classmethod
+    def archive_items(
+        cls,
+        *,
+        client: str,
+        item_type: str,
+        earliest_time: datetime | str | None = None,
+        latest_time: datetime | str | None = None,
+        **kwargs,
+    ) -> ArchiveCursor:
+        """Archive items of one type whose creation time falls in a time range.
+
+        The items table holds every item type, so each type is archived separately using
+        its own record type to keep all type-specific attributes.
+
+        Args:
+            client (str): Client identifier
+            item_type (str): One of portfolio, app, branch, build, component
+            earliest_time (datetime | str, optional): Archive items created at or after this time
+            latest_time (datetime | str, optional): Archive items created at or before this time
+            **kwargs: Options, see :meth:`archive_events`
+
+        Returns:
+            ArchiveCursor: The job progress
+
+        Raises:
+            BadRequestException: If the client, item type, or options are invalid
+            UnknownException: If reading, writing, or deleting fails
+        """
+        if not client:
+            raise BadRequestException("Client identifier is required to archive items.")
+
+        record_type = ITEM_RECORD_TYPES.get(item_type)
+        if record_type is None:
+            raise BadRequestException(f"Invalid item type '{item_type}'. Use one of {list(ITEM_RECORD_TYPES)}")
+
+        model_class = record_type.model_class(client)
+
+        def read_page(cursor: ArchiveCursor, limit: int) -> Tuple[List[ItemModelRecord], str | None]:
+            paginator = Paginator(limit=limit, cursor=cursor.cursor)
+
+            condition = model_class.item_type == item_type
+            if cursor.earliest_time and cursor.latest_time:
+                condition &= model_class.created_at.between(cursor.earliest_time, cursor.latest_time)
+            elif cursor.earliest_time:
+                condition &= model_class.created_at >= cursor.earliest_time
+            elif cursor.latest_time:
+                condition &= model_class.created_at <= cursor.latest_time
+
+            scan_args = paginator.get_scan_args()
+            scan_args["filter_condition"] = condition
+
+            try:
+                result = model_class.scan(**scan_args)
+                data = [record_type.from_model(item) for item in result]
+            except ScanError as e:
+                raise UnknownException("Database operation failed while scanning items") from e
+
+            paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
+            return data, paginator.cursor
+
+        def key_of(record: ItemModelRecord):
+            return model_class(parent_prn=record.parent_prn, prn=record.prn)
+
+        return cls._archive(
+            kind=f"items/{item_type}",
+            client=client,
+            earliest_time=earliest_time,
+            latest_time=latest_time,
+            read_page=read_page,
+            key_of=key_of,
+            model_class=model_class,
+            **kwargs,
+        )
+
+    @classmethod
+    def load_cursor(cls, *, client: str, kind: str, archive_url: str | None = None) -> ArchiveCursor | None:
+        """Return the persisted cursor of an archive job, or None if the job never ran.
+
+        Args:
+            client (str): Client identifier
+            kind (str): ``"events"`` or ``"items/<item_type>"``
+            archive_url (str, optional): Override the archive root location
+
+        Returns:
+            ArchiveCursor | None: The persisted progress
+        """
+        store = cls._get_store(client, kind, archive_url)
+        body = store.get(CURSOR_FILE)
+        if body is None:
+            return None
+        return ArchiveCursor.model_validate_json(body)
+
+    @classmethod
+    def read_chunks(cls, *, client: str, kind: str, archive_url: str | None = None) -> List[Dict[str, Any]]:
+        """Read back every row written by an archive job, in chunk order.
+
+        Intended for restores and verification of small archives.
+
+        Args:
+            client (str): Client identifier
+            kind (str): ``"events"`` or ``"items/<item_type>"``
+            archive_url (str, optional): Override the archive root location
+
+        Returns:
+            list[dict]: The archived rows with PascalCase keys
+        """
+        store = cls._get_store(client, kind, archive_url)
+        body = store.get(CURSOR_FILE)
+        if body is None:
+            return []
+        cursor = ArchiveCursor.model_validate_json(body)
+
+        rows: List[Dict[str, Any]] = []
+        for name in cursor.chunks:
+            chunk = store.get(name)
+            if chunk is None:
+                raise UnknownException(f"Archive chunk {name} is missing from {store.location}")
+            rows.extend(decode_chunk(chunk, cursor.chunk_format))
+        return rows
+
+    @classmethod
+    def _get_store(cls, client: str, kind: str, archive_url: str | None) -> ArchiveStore:
+        root = archive_url or cls.get_archive_url(client)
+        sep = "/" if root.startswith("s3:") else os.path.sep
+        location = sep.join([root.rstrip("/\\"), client, *kind.split("/")])
+        return ArchiveStore(location, region=util.get_artefact_bucket_region() if sep == "/" else None)
+
+    @classmethod
+    def _archive(  # noqa: C901
+        cls,
+        *,
+        kind: str,
+        client: str,
+        earliest_time: datetime | str | None,
+        latest_time: datetime | str | None,
+        read_page,
+        key_of,
+        model_class,
+        chunk_format: str = CHUNK_FORMAT_NDJSON,
+        chunk_size: int = 1000,
+        delete: bool = False,
+        max_chunks: int | None = None,
+        archive_url: str | None = None,
+        restart: bool = False,
+    ) -> ArchiveCursor:
+        """Run (or resume) an archive job.
+
+        Args:
+            read_page: ``(cursor, limit) -> (records, next_cursor)`` reading one page of records
+            key_of: ``record -> model`` building a keys-only model instance for deletes
+            model_class: The client-specific PynamoDB model used for batch deletes
+        """
+        try:
+            requested = ArchiveCursor(
+                kind=kind,
+                client=client,
+                earliest_time=earliest_time,
+                latest_time=latest_time,
+                chunk_format=chunk_format,
+            )
+        except ValueError as e:
+            raise BadRequestException(f"Invalid archive parameters: {e}") from e
+
+        if not 1 <= chunk_size <= 1000:
+            raise BadRequestException("chunk_size must be between 1 and 1000")
+
+        store = cls._get_store(client, kind, archive_url)
+
+        cursor = requested
+        body = store.get(CURSOR_FILE)
+        persisted = ArchiveCursor.model_validate_json(body) if body else None
+        if persisted is not None:
+            if not restart and persisted.matches(requested):
+                cursor = persisted
+                log.info("Resuming %s archive for client %s at chunk %d", kind, client, cursor.chunk_index)
+            else:
+                # A new job in the same folder numbers its chunks after the previous job's,
+                # so it never overwrites chunks whose rows may have been deleted
+                cursor.chunk_index = persisted.chunk_index
+
+        chunks_written = 0
+        while not cursor.completed:
+            if max_chunks is not None and chunks_written >= max_chunks:
+                break
+
+            records, next_cursor = read_page(cursor, chunk_size)
+
+            if records:
+                rows = [record.model_dump(mode="json", by_alias=True, exclude_none=True) for record in records]
+                name = cursor.chunk_name()
+                try:
+                    store.put(name, encode_chunk(rows, cursor.chunk_format), content_type="application/gzip")
+                except Exception as e:
+                    log.error("Failed to write archive chunk %s: %s", name, str(e))
+                    raise UnknownException(f"Failed to write archive chunk {name}") from e
+
+                if name not in cursor.chunks:
+                    cursor.chunks.append(name)
+                cursor.chunk_index += 1
+                cursor.record_count += len(rows)
+                chunks_written += 1
+
+            # A scan page can be empty when the filter rejects every row; keep going until the table is exhausted
+            if next_cursor is None or next_cursor == cursor.cursor:
+                cursor.cursor = None
+                cursor.completed = True
+            else:
+                cursor.cursor = next_cursor
+
+            # Save before deleting: a resumed job must never write a new page over the chunk
+            # that holds rows already deleted from the table
+            cls._save_cursor(store, cursor)
+
+            if records and delete:
+                cursor.deleted_count += cls._batch_delete(model_class, [key_of(record) for record in records])
+                cls._save_cursor(store, cursor)
+
+        log.info(
+            "Archived %d %s records for client %s into %d chunks (completed=%s)",
+            cursor.record_count,
+            kind,
+            client,
+            len(cursor.chunks),
+            cursor.completed,
+        )
+
+        return cursor
+
+    @classmethod
+    def _save_cursor(cls, store: ArchiveStore, cursor: ArchiveCursor) -> None:
+        cursor.updated_at = datetime.now(tz=timezone.utc)
+        store.put(CURSOR_FILE, cursor.model_dump_json(by_alias=True).encode("utf-8"), content_type="application/json")
+
+    @classmethod
+    def _batch_delete(cls, model_class, keys: list) -> int:
+        """Delete rows with BatchWriteItem, 25 keys per request."""
+        try:
+            with model_class.batch_write() as batch:
+                for key in keys:
+                    batch.delete(key)
+            return len(keys)
+        except (DeleteError, PutError) as e:
+            log.error("Failed to delete archived rows: %s", str(e))
+            raise UnknownException("Failed to delete archived rows") from e
@@ -1,8 +1,26 @@
-from .audit import AuthAuditSchemas, AuthAuditActions, AuthAuditModelFactory, AuthAuditModel
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AuthAuditSchemas": ".audit",
+        "AuthAuditActions": ".audit",
+        "AuthAuditModelFactory": ".audit",
+        "AuthAuditModel": ".audit",
+        "make_audit_pk": ".audit",
+        "make_audit_sk": ".audit",
+        "AuditWriter": ".writer",
+        "get_audit_writer": ".writer",
+    },
+)
 
 __all__ = [
     "AuthAuditSchemas",
     "AuthAuditActions",
     "AuthAuditModelFactory",
     "AuthAuditModel",
+    "AuditWriter",
+    "get_audit_writer",
+    "make_audit_pk",
+    "make_audit_sk",
 ]
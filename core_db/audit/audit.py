@@ -1,4 +1,6 @@
 from typing import Optional, Any, Tuple
+from datetime import datetime, timezone
+import uuid
 
 from pydantic import Field, ConfigDict
 
@@ -8,20 +10,79 @@ from pynamodb.attributes import (
     MapAttribute,
     NumberAttribute,
 )
-from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
+from pynamodb.indexes import GlobalSecondaryIndex, IncludeProjection
 from pynamodb.exceptions import (
     DoesNotExist,
     GetError,
     PutError,
     DeleteError,
     QueryError,
+    ScanError,
+    UpdateError,
 )
 
-from core_db.exceptions import NotFoundException, UnknownException, ConflictException
+from core_db.exceptions import BadRequestException, NotFoundException, UnknownException, ConflictException
+
+import core_logging as log
 
 
 from ..models import DatabaseRecord, DatabaseTable, Paginator, TableFactory
 from ..actions import TableActions
+from ..buckets import day_buckets, query_buckets_parallel
+
+AUDIT_LISTING_ATTRIBUTES = ["ActorUserId", "ChangeType", "Reason", "RequestId", "ExpireAt"]
+"""Non-key attributes projected into the audit GSIs.  The change lists are read by hydrating."""
+
+
+def make_audit_pk(tenant: str, user_id: str) -> str:
+    """Return the audit PK ``tenant#<tenant>#user#<user_id>``."""
+    return f"tenant#{tenant}#user#{user_id}"
+
+
+def make_audit_sk(timestamp: Optional[datetime] = None) -> str:
+    """Return a time-ordered, unique audit SK ``ts#<ISO8601>|<epoch>#<nonce>``.
+
+    The nonce is a random 128-bit UUID, so two records never share a key even when written
+    in the same microsecond, and no conditional write is needed to keep keys unique.
+
+    Args:
+        timestamp (datetime, optional): Event time; defaults to now (UTC)
+
+    Returns:
+        str: The sort key
+    """
+    ts = timestamp or datetime.now(timezone.utc)
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    ts = ts.astimezone(timezone.utc)
+    return f"ts#{ts.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}|{int(ts.timestamp())}#{uuid.uuid4().hex}"
+
+
+def audit_sk_bound(timestamp: datetime, upper: bool = False) -> str:
+    """Return an SK bound for a time-range condition on ``ts#<ISO8601>...`` sort keys.
+
+    Bounds have one-second resolution: the lower bound includes the whole second of
+    ``timestamp`` and so does the upper bound.
+
+    Args:
+        timestamp (datetime): The time; naive datetimes are treated as UTC
+        upper (bool): True for an inclusive upper bound, False for an inclusive lower bound
+
+    Returns:
+        str: The bound
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    prefix = f"ts#{timestamp.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')}"
+    # '~' sorts after every character that follows the seconds in an ISO8601 timestamp
+    return prefix + "~" if upper else prefix
+
+
+def audit_day(sk: str) -> Optional[str]:
+    """Return the UTC day bucket ("YYYY-MM-DD") of a ``ts#<ISO8601>...`` sort key, or None."""
+    if not sk or not sk.startswith("ts#") or len(sk) < 13:
+        return None
+    return sk[3:13]
 
 
 class AuditByActorIndex(GlobalSecondaryIndex):
@@ -29,7 +90,7 @@ class AuditByActorIndex(GlobalSecondaryIndex):
 
     class Meta:
         index_name = "actor-index"
-        projection = AllProjection()
+        projection = IncludeProjection(AUDIT_LISTING_ATTRIBUTES)
         billing_mode = "PAY_PER_REQUEST"
 
     actor_user_id = UnicodeAttribute(hash_key=True, attr_name="ActorUserId")
@@ -41,7 +102,7 @@ class AuditByChangeTypeIndex(GlobalSecondaryIndex):
 
     class Meta:
         index_name = "change-type-index"
-        projection = AllProjection()
+        projection = IncludeProjection(AUDIT_LISTING_ATTRIBUTES)
         billing_mode = "PAY_PER_REQUEST"
 
     change_type = UnicodeAttribute(hash_key=True, attr_name="ChangeType")
@@ -53,12 +114,27 @@ class AuditByRequestIdIndex(GlobalSecondaryIndex):
 
     class Meta:
         index_name = "request-id-index"
-        projection = AllProjection()
+        projection = IncludeProjection(AUDIT_LISTING_ATTRIBUTES)
         billing_mode = "PAY_PER_REQUEST"
 
     request_id = UnicodeAttribute(hash_key=True, attr_name="RequestId")
 
 
+class AuditByDayIndex(GlobalSecondaryIndex):
+    """GSI for listing audit events across all users in time order.
+
+    Records are bucketed by the UTC day of their SK so a time window becomes one query per day
+    instead of a scan of the whole table.
+    """
+
+    class Meta:
+        index_name = "audit-day-index"
+        projection = IncludeProjection(AUDIT_LISTING_ATTRIBUTES)
+
+    audit_day = UnicodeAttribute(hash_key=True, attr_name="AuditDay")
+    sk = UnicodeAttribute(range_key=True, attr_name="SK")
+
+
 class AuthAuditModel(DatabaseTable):
     """PynamoDB model for authorization audit events.
 
@@ -69,10 +145,17 @@ class AuthAuditModel(DatabaseTable):
       - actor-index:    actor_user_id → SK (time-ordered per actor)
       - change-type-index: change_type → SK (time-ordered per change type)
       - request-id-index: request_id (fetch by correlation id)
+      - audit-day-index: audit_day → SK (time-ordered across users, one bucket per UTC day)
+
+    The GSIs project only the listing attributes (AUDIT_LISTING_ATTRIBUTES); records read
+    through them are hydrated from the table unless the caller asks for listings only.
+    Tables created when the GSIs projected ALL keep working; ``provision_tenant(client,
+    rebuild_indexes=True)`` rebuilds their indexes with the narrower projection.
     """
 
     class Meta(DatabaseTable.Meta):
-        pass
+        # ExpireAt is epoch seconds in a NumberAttribute; provision_tenant enables TTL on it
+        ttl_attribute = "ExpireAt"
 
     # Primary keys
     pk = UnicodeAttribute(hash_key=True, attr_name="PK")
@@ -99,10 +182,14 @@ class AuthAuditModel(DatabaseTable):
     # Optional TTL support
     expire_at = NumberAttribute(null=True, attr_name="ExpireAt")
 
+    # Time bucket for listings across users, derived from the SK
+    audit_day = UnicodeAttribute(null=True, attr_name="AuditDay")
+
     # Indexes
     by_actor_index = AuditByActorIndex()
     by_change_type_index = AuditByChangeTypeIndex()
     by_request_id_index = AuditByRequestIdIndex()
+    by_day_index = AuditByDayIndex()
 
     def __repr__(self) -> str:
         return f"<AuthAuditModel(pk={self.pk}, sk={self.sk}, change_type={self.change_type})>"
@@ -180,7 +267,9 @@ class AuthAuditSchemas(DatabaseRecord):
 
     def to_model(self, client: str) -> AuthAuditModel:
         model_cls = AuthAuditModelFactory.get_model(client)
-        return model_cls(**self.model_dump())
+        model = model_cls(**self.model_dump())
+        model.audit_day = audit_day(self.sk)
+        return model
 
 
 class AuthAuditActions(TableActions):
@@ -232,14 +321,43 @@ class AuthAuditActions(TableActions):
             raise UnknownException(str(e)) from e
 
     @classmethod
-    def query_by_actor(cls, *, client: str, actor_user_id: str, limit: int = 50) -> Tuple[list[AuthAuditSchemas], Paginator]:
+    def query_by_actor(
+        cls,
+        *,
+        client: str,
+        actor_user_id: str,
+        limit: int = 50,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        hydrate: bool = True,
+    ) -> Tuple[list[AuthAuditSchemas], Paginator]:
+        """
+        List audit records written by an actor, oldest first.
+
+        Args:
+            client (str): The client identifier.
+            actor_user_id (str): The actor whose records to list.
+            limit (int): Maximum number of records to return.
+            since (datetime, optional): Only records at or after this time (1 second resolution).
+            until (datetime, optional): Only records at or before this time (1 second resolution).
+            hydrate (bool): Read the full records, including the change lists, from the table.
+                With False, only the listing attributes are read: the change lists are empty
+                and the hashes None.
+
+        Returns:
+            Tuple[list[AuthAuditSchemas], Paginator]: The records and the paginator.
+        """
 
         try:
             model_cls = AuthAuditModelFactory.get_model(client)
 
             paginator = Paginator(limit=limit)
 
-            result = model_cls.by_actor_index.query(actor_user_id, **paginator.get_query_args())
+            result = model_cls.by_actor_index.query(
+                actor_user_id,
+                range_key_condition=cls._time_range_condition(model_cls, since, until),
+                **paginator.get_query_args(),
+            )
 
             results = []
             for item in result:
@@ -247,6 +365,9 @@ class AuthAuditActions(TableActions):
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
             paginator.total_count = len(results)
 
+            if hydrate:
+                results = cls.hydrate(client=client, records=results)
+
             return results, paginator
 
         except DoesNotExist:
@@ -256,13 +377,42 @@ class AuthAuditActions(TableActions):
             raise UnknownException(str(e)) from e
 
     @classmethod
-    def query_by_change_type(cls, *, client: str, change_type: str, limit: int = 50) -> Tuple[list[AuthAuditSchemas], Paginator]:
+    def query_by_change_type(
+        cls,
+        *,
+        client: str,
+        change_type: str,
+        limit: int = 50,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        hydrate: bool = True,
+    ) -> Tuple[list[AuthAuditSchemas], Paginator]:
+        """
+        List audit records of a change type, oldest first.
+
+        Args:
+            client (str): The client identifier.
+            change_type (str): The change type to list.
+            limit (int): Maximum number of records to return.
+            since (datetime, optional): Only records at or after this time (1 second resolution).
+            until (datetime, optional): Only records at or before this time (1 second resolution).
+            hydrate (bool): Read the full records, including the change lists, from the table.
+                With False, only the listing attributes are read: the change lists are empty
+                and the hashes None.
+
+        Returns:
+            Tuple[list[AuthAuditSchemas], Paginator]: The records and the paginator.
+        """
         try:
             model_cls = AuthAuditModelFactory.get_model(client)
 
             paginator = Paginator(limit=limit)
 
-            result = model_cls.by_change_type_index.query(change_type, **paginator.get_query_args())
+            result = model_cls.by_change_type_index.query(
+                change_type,
+                range_key_condition=cls._time_range_condition(model_cls, since, until),
+                **paginator.get_query_args(),
+            )
 
             results = []
             for item in result:
@@ -271,12 +421,15 @@ class AuthAuditActions(TableActions):
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
             paginator.total_count = len(results)
 
+            if hydrate:
+                results = cls.hydrate(client=client, records=results)
+
             return results, paginator
         except Exception as e:
             raise UnknownException(str(e)) from e
 
     @classmethod
-    def query_by_request_id(cls, *, client: str, request_id: str) -> Tuple[list[AuthAuditSchemas], Paginator]:
+    def query_by_request_id(cls, *, client: str, request_id: str, hydrate: bool = True) -> Tuple[list[AuthAuditSchemas], Paginator]:
         model_cls = AuthAuditModelFactory.get_model(client)
 
         try:
@@ -292,13 +445,166 @@ class AuthAuditActions(TableActions):
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
             paginator.total_count = len(results)
 
+            if hydrate:
+                results = cls.hydrate(client=client, records=results)
+
             return results, paginator
 
         except Exception as e:
             raise UnknownException(str(e)) from e
 
+    @classmethod
+    def hydrate(cls, *, client: str, records: list[AuthAuditSchemas]) -> list[AuthAuditSchemas]:
+        """
+        Read the full audit records for records listed through a GSI.
+
+        The GSIs only project the listing attributes, so the change lists (role, grant and deny
+        additions and removals) and hashes are missing from their results.  The full records are
+        read with BatchGetItem and returned in the order of ``records``.
+
+        Args:
+            client (str): The client identifier.
+            records (list[AuthAuditSchemas]): Records with at least pk and sk.
+
+        Returns:
+            list[AuthAuditSchemas]: The full records.  Records deleted since listing are dropped.
+        """
+        if not records:
+            return []
+
+        model_cls = AuthAuditModelFactory.get_model(client)
+
+        keys = list(dict.fromkeys((r.pk, r.sk) for r in records))
+        items = {(item.pk, item.sk): item for item in model_cls.batch_get(keys)}
+
+        return [AuthAuditSchemas.from_model(items[(r.pk, r.sk)]) for r in records if (r.pk, r.sk) in items]
+
+    @staticmethod
+    def _time_range_condition(model_cls: AuthAuditModelType, since: Optional[datetime], until: Optional[datetime]):
+        if since and until:
+            return model_cls.sk.between(audit_sk_bound(since), audit_sk_bound(until, upper=True))
+        if since:
+            return model_cls.sk >= audit_sk_bound(since)
+        if until:
+            return model_cls.sk <= audit_sk_bound(until, upper=True)
+        return None
+
+    @classmethod
+    def list_range(
+        cls,
+        *,
+        client: str,
+        start: datetime,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sort_forward: bool = True,
+        hydrate: bool = True,
+    ) -> Tuple[list[AuthAuditSchemas], Paginator]:
+        """
+        List audit records of all users in a time window, in time order.
+
+        The window is split into UTC day buckets of the audit-day-index, which are queried in
+        parallel and merged in time order, so a page reads only the days it needs instead of
+        scanning the table.  The paginator cursor records the day and key to resume from.
+
+        Records written before the index existed have no AuditDay and are not returned until
+        :meth:`backfill_audit_days` has been run.
+
+        Args:
+            client (str): The client identifier.
+            start (datetime): Start of the window, inclusive (1 second resolution).
+            end (datetime, optional): End of the window, inclusive.  Defaults to now.
+            limit (int): Maximum number of records to return.
+            cursor (str, optional): Cursor of the previous page.
+            sort_forward (bool): True for oldest first, False for newest first.
+            hydrate (bool): Read the full records, including the change lists, from the table.
+                With False, only the listing attributes are read: the change lists are empty
+                and the hashes None.
+
+        Returns:
+            Tuple[list[AuthAuditSchemas], Paginator]: The records and the paginator for the next page.
+
+        Raises:
+            BadRequestException: If the cursor is invalid or the window spans too many days.
+            UnknownException: If a query fails.
+        """
+        end = end or datetime.now(timezone.utc)
+
+        try:
+            paginator = Paginator(limit=limit, cursor=cursor, earliest_time=start, latest_time=end, sort_forward=sort_forward)
+            buckets = day_buckets(start, end, sort_forward=sort_forward)
+        except ValueError as e:
+            raise BadRequestException(str(e)) from e
+
+        try:
+            model_cls = AuthAuditModelFactory.get_model(client)
+
+            result, next_cursor = query_buckets_parallel(
+                model_cls.by_day_index,
+                buckets,
+                limit=paginator.limit,
+                cursor=paginator.last_evaluated_key,
+                sort_forward=sort_forward,
+                range_key_condition=cls._time_range_condition(model_cls, start, end),
+                page_size=paginator.page_size,
+            )
+
+            results = [AuthAuditSchemas.from_model(item) for item in result]
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = next_cursor
+            paginator.total_count = len(results)
+
+            if hydrate:
+                results = cls.hydrate(client=client, records=results)
+
+            return results, paginator
+
+        except Exception as e:
+            raise UnknownException(str(e)) from e
+
+    @classmethod
+    def backfill_audit_days(cls, *, client: str) -> int:
+        """
+        Set the AuditDay bucket on audit records written before the audit-day-index existed.
+
+        Safe to run repeatedly; records that already have a bucket are skipped.
+
+        Args:
+            client (str): The client identifier.
+
+        Returns:
+            int: Number of records updated.
+
+        Raises:
+            UnknownException: If the scan or an update fails.
+        """
+        model_cls = AuthAuditModelFactory.get_model(client)
+
+        updated = 0
+        try:
+            for item in model_cls.scan(filter_condition=model_cls.audit_day.does_not_exist()):
+                day = audit_day(item.sk)
+                if day is None:
+                    continue
+                item.update(actions=[model_cls.audit_day.set(day)])
+                updated += 1
+        except (ScanError, UpdateError) as e:
+            log.error("Failed to backfill audit days: %s", str(e))
+            raise UnknownException(f"Failed to backfill audit days: {str(e)}") from e
+
+        log.info("Backfilled AuditDay on %d audit records for client %s", updated, client)
+
+        return updated
+
     @classmethod
     def list_all(cls, *, client: str, limit: int = 50) -> Tuple[list[AuthAuditSchemas], Paginator]:
+        """
+        List every audit record with a paginated scan of the table.
+
+        Prefer :meth:`list_range` for time windows; it reads only the days it returns.
+        """
 
         try:
             model_cls = AuthAuditModelFactory.get_model(client)
@@ -0,0 +1,262 @@
+"""Buffered writer for authorization audit events.
+
+``AuthAuditActions.create`` writes each audit record with a conditional ``PutItem`` on the
+request path.  Bursty admin operations that touch many roles pay that round trip per record.
+:class:`AuditWriter` takes records off the request path instead:
+
+    - :meth:`AuditWriter.submit` puts the record on a bounded in-process queue and returns.
+    - A background thread drains the queue and writes records with ``BatchWriteItem``
+      (25 per request, grouped by client table), retrying failed batches with backoff.  A
+      batch that still fails is written one record at a time with ``AuthAuditActions.create``;
+      only records that fail that too are lost, and they are logged with their content.
+    - When the queue is full, :meth:`~AuditWriter.submit` blocks for up to ``put_timeout``
+      seconds and then writes the record synchronously, so back-pressure never drops records.
+    - :meth:`~AuditWriter.flush` waits until everything submitted so far is written, and
+      :meth:`~AuditWriter.close` (registered with ``atexit`` for the shared writer) flushes
+      and stops the thread.
+
+``BatchWriteItem`` cannot carry the ``attribute_not_exists`` condition that ``create`` uses,
+so uniqueness of (PK, SK) comes from the key itself: ``make_audit_sk`` puts a 128-bit
+random nonce in every SK.  As a safety net the writer also routes any record whose key it
+has already seen (in the same batch or recently) through the conditional ``create`` path,
+which raises a conflict instead of overwriting.
+
+Examples:
+    >>> record = AuthAuditSchemas(pk=make_audit_pk("acme", "alice"), sk=make_audit_sk(), change_type="permissions.update")
+    >>> get_audit_writer().submit("acme", record)
+    >>> get_audit_writer().flush()
+"""
+
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+import atexit
+import queue
+import threading
+import time
+
+from pynamodb.exceptions import PutError
+
+import core_logging as log
+
+from core_db.exceptions import ConflictException
+
+from .audit import AuthAuditActions, AuthAuditModelFactory, AuthAuditSchemas
+
+BATCH_SIZE = 25
+"""Records per BatchWriteItem request (the DynamoDB maximum)."""
+
+DEFAULT_MAX_QUEUE = 10000
+"""Records buffered before submit applies back-pressure."""
+
+DEFAULT_FLUSH_INTERVAL = 0.25
+"""Seconds the writer waits for more records before writing a partial batch."""
+
+DEFAULT_PUT_TIMEOUT = 1.0
+"""Seconds submit blocks on a full queue before writing synchronously."""
+
+DEFAULT_MAX_RETRIES = 3
+"""Attempts per batch before its records are written one at a time."""
+
+RECENT_KEYS = 10000
+"""Number of recently written keys remembered to detect reused SKs."""
+
+
+class AuditWriter:
+    """Buffers audit records and writes them in batches on a background thread.
+
+    Args:
+        max_queue (int): Records buffered before submit applies back-pressure
+        flush_interval (float): Seconds to wait for more records before writing a partial batch
+        put_timeout (float): Seconds submit blocks on a full queue before writing synchronously
+        max_retries (int): Attempts per batch before its records are written one at a time
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        put_timeout: float = DEFAULT_PUT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+
+        self._queue: "queue.Queue[Tuple[str, AuthAuditSchemas]]" = queue.Queue(maxsize=max_queue)
+        self._pending = 0
+        self._pending_lock = threading.Condition()
+        self._recent_keys: "OrderedDict[Tuple[str, str, str], None]" = OrderedDict()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, client: str, record: AuthAuditSchemas) -> None:
+        """Queue an audit record for writing.
+
+        Blocks for up to ``put_timeout`` seconds when the queue is full, then writes the record
+        synchronously with ``AuthAuditActions.create``.
+
+        Args:
+            client (str): The client identifier
+            record (AuthAuditSchemas): The audit record
+
+        Raises:
+            ConflictException: If the record is written synchronously and its key exists
+            UnknownException: If the record is written synchronously and the write fails
+        """
+        if self._stop.is_set():
+            AuthAuditActions.create(client=client, record=record)
+            return
+
+        self._ensure_started()
+
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            self._queue.put((client, record), timeout=self.put_timeout)
+        except queue.Full:
+            self._done(1)
+            log.warning("Audit queue is full; writing audit record synchronously")
+            AuthAuditActions.create(client=client, record=record)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record submitted so far has been written (or given up on).
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            bool: True if the queue drained, False on timeout
+        """
+        with self._pending_lock:
+            return self._pending_lock.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush outstanding records and stop the background thread.
+
+        Records submitted after close are written synchronously.
+        """
+        if self._thread is not None:
+            self.flush(timeout=timeout)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of records submitted but not yet written."""
+        with self._pending_lock:
+            return self._pending
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="core-db-audit-writer", daemon=True)
+                self._thread.start()
+
+    def _done(self, count: int) -> None:
+        with self._pending_lock:
+            self._pending -= count
+            self._pending_lock.notify_all()
+
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            except Exception as e:  # never let the writer thread die
+                log.error("Audit writer failed to write %d records: %s", len(batch), str(e))
+            finally:
+                self._done(len(batch))
+
+    def _write(self, batch: List[Tuple[str, AuthAuditSchemas]]) -> None:
+        by_client: Dict[str, List[AuthAuditSchemas]] = {}
+        for client, record in batch:
+            key = (client, record.pk, record.sk)
+            if key in self._recent_keys:
+                # a reused key: let the conditional create refuse to overwrite it
+                self._write_one(client, record)
+                continue
+            self._remember(key)
+            by_client.setdefault(client, []).append(record)
+
+        for client, records in by_client.items():
+            self._write_batch(client, records)
+
+    def _remember(self, key: Tuple[str, str, str]) -> None:
+        self._recent_keys[key] = None
+        while len(self._recent_keys) > RECENT_KEYS:
+            self._recent_keys.popitem(last=False)
+
+    def _write_batch(self, client: str, records: List[AuthAuditSchemas]) -> None:
+        model_cls = AuthAuditModelFactory.get_model(client)
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                # PynamoDB resubmits unprocessed items itself; a PutError means it gave up
+                with model_cls.batch_write() as batch:
+                    for record in records:
+                        batch.save(record.to_model(client))
+                return
+            except PutError as e:
+                if attempt == self.max_retries:
+                    log.warning(
+                        "Failed to batch write %d audit records for client %s; writing them one at a time: %s",
+                        len(records),
+                        client,
+                        str(e),
+                    )
+                    break
+                time.sleep(0.1 * 2**attempt)
+
+        for record in records:
+            # part of the batch may have been written: the conditional create then reports a conflict
+            self._write_one(client, record, after_batch=True)
+
+    def _write_one(self, client: str, record: AuthAuditSchemas, after_batch: bool = False) -> None:
+        try:
+            AuthAuditActions.create(client=client, record=record)
+        except ConflictException:
+            if not after_batch:
+                log.error("Audit record key reused, record not written: %s %s", record.pk, record.sk)
+        except Exception as e:
+            log.error(
+                "Failed to write audit record %s %s: %s",
+                record.pk,
+                record.sk,
+                str(e),
+                details=record.model_dump(mode="json"),
+            )
+
+
+_writer: Optional[AuditWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Return the shared audit writer, created on first use and closed at interpreter exit."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AuditWriter()
+                atexit.register(_writer.close)
+    return _writer
@@ -0,0 +1,245 @@
+"""Time bucket helpers for time-ordered Global Secondary Indexes.
+
+Tables such as events and items are keyed for lookups by PRN, so "everything in a time window"
+cannot be answered by a key lookup.  Instead of scanning the table with a filter on the timestamp,
+the models carry a small *bucket* attribute derived from the timestamp (the UTC day, e.g.
+``2024-01-15``) which is the hash key of a GSI whose range key is the timestamp itself.
+
+A time window then maps to an ordered list of buckets, and each bucket is a single efficient
+``Query`` returning rows already sorted by time.  :func:`query_buckets` walks the buckets in
+order (ascending or descending), fills a page up to the paginator limit, and returns a composite
+cursor ``{"Bucket": ..., "Key": ...}`` so the next page resumes inside the right bucket.
+
+Wide windows are mostly empty buckets, and walking them one query at a time adds a round trip
+per empty day.  :func:`query_buckets_parallel` queries a window of buckets concurrently and
+merges them in bucket order, returning the same composite cursor.
+
+Examples:
+    >>> day_bucket(datetime(2024, 1, 15, 14, 30, tzinfo=timezone.utc))
+    '2024-01-15'
+
+    >>> day_buckets(datetime(2024, 1, 30, tzinfo=timezone.utc), datetime(2024, 2, 1, tzinfo=timezone.utc), sort_forward=False)
+    ['2024-02-01', '2024-01-31', '2024-01-30']
+"""
+
+from typing import Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+from pynamodb.expressions.condition import Condition
+from pynamodb.indexes import Index
+
+DAY_BUCKET_FORMAT = "%Y-%m-%d"
+"""strftime format of a day bucket value."""
+
+MAX_BUCKETS = 3660
+"""Largest number of day buckets a single time window may span (about 10 years)."""
+
+BUCKET_CURSOR_KEY = "Bucket"
+"""Composite cursor key holding the bucket to resume from."""
+
+KEY_CURSOR_KEY = "Key"
+"""Composite cursor key holding the DynamoDB LastEvaluatedKey within the bucket."""
+
+PARALLEL_BUCKETS = 8
+"""Number of buckets :func:`query_buckets_parallel` queries at the same time."""
+
+
+def day_bucket(value: datetime | date) -> str:
+    """Return the UTC day bucket for a timestamp.
+
+    Naive datetimes are assumed to be UTC, which is how ``UTCDateTimeAttribute`` stores them.
+
+    Args:
+        value (datetime | date): The timestamp
+
+    Returns:
+        str: The bucket in ``YYYY-MM-DD`` form
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        value = value.astimezone(timezone.utc)
+    return value.strftime(DAY_BUCKET_FORMAT)
+
+
+def day_buckets(earliest_time: datetime, latest_time: datetime, sort_forward: bool = True) -> List[str]:
+    """Return the day buckets covering a time window, in walk order.
+
+    Args:
+        earliest_time (datetime): Start of the window (inclusive)
+        latest_time (datetime): End of the window (inclusive)
+        sort_forward (bool): True for oldest bucket first, False for newest first
+
+    Returns:
+        list[str]: The buckets.  Empty if the window is inverted.
+
+    Raises:
+        ValueError: If the window spans more than ``MAX_BUCKETS`` days
+    """
+    first = datetime.strptime(day_bucket(earliest_time), DAY_BUCKET_FORMAT)
+    last = datetime.strptime(day_bucket(latest_time), DAY_BUCKET_FORMAT)
+
+    days = (last - first).days + 1
+    if days <= 0:
+        return []
+    if days > MAX_BUCKETS:
+        raise ValueError(f"Time window spans {days} days; the maximum is {MAX_BUCKETS}")
+
+    buckets = [(first + timedelta(days=i)).strftime(DAY_BUCKET_FORMAT) for i in range(days)]
+    if not sort_forward:
+        buckets.reverse()
+    return buckets
+
+
+def query_buckets(
+    index: Index,
+    buckets: List[str],
+    *,
+    limit: int,
+    cursor: Optional[dict] = None,
+    sort_forward: bool = True,
+    range_key_condition: Optional[Condition] = None,
+    filter_condition: Optional[Condition] = None,
+    page_size: Optional[int] = None,
+) -> Tuple[List[Any], Optional[dict]]:
+    """Query a bucketed GSI across several buckets and return one page of results.
+
+    Buckets are walked in the order given, so results are globally ordered when the buckets are
+    (see :func:`day_buckets`).  The walk stops as soon as ``limit`` rows have been collected.
+
+    Args:
+        index (Index): The client-specific GSI whose hash key is the bucket
+        buckets (list[str]): Buckets to walk, in order
+        limit (int): Maximum number of rows to return
+        cursor (dict, optional): Composite cursor returned by a previous call.  Cursors that are
+            not composite (e.g. from a previous scan-based listing) restart from the first bucket.
+        sort_forward (bool): Range key order within each bucket
+        range_key_condition (Condition, optional): Range key condition applied in every bucket
+        filter_condition (Condition, optional): Filter applied in every bucket
+        page_size (int, optional): DynamoDB page size for each query
+
+    Returns:
+        tuple[list, dict | None]: The rows and the composite cursor of the next page, or None
+        if the window is exhausted.
+    """
+    start_key = None
+    if isinstance(cursor, dict) and cursor.get(BUCKET_CURSOR_KEY) in buckets:
+        buckets = buckets[buckets.index(cursor[BUCKET_CURSOR_KEY]) :]
+        start_key = cursor.get(KEY_CURSOR_KEY)
+
+    data: List[Any] = []
+    for i, bucket in enumerate(buckets):
+        query_args: dict[str, Any] = {
+            "limit": limit - len(data),
+            "scan_index_forward": sort_forward,
+        }
+        if range_key_condition is not None:
+            query_args["range_key_condition"] = range_key_condition
+        if filter_condition is not None:
+            query_args["filter_condition"] = filter_condition
+        if page_size is not None:
+            query_args["page_size"] = page_size
+        if start_key:
+            query_args["last_evaluated_key"] = start_key
+            start_key = None
+
+        result = index.query(bucket, **query_args)
+        data.extend(result)
+
+        last_evaluated_key = getattr(result, "last_evaluated_key", None)
+        if last_evaluated_key:
+            # The page filled up inside this bucket
+            return data, {BUCKET_CURSOR_KEY: bucket, KEY_CURSOR_KEY: last_evaluated_key}
+
+        if len(data) >= limit:
+            # The page filled up exactly at the end of this bucket
+            if i + 1 < len(buckets):
+                return data, {BUCKET_CURSOR_KEY: buckets[i + 1]}
+            return data, None
+
+    return data, None
+
+
+def query_buckets_parallel(
+    index: Index,
+    buckets: List[str],
+    *,
+    limit: int,
+    cursor: Optional[dict] = None,
+    sort_forward: bool = True,
+    range_key_condition: Optional[Condition] = None,
+    filter_condition: Optional[Condition] = None,
+    page_size: Optional[int] = None,
+    max_workers: int = PARALLEL_BUCKETS,
+) -> Tuple[List[Any], Optional[dict]]:
+    """Query a bucketed GSI across several buckets in parallel and return one page of results.
+
+    Behaves like :func:`query_buckets` (same ordering, same composite cursor), but queries up to
+    ``max_workers`` buckets at a time.  Each bucket reads at most the rows still missing from the
+    page, so a window that fills early may read rows beyond the page from later buckets; that is
+    the price of not waiting on empty buckets one by one.
+
+    Args:
+        index (Index): The client-specific GSI whose hash key is the bucket
+        buckets (list[str]): Buckets to walk, in order
+        limit (int): Maximum number of rows to return
+        cursor (dict, optional): Composite cursor returned by a previous call
+        sort_forward (bool): Range key order within each bucket
+        range_key_condition (Condition, optional): Range key condition applied in every bucket
+        filter_condition (Condition, optional): Filter applied in every bucket
+        page_size (int, optional): DynamoDB page size for each query
+        max_workers (int): Number of buckets queried at the same time
+
+    Returns:
+        tuple[list, dict | None]: The rows and the composite cursor of the next page, or None
+        if the window is exhausted.
+    """
+    start_key = None
+    if isinstance(cursor, dict) and cursor.get(BUCKET_CURSOR_KEY) in buckets:
+        buckets = buckets[buckets.index(cursor[BUCKET_CURSOR_KEY]) :]
+        start_key = cursor.get(KEY_CURSOR_KEY)
+
+    def _query_bucket(bucket: str, remaining: int, last_evaluated_key: Optional[dict]) -> List[Tuple[Any, Optional[dict]]]:
+        query_args: dict[str, Any] = {
+            "limit": remaining,
+            "scan_index_forward": sort_forward,
+        }
+        if range_key_condition is not None:
+            query_args["range_key_condition"] = range_key_condition
+        if filter_condition is not None:
+            query_args["filter_condition"] = filter_condition
+        if page_size is not None:
+            query_args["page_size"] = page_size
+        if last_evaluated_key:
+            query_args["last_evaluated_key"] = last_evaluated_key
+
+        result = index.query(bucket, **query_args)
+        # pair every row with the key to resume after it (None once the bucket is exhausted)
+        return [(item, result.last_evaluated_key) for item in result]
+
+    data: List[Any] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(buckets)))) as executor:
+        for offset in range(0, len(buckets), max_workers):
+            window = buckets[offset : offset + max_workers]
+            remaining = limit - len(data)
+            futures = [
+                executor.submit(_query_bucket, bucket, remaining, start_key if offset == 0 and i == 0 else None)
+                for i, bucket in enumerate(window)
+            ]
+
+            for i, (bucket, future) in enumerate(zip(window, futures)):
+                for item, resume_key in future.result():
+                    data.append(item)
+                    if len(data) < limit:
+                        continue
+                    if resume_key:
+                        # The page filled up inside this bucket
+                        return data, {BUCKET_CURSOR_KEY: bucket, KEY_CURSOR_KEY: resume_key}
+                    # The page filled up exactly at the end of this bucket
+                    position = offset + i + 1
+                    if position < len(buckets):
+                        return data, {BUCKET_CURSOR_KEY: buckets[position]}
+                    return data, None
+
+    return data, None
@@ -0,0 +1,78 @@
+"""Small in-process caches for hot lookups.
+
+Lookups such as "client by OAuth client_id" are answered on every token request and change
+rarely.  :class:`TTLCache` keeps recent answers in memory for a short time.  It is bounded
+(least recently used entries are evicted first), thread safe, and the actions that modify
+the underlying records invalidate the affected keys, so the TTL only bounds staleness caused
+by writes from other processes.
+
+Examples:
+    >>> cache = TTLCache(maxsize=256, ttl=60)
+    >>> cache.set("client-id", record)
+    >>> cache.get("client-id")
+    record
+    >>> cache.invalidate("client-id")
+    >>> cache.get("client-id") is None
+    True
+"""
+
+from typing import Any, Callable, Hashable, Optional
+from collections import OrderedDict
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe, size-bounded cache whose entries expire after ``ttl`` seconds.
+
+    Args:
+        maxsize (int): Maximum number of entries
+        ttl (float): Seconds an entry stays valid
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget one entry."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """Forget every entry for which predicate(key, value) is true."""
+        with self._lock:
+            for key in [k for k, (_, v) in self._data.items() if predicate(k, v)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
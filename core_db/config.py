@@ -14,6 +14,10 @@ Where:
 - `scope`: Core automation scope (typically "core-automation")
 - `table-type`: Specific table type (e.g., "clients", "portfolios", "zones")
 
+Resolved names are cached per (model, client, automation scope).  Tables of models that are
+not built in are added with :func:`register_table`; :func:`refresh_table_names` drops the
+cache after other configuration changes.
+
 Examples:
     >>> # Client-agnostic table (clients registry)
     >>> get_table_name(ClientFactsModel)
@@ -31,7 +35,11 @@ Examples:
 
 from calendar import c
 from typing import Optional
+import os
+import secrets
+import threading
 import core_framework as util
+import core_logging as log
 from core_framework.constants import V_CORE_AUTOMATION
 
 
@@ -82,6 +90,140 @@ def get_region() -> str:
     return util.get_dynamodb_region() or "us-east-1"
 
 
+LEGACY_CURSORS_END = "1.4.0"
+"""Release that stops accepting legacy base64 JSON cursors and drops CORE_DB_ACCEPT_LEGACY_CURSORS."""
+
+_process_cursor_secret: bytes | None = None
+_process_cursor_secret_lock = threading.Lock()
+
+
+def get_cursor_secret() -> bytes:
+    """Get the key used to sign pagination cursors.
+
+    Cursors handed to API clients carry an HMAC so that edited or corrupted cursors are
+    rejected before they reach DynamoDB.  All processes serving the same API must share
+    the key, otherwise a cursor issued by one instance is rejected by another.
+
+    When CORE_DB_CURSOR_SECRET is not set, a random key is generated once per process and
+    a warning is logged.  Cursors then only work against the process that issued them, so
+    deployments with more than one instance (e.g. Lambda) must set CORE_DB_CURSOR_SECRET.
+
+    Returns:
+        bytes: The signing key
+
+    Environment Variables:
+        CORE_DB_CURSOR_SECRET: Cursor signing key, shared by every instance serving the API
+    """
+    secret = os.getenv("CORE_DB_CURSOR_SECRET")
+    if secret:
+        return secret.encode("utf-8")
+
+    global _process_cursor_secret
+    with _process_cursor_secret_lock:
+        if _process_cursor_secret is None:
+            _process_cursor_secret = secrets.token_bytes(32)
+            log.warning("CORE_DB_CURSOR_SECRET is not set; pagination cursors are signed with a random per-process key")
+        return _process_cursor_secret
+
+
+def accept_legacy_cursors() -> bool:
+    """Whether legacy base64 JSON cursors are accepted.
+
+    Legacy cursors are not signed, so accepting them lets API clients send any key to
+    DynamoDB.  Turn this on only while cursors issued before the upgrade are still in use.
+    The setting is removed in release :data:`LEGACY_CURSORS_END`.
+
+    Returns:
+        bool: True if CORE_DB_ACCEPT_LEGACY_CURSORS is set to true
+
+    Environment Variables:
+        CORE_DB_ACCEPT_LEGACY_CURSORS: "true" to accept legacy cursors.  Defaults to false.
+    """
+    return os.getenv("CORE_DB_ACCEPT_LEGACY_CURSORS", "false").lower() in ("true", "1", "yes", "on")
+
+
+TABLE_NAME_TEMPLATES: dict[str, str] = {
+    #
+    # Global tables
+    #
+    # OAuth Authorizations Table
+    "AuthorizationsModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-oauth",
+    "RateLimitsModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-oauth",
+    "OAuthTableModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-oauth",
+    "ForgotPasswordModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-oauth",
+    # Passkeys / WebAuthn Table
+    "PassKeysModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-passkeys",
+    # Client Facts is the base tenant registration table (no "client" prefix)
+    "ClientFactsModel": f"{{prefix}}core-{V_CORE_AUTOMATION}-clients",
+    #
+    # Tenant aware tables
+    #
+    # Profiles for user-defined configurations
+    "ProfileModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-profiles",
+    # Authorization audit events
+    "AuthAuditModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-auth-audit",
+    # AWS Account(s) and zone names
+    "ZoneFactsModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-zones",
+    # Portfolio BizApps / Deployment App targets
+    "PortfolioFactsModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-portfolios",
+    # The application zone selectors (App Registry)
+    "AppFactsModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-apps",
+    # Components and Items deployed to AWS
+    "ItemModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All the portfolio deployment items
+    "PortfolioModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All the app deployments items
+    "AppModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All branch deployment items
+    "BranchModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All build deployment items
+    "BuildModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All component deployment items
+    "ComponentModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-items",
+    # All the events that are generated during deployment
+    "EventModel": f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-events",
+}
+"""Table name template per model class name.  ``{prefix}`` is the automation scope and
+``{client}`` the client.  Add custom tables with :func:`register_table`."""
+
+_table_names: dict[tuple[str, str, str], str] = {}
+"""Resolved table names by (model class name, client, automation scope)."""
+
+
+def register_table(model: type | str, template: str) -> None:
+    """Register the table name of a model that is not built into core_db.
+
+    Args:
+        model (type | str): The model class, or its class name
+        template (str): Table name with optional ``{prefix}`` (automation scope) and
+            ``{client}`` placeholders
+
+    Raises:
+        ValueError: If the template has other placeholders
+
+    Examples:
+        >>> register_table(WidgetModel, "{prefix}{client}-core-automation-widgets")
+        >>> get_table_name(WidgetModel, client="acme")
+        'acme-core-automation-widgets'
+    """
+    try:
+        template.format(prefix="", client="")
+    except (KeyError, IndexError) as e:
+        raise ValueError(f"Table name template '{template}' may only use {{prefix}} and {{client}}") from e
+
+    TABLE_NAME_TEMPLATES[model if isinstance(model, str) else model.__name__] = template
+    refresh_table_names()
+
+
+def refresh_table_names() -> None:
+    """Forget resolved table names.
+
+    Call this after changing the table configuration at runtime.  Changes of the automation
+    scope are picked up without a refresh, because the scope is part of the cache key.
+    """
+    _table_names.clear()
+
+
 def table_map(client: str | None = None) -> dict:
 
     if not client:
@@ -89,47 +231,7 @@ def table_map(client: str | None = None) -> dict:
 
     prefix = util.get_automation_scope() or ""
 
-    return {
-        #
-        # Global tables
-        #
-        # OAuth Authorizations Table
-        "AuthorizationsModel": f"{prefix}core-{V_CORE_AUTOMATION}-oauth",
-        "RateLimitsModel": f"{prefix}core-{V_CORE_AUTOMATION}-oauth",
-        "OAuthTableModel": f"{prefix}core-{V_CORE_AUTOMATION}-oauth",
-        "ForgotPasswordModel": f"{prefix}core-{V_CORE_AUTOMATION}-oauth",
-        # Passkeys / WebAuthn Table
-        "PassKeysModel": f"{prefix}core-{V_CORE_AUTOMATION}-passkeys",
-        # Client Facts is the base tenant registration table (no "client" prefix)
-        "ClientFactsModel": f"{prefix}core-{V_CORE_AUTOMATION}-clients",
-        #
-        # Tenant aware tables
-        #
-        # Profiles for user-defined configurations
-        "ProfileModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-profiles",
-        # Authorization audit events
-        "AuthAuditModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-auth-audit",
-        # AWS Account(s) and zone names
-        "ZoneFactsModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-zones",
-        # Portfolio BizApps / Deployment App targets
-        "PortfolioFactsModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-portfolios",
-        # The application zone selectors (App Registry)
-        "AppFactsModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-apps",
-        # Components and Items deployed to AWS
-        "ItemModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All the portfolio deployment items
-        "PortfolioModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All the app deployments items
-        "AppModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All branch deployment items
-        "BranchModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All build deployment items
-        "BuildModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All component deployment items
-        "ComponentModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-items",
-        # All the events that are generated during deployment
-        "EventModel": f"{prefix}{client}-{V_CORE_AUTOMATION}-events",
-    }
+    return {name: template.format(prefix=prefix, client=client) for name, template in TABLE_NAME_TEMPLATES.items()}
 
 
 def get_table_name(model: type, client: str | None = None, default: Optional[str] | None = None) -> str:
@@ -209,14 +311,24 @@ def get_table_name(model: type, client: str | None = None, default: Optional[str
         Error: Table name not found for UnknownModel
     """
 
-    # The key of this table is the model class name
-    tables = table_map(client)
+    if not client:
+        client = "core"
+
+    prefix = util.get_automation_scope() or ""
+
+    key = (model.__name__, client, prefix)
+    table = _table_names.get(key)
+    if table is not None:
+        return table
 
-    # We may also want to first check if an environment variable is set
-    # and if so, use that value instead of the default
+    # The key of the template table is the model class name
+    template = TABLE_NAME_TEMPLATES.get(model.__name__)
+    if template is None:
+        if default is None:
+            raise ValueError(f"Table name not found for {model.__name__}")
+        return default
 
-    table = tables.get(model.__name__, default)
-    if table is None:
-        raise ValueError(f"Table name not found for {model.__name__}")
+    table = template.format(prefix=prefix, client=client)
+    _table_names[key] = table
 
     return table
@@ -0,0 +1,222 @@
+"""Total counts for paginated list actions.
+
+List actions return one page at a time, so ``Paginator.total_count`` normally holds the
+number of rows on the current page.  When the caller asks for ``with_total=True`` the list
+action also counts every matching row:
+
+    - Queries are counted with ``Select=COUNT`` queries, which return no items.
+    - Scans are counted with a parallel segmented scan that projects only the hash key.
+    - Bucketed (day-index) listings count every bucket with a ``Select=COUNT`` query in parallel.
+
+The count runs on a background thread while the page itself is being fetched
+(see :func:`start_count`), and results are cached for :data:`COUNT_CACHE_TTL` seconds per
+(client, table, operation, condition) so paging through a listing does not recount on every page.
+
+Examples:
+    >>> future = start_count(
+    ...     count_cache_key(client, model_class, "query", prn, range_key_condition),
+    ...     count_query,
+    ...     model_class,
+    ...     prn,
+    ...     range_key_condition=range_key_condition,
+    ... )
+    >>> results = model_class.query(prn, range_key_condition=range_key_condition, limit=10)
+    >>> paginator.total_count = resolve_count(future, len(data))
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+
+from pynamodb.expressions.condition import Condition
+from pynamodb.indexes import Index
+from pynamodb.models import Model
+
+import core_logging as log
+
+COUNT_CACHE_TTL = 30.0
+"""Seconds a computed total is reused for the same (client, table, operation, condition)."""
+
+COUNT_SCAN_SEGMENTS = 4
+"""Number of parallel segments used to count a scan."""
+
+COUNT_MAX_WORKERS = 8
+"""Largest number of concurrent count requests issued by a single count."""
+
+_count_cache: Dict[Tuple, Tuple[float, int]] = {}
+_count_cache_lock = threading.Lock()
+
+_count_executor = ThreadPoolExecutor(max_workers=COUNT_MAX_WORKERS, thread_name_prefix="core-db-count")
+
+
+def count_cache_key(client: str, model_class: type[Model], operation: str, *parts: Any) -> Tuple:
+    """Build the cache key of a count.
+
+    Conditions render with their values (e.g. ``Prn = {'S': 'prn:core'}``) so ``str()`` of each
+    part identifies the filter.
+
+    Args:
+        client (str): Client identifier
+        model_class (type[Model]): The client-specific model class
+        operation (str): Operation name, e.g. "scan", "query" or an index name
+        *parts: Hash keys, buckets and conditions that select the rows
+
+    Returns:
+        tuple: The cache key
+    """
+    return (client, model_class.Meta.table_name, operation, *(str(part) for part in parts))
+
+
+def clear_count_cache() -> None:
+    """Forget all cached counts."""
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+def _get_cached_count(key: Tuple) -> Optional[int]:
+    with _count_cache_lock:
+        entry = _count_cache.get(key)
+        if entry is None:
+            return None
+        expires, count = entry
+        if expires < time.monotonic():
+            del _count_cache[key]
+            return None
+        return count
+
+
+def _set_cached_count(key: Tuple, count: int) -> None:
+    with _count_cache_lock:
+        _count_cache[key] = (time.monotonic() + COUNT_CACHE_TTL, count)
+
+
+def count_query(
+    model_class: type[Model] | Index,
+    hash_key: Any,
+    *,
+    range_key_condition: Optional[Condition] = None,
+    filter_condition: Optional[Condition] = None,
+) -> int:
+    """Count the rows of a table or index query with ``Select=COUNT``.
+
+    Args:
+        model_class (type[Model] | Index): The client-specific model class, or one of its indexes
+        hash_key: The hash key value to query
+        range_key_condition (Condition, optional): Range key condition
+        filter_condition (Condition, optional): Filter condition
+
+    Returns:
+        int: The number of matching rows
+    """
+    return model_class.count(hash_key, range_key_condition=range_key_condition, filter_condition=filter_condition)
+
+
+def count_scan(
+    model_class: type[Model],
+    *,
+    filter_condition: Optional[Condition] = None,
+    total_segments: int = COUNT_SCAN_SEGMENTS,
+) -> int:
+    """Count the rows of a table with a parallel segmented scan.
+
+    Each segment projects only the hash key, so no item data is transferred.
+
+    Args:
+        model_class (type[Model]): The client-specific model class
+        filter_condition (Condition, optional): Filter condition
+        total_segments (int): Number of parallel segments
+
+    Returns:
+        int: The number of matching rows
+    """
+    hash_key_name = model_class._hash_key_attribute().attr_name
+
+    def _count_segment(segment: int) -> int:
+        result = model_class.scan(
+            filter_condition=filter_condition,
+            segment=segment,
+            total_segments=total_segments,
+            attributes_to_get=[hash_key_name],
+        )
+        return sum(1 for _ in result)
+
+    with ThreadPoolExecutor(max_workers=min(total_segments, COUNT_MAX_WORKERS)) as executor:
+        return sum(executor.map(_count_segment, range(total_segments)))
+
+
+def count_buckets(
+    index: Index,
+    buckets: List[str],
+    *,
+    range_key_condition: Optional[Condition] = None,
+    filter_condition: Optional[Condition] = None,
+) -> int:
+    """Count the rows of a bucketed index (see :mod:`core_db.buckets`) across several buckets.
+
+    Every bucket is counted with a ``Select=COUNT`` query, in parallel.
+
+    Args:
+        index (Index): The client-specific GSI whose hash key is the bucket
+        buckets (list[str]): Buckets to count
+        range_key_condition (Condition, optional): Range key condition applied in every bucket
+        filter_condition (Condition, optional): Filter applied in every bucket
+
+    Returns:
+        int: The number of matching rows
+    """
+    if not buckets:
+        return 0
+
+    def _count_bucket(bucket: str) -> int:
+        return count_query(index, bucket, range_key_condition=range_key_condition, filter_condition=filter_condition)
+
+    with ThreadPoolExecutor(max_workers=min(len(buckets), COUNT_MAX_WORKERS)) as executor:
+        return sum(executor.map(_count_bucket, buckets))
+
+
+def start_count(key: Tuple, count_fn: Callable[..., int], *args, **kwargs) -> "Future[int]":
+    """Start counting in the background, or return the cached count.
+
+    Args:
+        key (tuple): Cache key from :func:`count_cache_key`
+        count_fn (Callable): One of :func:`count_query`, :func:`count_scan` or :func:`count_buckets`
+        *args: Positional arguments for count_fn
+        **kwargs: Keyword arguments for count_fn
+
+    Returns:
+        Future[int]: The count
+    """
+    cached = _get_cached_count(key)
+    if cached is not None:
+        future: Future[int] = Future()
+        future.set_result(cached)
+        return future
+
+    def _count() -> int:
+        count = count_fn(*args, **kwargs)
+        _set_cached_count(key, count)
+        return count
+
+    return _count_executor.submit(_count)
+
+
+def resolve_count(future: Optional["Future[int]"], default: int) -> int:
+    """Wait for a count started by :func:`start_count`.
+
+    A failed count is logged and does not fail the listing; the default is returned instead.
+
+    Args:
+        future (Future[int] | None): The count, or None if no total was requested
+        default (int): Value to return when there is no count (normally the page size)
+
+    Returns:
+        int: The total count
+    """
+    if future is None:
+        return default
+    try:
+        return future.result()
+    except Exception as e:
+        log.warning("Failed to count items: %s", str(e))
+        return default
@@ -0,0 +1,299 @@
+"""Compact, signed pagination cursors.
+
+DynamoDB returns ``LastEvaluatedKey`` in AttributeValue form, e.g.
+``{"ParentPrn": {"S": "prn:core:api"}, "Prn": {"S": "prn:core:api:main"}, "CreatedAt": {"S": "2024-01-15T14:30:45.123456+0000"}}``.
+Base64-encoding that JSON produces long cursors, especially for GSI keys that carry both
+the table and the index keys.  This module packs such keys into a small binary form:
+
+    - Well-known key attribute names are written as a single byte.
+    - ``{"S": ...}`` / ``{"N": ...}`` values are written as a type tag and a length-prefixed string.
+    - Timestamps in the ``UTCDateTimeAttribute`` format are written as 8 bytes of epoch microseconds.
+    - Nested maps (e.g. the ``{"Bucket": ..., "Key": {...}}`` cursors of bucketed indexes) are packed recursively.
+    - The packed body is zlib-compressed when that makes it smaller.
+
+The result is signed with a truncated HMAC-SHA256 (see :func:`core_db.config.get_cursor_secret`)
+and encoded as URL-safe base64 without padding::
+
+    version (1) | flags (1) | body | mac (16)
+
+Legacy cursors (standard base64 of the JSON key) are not signed.  :func:`decode_cursor` accepts
+them only while CORE_DB_ACCEPT_LEGACY_CURSORS is on (see :func:`core_db.config.accept_legacy_cursors`),
+and logs each one.  Support ends in release 1.4.0.
+
+Examples:
+    >>> cursor = encode_cursor({"Prn": {"S": "prn:core:api"}, "Timestamp": {"S": "2024-01-15T14:30:45.123456+0000"}})
+    >>> decode_cursor(cursor)
+    {'Prn': {'S': 'prn:core:api'}, 'Timestamp': {'S': '2024-01-15T14:30:45.123456+0000'}}
+"""
+
+from typing import Any, Tuple
+from datetime import datetime, timezone
+import base64
+import hashlib
+import hmac
+import json
+import re
+import struct
+import zlib
+
+import core_logging as log
+
+from .config import accept_legacy_cursors, get_cursor_secret
+
+CURSOR_VERSION = 2
+"""First byte of every compact cursor.  Legacy JSON cursors start with '{'."""
+
+FLAG_COMPRESSED = 0x01
+
+MAC_SIZE = 16
+
+COMPRESS_THRESHOLD = 48
+"""Bodies shorter than this are never compressed."""
+
+KNOWN_NAMES = (
+    "Prn",
+    "ParentPrn",
+    "Timestamp",
+    "CreatedAt",
+    "UpdatedAt",
+    "EventDay",
+    "CreatedDay",
+    "StatusKey",
+    "PK",
+    "SK",
+    "Client",
+    "ClientId",
+    "Portfolio",
+    "App",
+    "Zone",
+    "UserId",
+    "ProfileName",
+    "Email",
+    "Code",
+    "KeyId",
+    "Bucket",
+    "Key",
+    "ActorUserId",
+    "ChangeType",
+    "RequestId",
+)
+"""Attribute names packed as a single byte.  Append only: the index is part of the format."""
+
+_NAME_INDEX = {name: i + 1 for i, name in enumerate(KNOWN_NAMES)}
+
+_UTC_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f+0000"
+_UTC_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+0000")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+TAG_MAP = b"M"
+TAG_STRING_VALUE = b"S"
+TAG_NUMBER_VALUE = b"N"
+TAG_DATETIME_VALUE = b"T"
+TAG_STRING = b"s"
+TAG_NONE = b"0"
+TAG_JSON = b"J"
+
+
+def _pack_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _unpack_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _pack_varint(len(raw)) + raw
+
+
+def _unpack_str(data: bytes, pos: int) -> Tuple[str, int]:
+    length, pos = _unpack_varint(data, pos)
+    end = pos + length
+    if end > len(data):
+        raise ValueError("Truncated cursor")
+    return data[pos:end].decode("utf-8"), end
+
+
+def _pack_name(name: str) -> bytes:
+    index = _NAME_INDEX.get(name)
+    if index is not None:
+        return _pack_varint(index)
+    return _pack_varint(0) + _pack_str(name)
+
+
+def _unpack_name(data: bytes, pos: int) -> Tuple[str, int]:
+    index, pos = _unpack_varint(data, pos)
+    if index == 0:
+        return _unpack_str(data, pos)
+    return KNOWN_NAMES[index - 1], pos
+
+
+def _pack_datetime(value: str) -> bytes | None:
+    """Pack a UTCDateTimeAttribute string as epoch microseconds, if it round-trips exactly."""
+    if not _UTC_DATETIME_RE.fullmatch(value):
+        return None
+    try:
+        dt = datetime.strptime(value, _UTC_DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    delta = dt - _EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack(">q", micros)
+
+
+def _unpack_datetime(data: bytes, pos: int) -> Tuple[str, int]:
+    (micros,) = struct.unpack_from(">q", data, pos)
+    seconds, micros = divmod(micros, 1_000_000)
+    dt = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=micros)
+    return dt.strftime(_UTC_DATETIME_FORMAT), pos + 8
+
+
+def _pack_value(value: Any) -> bytes:
+    if value is None:
+        return TAG_NONE
+    if isinstance(value, str):
+        return TAG_STRING + _pack_str(value)
+    if isinstance(value, dict):
+        if len(value) == 1:
+            ((attr_type, attr_value),) = value.items()
+            if attr_type == "S" and isinstance(attr_value, str):
+                packed = _pack_datetime(attr_value)
+                if packed is not None:
+                    return TAG_DATETIME_VALUE + packed
+                return TAG_STRING_VALUE + _pack_str(attr_value)
+            if attr_type == "N" and isinstance(attr_value, str):
+                return TAG_NUMBER_VALUE + _pack_str(attr_value)
+        if all(isinstance(k, str) for k in value):
+            out = bytearray(TAG_MAP + _pack_varint(len(value)))
+            for name, item in value.items():
+                out += _pack_name(name)
+                out += _pack_value(item)
+            return bytes(out)
+    return TAG_JSON + _pack_str(json.dumps(value, separators=(",", ":")))
+
+
+def _unpack_value(data: bytes, pos: int) -> Tuple[Any, int]:
+    tag = data[pos : pos + 1]
+    pos += 1
+    if tag == TAG_NONE:
+        return None, pos
+    if tag == TAG_STRING:
+        return _unpack_str(data, pos)
+    if tag == TAG_STRING_VALUE:
+        value, pos = _unpack_str(data, pos)
+        return {"S": value}, pos
+    if tag == TAG_NUMBER_VALUE:
+        value, pos = _unpack_str(data, pos)
+        return {"N": value}, pos
+    if tag == TAG_DATETIME_VALUE:
+        value, pos = _unpack_datetime(data, pos)
+        return {"S": value}, pos
+    if tag == TAG_MAP:
+        count, pos = _unpack_varint(data, pos)
+        result = {}
+        for _ in range(count):
+            name, pos = _unpack_name(data, pos)
+            result[name], pos = _unpack_value(data, pos)
+        return result, pos
+    if tag == TAG_JSON:
+        value, pos = _unpack_str(data, pos)
+        return json.loads(value), pos
+    raise ValueError("Unknown cursor value tag")
+
+
+def _sign(message: bytes) -> bytes:
+    return hmac.new(get_cursor_secret(), message, hashlib.sha256).digest()[:MAC_SIZE]
+
+
+def encode_cursor(key: dict) -> str:
+    """Encode a LastEvaluatedKey (or composite cursor dict) as a compact signed cursor.
+
+    Args:
+        key (dict): The key to encode
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    body = _pack_value(key)
+    flags = 0
+    if len(body) >= COMPRESS_THRESHOLD:
+        compressed = zlib.compress(body, 9)
+        if len(compressed) < len(body):
+            body = compressed
+            flags |= FLAG_COMPRESSED
+
+    message = bytes((CURSOR_VERSION, flags)) + body
+    return base64.urlsafe_b64encode(message + _sign(message)).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict | None:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Legacy base64 JSON cursors are decoded only while legacy cursors are accepted (see
+    :func:`core_db.config.accept_legacy_cursors`).
+
+    Args:
+        cursor (str): The cursor string
+
+    Returns:
+        dict | None: The decoded key.  None for an empty cursor, or, while legacy cursors are
+        accepted, for a cursor that is not valid legacy JSON either (legacy behaviour).
+
+    Raises:
+        ValueError: If the signature of a compact cursor does not match, its body is
+            malformed, or the cursor is not a compact cursor and legacy cursors are not accepted.
+    """
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (ValueError, TypeError):
+        raw = b""
+
+    if raw[:1] == bytes((CURSOR_VERSION,)):
+        if len(raw) < 2 + MAC_SIZE:
+            raise ValueError("Invalid pagination cursor")
+        message, mac = raw[:-MAC_SIZE], raw[-MAC_SIZE:]
+        if not hmac.compare_digest(mac, _sign(message)):
+            raise ValueError("Invalid pagination cursor")
+        flags, body = message[1], message[2:]
+        try:
+            if flags & FLAG_COMPRESSED:
+                body = zlib.decompress(body)
+            value, _ = _unpack_value(body, 0)
+        except (ValueError, IndexError, struct.error, zlib.error) as e:
+            raise ValueError("Invalid pagination cursor") from e
+        if not isinstance(value, dict):
+            raise ValueError("Invalid pagination cursor")
+        return value
+
+    if not accept_legacy_cursors():
+        raise ValueError("Invalid pagination cursor")
+
+    # Legacy: standard base64 of json.dumps(key)
+    log.warning("Accepted an unsigned legacy pagination cursor", details={"cursor": cursor})
+    try:
+        decoded = base64.b64decode(cursor).decode(encoding="utf-8")
+        # Don't use my parser.  My parser converts date string to datetime, which is not what we want here.
+        value = json.loads(decoded)
+        return value if isinstance(value, dict) else None
+    except (ValueError, TypeError):
+        return None
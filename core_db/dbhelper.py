@@ -15,7 +15,9 @@ Functions:
 Action Routing:
     The module includes an action routing dictionary that maps action prefixes to their
     corresponding TableActions implementation classes. This enables dynamic routing
-    of database operations based on the item type or table scope.
+    of database operations based on the item type or table scope.  Classes are imported
+    on first use, so importing this module does not load every item, event, registry
+    and facter module.
 
 Examples:
     >>> # Update status of a build
@@ -40,12 +42,10 @@ Examples:
     ... )
 """
 
-from typing import Any, ChainMap
+from typing import TYPE_CHECKING, Any, ChainMap, Dict, Iterator, Mapping
 
 import core_logging as log
 
-from core_framework.models import DeploymentDetails
-
 from core_framework.constants import (
     SCOPE_PORTFOLIO,
     SCOPE_APP,
@@ -55,25 +55,14 @@ from core_framework.constants import (
 )
 
 from .actions import TableActions
+from .exceptions import NotFoundException, ConflictException
+from .lazy import resolve
 
-from .item.portfolio.actions import PortfolioActions
-from .item.app.actions import AppActions
-from .item.branch.actions import BranchActions
-from .item.build.actions import BuildActions
-from .item.component.actions import ComponentActions
-from .item.models import ItemModelRecord
-
-from .event.actions import EventActions
-from .event.models import EventItem
-
-from .registry.client.actions import ClientActions as RegClientActions
-from .registry.portfolio.actions import PortfolioActions as RegPortfolioActions
-from .registry.app.actions import AppActions as RegAppActions
-from .registry.zone.actions import ZoneActions as RegZoneActions
-
-from .facter.actions import FactsActions
+if TYPE_CHECKING:
+    from core_framework.models import DeploymentDetails
 
-from .exceptions import NotFoundException, ConflictException
+    from .event.models import EventItem
+    from .item.models import ItemModelRecord
 
 PRN = "prn"
 STATUS = "status"
@@ -84,31 +73,65 @@ MESSAGE = "message"
 # the key to this dictionary is an "action prefix name"
 # Actions will come n as "prefix:action" and the prefix will be used to route the action
 # to the correct class
-TableActionType = dict[str, TableActions | Any]
-
-actions_routes: TableActionType = {
-    # Old Names
-    "portfolio": PortfolioActions,
-    "app": AppActions,
-    "branch": BranchActions,
-    "build": BuildActions,
-    "component": ComponentActions,
-    # New Names
-    "item:portfolio": PortfolioActions,
-    "item:app": AppActions,
-    "item:branch": BranchActions,
-    "item:build": BuildActions,
-    "item:component": ComponentActions,
-    # Events and Status
-    "event": EventActions,
-    # Facts.  Think of Facts as a DB "View" on the registry
-    "facts": FactsActions,
-    # Registry
-    "registry:client": RegClientActions,
-    "registry:portfolio": RegPortfolioActions,
-    "registry:app": RegAppActions,
-    "registry:zone": RegZoneActions,
-}
+TableActionType = Mapping[str, TableActions | Any]
+
+
+class ActionRoutes(Mapping):
+    """Read-only mapping of action prefix to TableActions class.
+
+    Values are given as ``"module:ClassName"`` (relative to ``core_db``) and imported the
+    first time the route is looked up.
+
+    Args:
+        routes (dict[str, str]): Action prefix -> ``"module:ClassName"``
+    """
+
+    def __init__(self, routes: Dict[str, str]):
+        self._routes = routes
+        self._resolved: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        klazz = self._resolved.get(key)
+        if klazz is None:
+            klazz = resolve(self._routes[key], __package__)
+            self._resolved[key] = klazz
+        return klazz
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._routes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._routes)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+
+actions_routes: TableActionType = ActionRoutes(
+    {
+        # Old Names
+        "portfolio": ".item.portfolio.actions:PortfolioActions",
+        "app": ".item.app.actions:AppActions",
+        "branch": ".item.branch.actions:BranchActions",
+        "build": ".item.build.actions:BuildActions",
+        "component": ".item.component.actions:ComponentActions",
+        # New Names
+        "item:portfolio": ".item.portfolio.actions:PortfolioActions",
+        "item:app": ".item.app.actions:AppActions",
+        "item:branch": ".item.branch.actions:BranchActions",
+        "item:build": ".item.build.actions:BuildActions",
+        "item:component": ".item.component.actions:ComponentActions",
+        # Events and Status
+        "event": ".event.actions:EventActions",
+        # Facts.  Think of Facts as a DB "View" on the registry
+        "facts": ".facter.actions:FactsActions",
+        # Registry
+        "registry:client": ".registry.client.actions:ClientActions",
+        "registry:portfolio": ".registry.portfolio.actions:PortfolioActions",
+        "registry:app": ".registry.app.actions:AppActions",
+        "registry:zone": ".registry.zone.actions:ZoneActions",
+    }
+)
 """A dictionary that maps the action prefix to the class that will handle the action.
 
 Values are classes that implement the TableActions interface for different table types:
@@ -137,7 +160,7 @@ This name, concatenated with list, get, create, update, delete, will be used to
 the action to the correct class.
 
 Examples:
-    >>> # Portfolio operations
+    >>> # Portfolio operations (the class is imported on first lookup)
     >>> actions_routes["portfolio"].list()  # PortfolioActions.list()
     >>> actions_routes["portfolio"].get()   # PortfolioActions.get()
     
@@ -155,19 +178,23 @@ Note:
 
 def update_status(
     scope: str,
-    deployment_details: DeploymentDetails,
+    deployment_details: "DeploymentDetails",
     *,
     status: str | None = None,
     message: str | None = None,
     details: dict | None = None,
 ) -> None:
-    """Updates the status of a PRN in the database.  If it doesn't throw an expection, it worked."""
+    """Updates the status of a PRN in the database.  If it doesn't throw an expection, it worked.
+
+    Build status changes are also rolled up into the LatestBuild summary of the parent branch
+    (see BranchActions.update_latest_build).
+    """
 
     __api_put_event(scope, deployment_details, status=status, message=message, details=details)
     __api_update_status(scope, deployment_details, status=status, message=message)
 
 
-def update_item(scope: str, deployment_details: DeploymentDetails, metadata: dict | None = None, **kwargs) -> ItemModelRecord:
+def update_item(scope: str, deployment_details: "DeploymentDetails", metadata: dict | None = None, **kwargs) -> "ItemModelRecord":
     """Add or update an item in the database.
 
     This function updates an existing item or creates a new one if it doesn't exist.
@@ -229,7 +256,7 @@ def update_item(scope: str, deployment_details: DeploymentDetails, metadata: dic
         raise
 
 
-def __get_prn_and_name(scope: str, deployment_details: DeploymentDetails) -> tuple[str, str]:
+def __get_prn_and_name(scope: str, deployment_details: "DeploymentDetails") -> tuple[str, str]:
     """Helper to get the PRN and name from the deployment details based on scope."""
     if scope == SCOPE_PORTFOLIO:
         return deployment_details.get_portfolio_prn(), deployment_details.portfolio
@@ -246,8 +273,8 @@ def __get_prn_and_name(scope: str, deployment_details: DeploymentDetails) -> tup
 
 
 def register_item(
-    scope: str, deployment_details: DeploymentDetails, *, status: str | None = None, component_type: str | None = None, **kwargs
-) -> ItemModelRecord | None:
+    scope: str, deployment_details: "DeploymentDetails", *, status: str | None = None, component_type: str | None = None, **kwargs
+) -> "ItemModelRecord | None":
     """Creates (Or Updates) an item in the database.
 
     This function registers a new deployment item based on the PRN scope. It automatically
@@ -331,8 +358,8 @@ def register_item(
 
 
 def __api_update_status(
-    scope, deployment_details: DeploymentDetails, *, status: str | None, message: str | None = None, **kwargs
-) -> ItemModelRecord:
+    scope, deployment_details: "DeploymentDetails", *, status: str | None, message: str | None = None, **kwargs
+) -> "ItemModelRecord":
     """Internal helper to update the status of an item via the API.
 
     This is a private function used internally by update_status() to handle the
@@ -385,8 +412,8 @@ def __api_update_status(
 
 
 def __api_put_event(
-    scope: str, deployment_details: DeploymentDetails, status: str, message: str | None = None, details: dict | None = None
-) -> EventItem | None:
+    scope: str, deployment_details: "DeploymentDetails", status: str, message: str | None = None, details: dict | None = None
+) -> "EventItem | None":
     """Internal helper to create a new event in the database via the API.
 
     This is a private function used internally by update_status() to create
@@ -419,7 +446,7 @@ def __api_put_event(
         if message:
             data["message"] = message
 
-        return EventActions.create(client=client, **data)
+        return actions_routes["event"].create(client=client, **data)
 
     except Exception:
         log.error(f"Failed to create event '{prn}'")
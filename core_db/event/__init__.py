@@ -177,7 +177,16 @@ Note:
     ensure complete traceability and debugging capability.
 """
 
-from .models import EventItem, EventModel, EventModelFactory
-from .actions import EventActions
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EventItem": ".models",
+        "EventModel": ".models",
+        "EventModelFactory": ".models",
+        "EventActions": ".actions",
+    },
+)
 
 __all__ = ["EventItem", "EventModel", "EventActions", "EventModelFactory"]
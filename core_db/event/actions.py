@@ -39,9 +39,12 @@ import core_framework as util
 from core_framework.time_utils import make_default_time
 
 from ..actions import TableActions
-from ..models import Paginator
+from ..cache import TTLCache
+from ..models import Paginator, TableFactory, TABLE_STATUS_TTL
+from ..buckets import BUCKET_CURSOR_KEY, day_bucket, day_buckets, query_buckets
+from ..counts import count_buckets, count_cache_key, count_query, count_scan, resolve_count, start_count
 
-from .models import Any, EventItem
+from .models import Any, EventItem, EventModel
 
 
 from ..exceptions import (
@@ -51,6 +54,11 @@ from ..exceptions import (
     UnknownException,  # http 500
 )
 
+EVENT_DAY_BACKFILL_TAG = "core-db:event-day-backfill"
+"""Table tag set by :meth:`EventActions.backfill_event_days` once every event has an EventDay."""
+
+_event_days_backfilled = TTLCache(maxsize=1024, ttl=TABLE_STATUS_TTL)
+
 
 class EventActions(TableActions):
     """Implements CRUD operations for the Event table using the PynamoDB model.
@@ -361,7 +369,9 @@ class EventActions(TableActions):
 
         Performance Notes:
             - Uses DynamoDB Query operation when PRN is specified (efficient)
-            - Uses DynamoDB Scan operation when PRN is not specified (less efficient)
+            - Uses the event-day-index (one Query per UTC day, newest first when sort_forward
+              is False) when PRN is not specified but earliest_time is
+            - Uses DynamoDB Scan operation when neither PRN nor earliest_time is specified (less efficient)
             - Time range filtering applied as conditions
             - Pagination tokens allow efficient continuation of large result sets
             - Sort order affects query performance and pagination behavior
@@ -432,6 +442,16 @@ class EventActions(TableActions):
 
         # Execute query
         try:
+            count = None
+            if paginator.with_total:
+                count = start_count(
+                    count_cache_key(client, model_class, "query", prn, range_key_condition),
+                    count_query,
+                    model_class,
+                    prn,
+                    range_key_condition=range_key_condition,
+                )
+
             results = model_class.query(prn, **query_kwargs)
 
             # Convert results to EventItem instances
@@ -439,7 +459,7 @@ class EventActions(TableActions):
 
             # Update paginator with results metadata
             paginator.last_evaluated_key = getattr(results, "last_evaluated_key", None)
-            paginator.total_count = len(data)
+            paginator.total_count = resolve_count(count, len(data))
 
             log.info("Retrieved %d events for PRN: %s", len(data), prn)
 
@@ -454,15 +474,26 @@ class EventActions(TableActions):
 
     @classmethod
     def _list_all_events(cls, **kwargs) -> Tuple[List[EventItem], Paginator]:  # noqa: C901
-        """Scan all events for client with pagination."""
+        """Scan all events for client with pagination.
+
+        A bounded time window (earliest_time given) is served by the event-day-index
+        instead of a scan, see :meth:`_list_by_event_day`, once :meth:`backfill_event_days`
+        has recorded that every event has an EventDay.  Until then the window is a filtered
+        scan, so events written before the index existed are still returned.
+        """
         client = kwargs.get("client") or util.get_client()
         if not client:
             raise BadRequestException("Client identifier is required for event listing.")
 
-        log.debug("Scanning all events for client: %s", client)
-
         paginator = Paginator(**kwargs)
 
+        # a scan cursor issued before the backfill finished is continued as a scan
+        cursor = paginator.last_evaluated_key
+        if paginator.earliest_time and (not cursor or BUCKET_CURSOR_KEY in cursor) and cls.event_days_backfilled(client):
+            return cls._list_by_event_day(client=client, paginator=paginator)
+
+        log.debug("Scanning all events for client: %s", client)
+
         model_class = EventItem.model_class(client)
 
         # Build filter conditions for scan
@@ -493,6 +524,16 @@ class EventActions(TableActions):
         if paginator.cursor:
             scan_kwargs["last_evaluated_key"] = paginator.last_evaluated_key
 
+        count = None
+        if paginator.with_total:
+            filter_condition = scan_kwargs.get("filter_condition")
+            count = start_count(
+                count_cache_key(client, model_class, "scan", filter_condition),
+                count_scan,
+                model_class,
+                filter_condition=filter_condition,
+            )
+
         # Execute scan
         results = model_class.scan(**scan_kwargs)
 
@@ -508,9 +549,173 @@ class EventActions(TableActions):
 
         # Update paginator with results metadata
         paginator.last_evaluated_key = getattr(results, "last_evaluated_key", None)
+        if count is not None:
+            paginator.total_count = resolve_count(count, len(data))
+
+        return data, paginator
+
+    @classmethod
+    def _list_by_event_day(cls, *, client: str, paginator: Paginator) -> Tuple[List[EventItem], Paginator]:
+        """List events across all PRNs in a time window using the event-day-index.
+
+        The window is split into UTC day buckets which are queried in order, so results are
+        truly time-ordered (descending when ``sort_forward`` is False) and each page reads only
+        the rows it returns.  The cursor records the bucket and key to resume from.
+
+        Events written before the index existed have no EventDay, so this is only used once
+        :meth:`backfill_event_days` has completed (see :meth:`event_days_backfilled`).
+
+        Args:
+            client (str): Client identifier for table access
+            paginator (Paginator): Pagination options.  earliest_time is required;
+                latest_time defaults to now.
+
+        Returns:
+            tuple[list[EventItem], Paginator]: The events and the paginator for the next page
+        """
+        earliest_time = paginator.earliest_time
+        latest_time = paginator.latest_time or make_default_time()
+        sort_forward = paginator.sort_forward is not False
+
+        log.debug("Querying events for client %s from %s to %s", client, earliest_time, latest_time)
+
+        model_class = EventItem.model_class(client)
+
+        try:
+            buckets = day_buckets(earliest_time, latest_time, sort_forward=sort_forward)
+        except ValueError as e:
+            raise BadRequestException(str(e)) from e
+
+        range_key_condition = model_class.timestamp.between(earliest_time, latest_time)
+
+        count = None
+        if paginator.with_total:
+            count = start_count(
+                count_cache_key(client, model_class, "event_day_index", range_key_condition),
+                count_buckets,
+                model_class.event_day_index,
+                buckets,
+                range_key_condition=range_key_condition,
+            )
+
+        results, next_cursor = query_buckets(
+            model_class.event_day_index,
+            buckets,
+            limit=paginator.limit,
+            cursor=paginator.last_evaluated_key,
+            sort_forward=sort_forward,
+            range_key_condition=range_key_condition,
+            page_size=paginator.page_size,
+        )
+
+        data: List[EventItem] = []
+        for item in results:
+            try:
+                data.append(EventItem.from_model(item))
+            except Exception as e:
+                log.warning("Failed to convert event item: %s", str(e))
+
+        paginator.cursor = None
+        paginator.last_evaluated_key = next_cursor
+        paginator.total_count = resolve_count(count, len(data))
 
         return data, paginator
 
+    @classmethod
+    def backfill_event_days(cls, *, client: str, **kwargs) -> int:
+        """Set the EventDay bucket on events written before the event-day-index existed.
+
+        Scans the table for events without an EventDay and sets it from the timestamp.
+        Safe to run repeatedly; events that already have a bucket are skipped.  When the
+        scan completes, the table is tagged with :data:`EVENT_DAY_BACKFILL_TAG` and time
+        window listings switch from scanning to the event-day-index.
+
+        Args:
+            client (str): Client identifier for table access
+
+        Returns:
+            int: Number of events updated
+
+        Raises:
+            BadRequestException: If client identifier is missing.
+            UnknownException: If the scan or an update fails.
+        """
+        if not client:
+            raise BadRequestException("Client identifier is required for event backfill.")
+
+        model_class = EventItem.model_class(client)
+
+        updated = 0
+        try:
+            for item in model_class.scan(filter_condition=model_class.event_day.does_not_exist()):
+                item.update(actions=[model_class.event_day.set(day_bucket(item.timestamp))])
+                updated += 1
+        except (ScanError, UpdateError) as e:
+            log.error("Failed to backfill event days: %s", str(e))
+            raise UnknownException(f"Failed to backfill event days: {str(e)}") from e
+
+        try:
+            model_class._get_connection().connection.client.tag_resource(
+                ResourceArn=cls._table_arn(client),
+                Tags=[{"Key": EVENT_DAY_BACKFILL_TAG, "Value": make_default_time().isoformat()}],
+            )
+        except Exception as e:
+            log.error("Failed to record the event day backfill: %s", str(e))
+            raise UnknownException(f"Failed to record the event day backfill: {str(e)}") from e
+
+        _event_days_backfilled.set(model_class.Meta.table_name, True)
+
+        log.info("Backfilled EventDay on %d events for client %s", updated, client)
+
+        return updated
+
+    @classmethod
+    def event_days_backfilled(cls, client: str) -> bool:
+        """Whether :meth:`backfill_event_days` has completed on the client's events table.
+
+        Reads the table tags, cached for ``TABLE_STATUS_TTL`` seconds.  If the tags cannot be
+        read, the backfill is treated as not done, so listings scan instead of missing events.
+
+        Args:
+            client (str): Client identifier for table access
+
+        Returns:
+            bool: True if the table carries :data:`EVENT_DAY_BACKFILL_TAG`
+        """
+        model_class = EventItem.model_class(client)
+        table_name = model_class.Meta.table_name
+
+        backfilled = _event_days_backfilled.get(table_name)
+        if backfilled is not None:
+            return backfilled
+
+        try:
+            botocore_client = model_class._get_connection().connection.client
+            arn = cls._table_arn(client)
+            backfilled = False
+            args = {"ResourceArn": arn}
+            while True:
+                response = botocore_client.list_tags_of_resource(**args)
+                if any(tag.get("Key") == EVENT_DAY_BACKFILL_TAG for tag in response.get("Tags", [])):
+                    backfilled = True
+                    break
+                if not response.get("NextToken"):
+                    break
+                args["NextToken"] = response["NextToken"]
+        except Exception as e:
+            log.warning("Cannot read the tags of %s, listing events by scan: %s", table_name, str(e))
+            backfilled = False
+
+        _event_days_backfilled.set(table_name, backfilled)
+        return backfilled
+
+    @classmethod
+    def _table_arn(cls, client: str) -> str:
+        description = TableFactory.describe(EventModel, client)
+        if description is None:
+            raise NotFoundException(f"Events table for client {client} does not exist")
+        return description["TableArn"]
+
     @classmethod
     def _update(cls, remove_none: bool, client: str, record: EventItem | None = None, **kwargs) -> EventItem:  # noqa: C901
         """Update an existing event in the database with Action statements.
@@ -7,6 +7,7 @@ import dateutil
 from pydantic import Field, field_validator, model_validator
 
 from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute, MapAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 
 
 import core_logging as log
@@ -21,6 +22,7 @@ from core_framework.constants import (
 from core_framework.time_utils import make_default_time
 
 from ..models import DatabaseTable, TableFactory, DatabaseRecord
+from ..buckets import day_bucket
 
 
 def convert_level_name(value: Union[int, str]) -> str:
@@ -45,6 +47,25 @@ def convert_level_name(value: Union[int, str]) -> str:
     return value
 
 
+class EventDayIndex(GlobalSecondaryIndex):
+    """Global Secondary Index for listing events across all PRNs in time order.
+
+    Events are bucketed by UTC day so a time window becomes one query per day
+    instead of a filtered scan of the whole table.
+
+    Attributes:
+        event_day (str): UTC day of the event timestamp, "YYYY-MM-DD" (hash key)
+        timestamp (datetime): Timestamp of the event (range key)
+    """
+
+    class Meta:
+        index_name = "event-day-index"
+        projection = AllProjection()
+
+    event_day = UnicodeAttribute(hash_key=True, attr_name="EventDay")
+    timestamp = UTCDateTimeAttribute(range_key=True, attr_name="Timestamp")
+
+
 class EventModel(DatabaseTable):
     """DynamoDB model for storing event records during deployment operations.
 
@@ -62,6 +83,9 @@ class EventModel(DatabaseTable):
         status (str, optional): The status name. Common values: "ok", "error", "running", "pending"
         message (str, optional): Event message details providing context about the deployment event
         details (dict, optional): Additional detailed information about the event (e.g., stack outputs, error details, metadata)
+        event_day (str, optional): UTC day bucket of the timestamp ("YYYY-MM-DD"), the hash key of the event_day_index.
+            Set automatically when the event is written.  Events written before the index existed do not have it
+            until ``EventActions.backfill_event_days`` is run.
 
     Note:
         Events provide deployment audit trail and status tracking capabilities.
@@ -125,6 +149,12 @@ class EventModel(DatabaseTable):
     message = UnicodeAttribute(null=True, attr_name="Message")
     details = MapAttribute(null=True, attr_name="Details")
 
+    # Time bucket for the global event feed
+    event_day = UnicodeAttribute(null=True, attr_name="EventDay")
+
+    # Indexes
+    event_day_index = EventDayIndex()
+
     def __repr__(self) -> str:
         """Return string representation of the EventModel.
 
@@ -398,7 +428,9 @@ class EventItem(DatabaseRecord):
             >>> db_event = event.to_model("acme")
         """
         model_class = EventModelFactory.get_model(client)
-        return model_class(**self.model_dump(by_alias=False, exclude_none=True))
+        model = model_class(**self.model_dump(by_alias=False, exclude_none=True))
+        model.event_day = day_bucket(model.timestamp)
+        return model
 
     @classmethod
     def get_item_type(cls, prn: str) -> str:
@@ -220,13 +220,18 @@ Note:
     available for all deployment and provisioning operations across the platform.
 """
 
-from .facter import (
-    get_facts,
-    get_client_facts,
-    get_app_facts,
-    get_portfolio_facts,
-    get_zone_facts,
-    get_zone_facts_by_account_id,
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "get_facts": ".facter",
+        "get_client_facts": ".facter",
+        "get_app_facts": ".facter",
+        "get_portfolio_facts": ".facter",
+        "get_zone_facts": ".facter",
+        "get_zone_facts_by_account_id": ".facter",
+    },
 )
 
 __all__ = [
@@ -243,14 +243,19 @@ Note:
     administrative operations.
 """
 
-from .models import ItemModel
-
-from .portfolio.models import PortfolioModel
-from .app.models import AppModel
-from .branch.models import BranchModel
-from .build.models import BuildModel
-from .component.models import ComponentModel
-
-from .actions import ItemTableActions as ItemActions
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ItemModel": ".models",
+        "PortfolioModel": ".portfolio.models",
+        "AppModel": ".app.models",
+        "BranchModel": ".branch.models",
+        "BuildModel": ".build.models",
+        "ComponentModel": ".component.models",
+        "ItemActions": ".actions:ItemTableActions",
+    },
+)
 
 __all__ = ["ItemModel", "PortfolioModel", "AppModel", "BranchModel", "BuildModel", "ComponentModel", "ItemActions"]
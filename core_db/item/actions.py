@@ -34,6 +34,7 @@ from datetime import datetime
 import core_logging as log
 
 from core_framework.time_utils import make_default_time
+from core_framework.constants import SCOPE_BRANCH, SCOPE_BUILD, SCOPE_COMPONENT
 
 from pynamodb.expressions.update import Action
 from pynamodb.exceptions import (
@@ -47,8 +48,10 @@ from pynamodb.exceptions import (
 )
 from ..actions import TableActions
 
-from ..models import Paginator
-from .models import ItemModel, ItemModelRecordType
+from ..models import Paginator, TableFactory
+from ..buckets import day_bucket, day_buckets, query_buckets
+from ..counts import count_buckets, count_cache_key, count_query, count_scan, resolve_count, start_count
+from .models import ItemModel, ItemModelRecordType, get_status_key
 
 
 from ..exceptions import (
@@ -97,6 +100,12 @@ class ItemTableActions(TableActions):
                 record = record_type(**kwargs)
 
             item: ItemModel = record.to_model(client)
+            if item.created_at is None:
+                item.created_at = make_default_time()
+            item.created_day = day_bucket(item.created_at)
+            status = getattr(item, "status", None)
+            if status:
+                item.status_key = get_status_key(item.item_type, status)
             item.save(type(item).prn.does_not_exist())
 
             return record
@@ -261,37 +270,45 @@ class ItemTableActions(TableActions):
         latest_time: datetime | None = None,
         **kwargs,
     ) -> Tuple[List[ItemModelRecordType], Paginator]:
-        """List all items."""
+        """List all items.
+
+        When earliest_time is given the created-day-index is queried instead of scanning
+        the table, see :meth:`_list_by_created_day`.
+        """
 
         try:
             paginator = Paginator(**kwargs)
         except ValueError as e:
             raise BadRequestException(f"Invalid item data: {e}")
 
+        if earliest_time:
+            return cls._list_by_created_day(
+                record_type, client=client, paginator=paginator, earliest_time=earliest_time, latest_time=latest_time
+            )
+
         scan_args = paginator.get_scan_args()
 
         model_class = record_type.model_class(client)
 
-        if earliest_time and latest_time:
-            condition = model_class.created_at.between(earliest_time, latest_time)
-        elif earliest_time:
-            condition = model_class.created_at >= earliest_time
-        elif latest_time:
-            condition = model_class.created_at <= latest_time
-        else:
-            condition = None
+        condition = model_class.created_at <= latest_time if latest_time else None
 
         if condition is not None:
             scan_args["filter_condition"] = condition
 
         try:
 
+            count = None
+            if paginator.with_total:
+                count = start_count(
+                    count_cache_key(client, model_class, "scan", condition), count_scan, model_class, filter_condition=condition
+                )
+
             result = model_class.scan(**scan_args)
 
             data_list: List[ItemModelRecordType] = [record_type.from_model(item) for item in result]  # type: ignore[call-arg]
 
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
-            paginator.total_count = len(data_list)
+            paginator.total_count = resolve_count(count, len(data_list))
 
             return data_list, paginator
 
@@ -301,6 +318,102 @@ class ItemTableActions(TableActions):
             log.error("Database operation failed", error=str(e), details=kwargs)
             raise UnknownException("Database operation failed") from e
 
+    @classmethod
+    def backfill_created_days(cls, *, client: str) -> int:
+        """Set the CreatedDay bucket on items written before the created-day-index existed.
+
+        Scans the table for items without a CreatedDay and sets it from created_at.
+        Safe to run repeatedly; items that already have a bucket are skipped.
+
+        Args:
+            client (str): Client identifier for table access
+
+        Returns:
+            int: Number of items updated
+
+        Raises:
+            BadRequestException: If client identifier is missing.
+            UnknownException: If the scan or an update fails.
+        """
+        if not client:
+            raise BadRequestException("Client identifier is required for item backfill.")
+
+        model_class = TableFactory.get_model(ItemModel, client)
+
+        condition = model_class.created_day.does_not_exist() & model_class.created_at.exists()
+
+        updated = 0
+        try:
+            for item in model_class.scan(filter_condition=condition):
+                if cls._backfill(model_class, item, [model_class.created_day.set(day_bucket(item.created_at))]):
+                    updated += 1
+        except (ScanError, UpdateError) as e:
+            log.error("Failed to backfill item created days: %s", str(e))
+            raise UnknownException(f"Failed to backfill item created days: {str(e)}") from e
+
+        log.info("Backfilled CreatedDay on %d items for client %s", updated, client)
+
+        return updated
+
+    @classmethod
+    def backfill_status_keys(cls, *, client: str) -> int:
+        """Set the StatusKey on items written before the status index existed.
+
+        Scans the table for branches, builds and components that have a status but no
+        StatusKey.  The status index is keyed on UpdatedAt, so items without it get their
+        created_at as UpdatedAt.  Safe to run repeatedly; items that already have a StatusKey
+        are skipped.
+
+        Args:
+            client (str): Client identifier for table access
+
+        Returns:
+            int: Number of items updated
+
+        Raises:
+            BadRequestException: If client identifier is missing.
+            UnknownException: If the scan or an update fails.
+        """
+        if not client:
+            raise BadRequestException("Client identifier is required for item backfill.")
+
+        # imported here, the item type modules import this module
+        from .branch.models import BranchItem
+        from .build.models import BuildItem
+        from .component.models import ComponentItem
+
+        updated = 0
+        try:
+            for item_type, record_type in ((SCOPE_BRANCH, BranchItem), (SCOPE_BUILD, BuildItem), (SCOPE_COMPONENT, ComponentItem)):
+                model_class = record_type.model_class(client)
+                condition = (
+                    (model_class.item_type == item_type) & model_class.status.exists() & model_class.status_key.does_not_exist()
+                )
+                for item in model_class.scan(filter_condition=condition):
+                    actions = [model_class.status_key.set(get_status_key(item_type, item.status))]
+                    if item.updated_at is None and item.created_at is not None:
+                        actions.append(model_class.updated_at.set(item.created_at))
+                    if cls._backfill(model_class, item, actions):
+                        updated += 1
+        except (ScanError, UpdateError) as e:
+            log.error("Failed to backfill item status keys: %s", str(e))
+            raise UnknownException(f"Failed to backfill item status keys: {str(e)}") from e
+
+        log.info("Backfilled StatusKey on %d items for client %s", updated, client)
+
+        return updated
+
+    @staticmethod
+    def _backfill(model_class: Type[ItemModel], item: ItemModel, actions: List[Action]) -> bool:
+        """Apply backfill actions to an item, unless it was deleted since it was scanned."""
+        try:
+            item.update(actions=actions, condition=model_class.prn.exists())
+            return True
+        except UpdateError as e:
+            if "ConditionalCheckFailed" in str(e):
+                return False
+            raise
+
     @classmethod
     def update(cls, record_type: Type[ItemModelRecordType], *, client: str, **kwargs) -> ItemModelRecordType:
         return cls._update(record_type, remove_none=True, client=client, **kwargs)
@@ -325,7 +438,8 @@ class ItemTableActions(TableActions):
 
         try:
 
-            exclude_fields = {"prn", "parent_prn", "created_at", "updated_at"}
+            # latest_build is a system maintained rollup (see BranchActions.update_latest_build)
+            exclude_fields = {"prn", "parent_prn", "created_at", "updated_at", "latest_build"}
 
             # Validate input data files
             if remove_none:
@@ -356,6 +470,15 @@ class ItemTableActions(TableActions):
             actions.append(model_class.updated_at.set(make_default_time()))
 
             item = model_class.get(hash_key=parent_prn, range_key=prn)
+
+            # keep the sparse status index in step with the status attribute
+            if "status" in values and "status" in attributes:
+                status = values["status"]
+                if status is not None:
+                    actions.append(model_class.status_key.set(get_status_key(item.item_type, status)))
+                elif remove_none:
+                    actions.append(model_class.status_key.remove())
+
             item.update(actions=actions, condition=model_class.prn.exists())
             item.refresh()
 
@@ -414,12 +537,187 @@ class ItemTableActions(TableActions):
 
         try:
 
+            count = None
+            if paginator.with_total:
+                count = start_count(
+                    count_cache_key(client, model_class, "parent_created_at_index", parent_prn, condition),
+                    count_query,
+                    model_class.parent_created_at_index,
+                    parent_prn,
+                    range_key_condition=condition,
+                )
+
             result = model_class.parent_created_at_index.query(hash_key=parent_prn, **query_args)
 
             data_list: List[ItemModelRecordType] = [record_type.from_model(item) for item in result]  # type: ignore[call-arg]
 
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
-            paginator.total_count = len(data_list)
+            paginator.total_count = resolve_count(count, len(data_list))
+
+            return data_list, paginator
+
+        except QueryError as e:
+            log.error("Database operation failed while querying items", error=str(e))
+            raise UnknownException("Database operation failed while querying items") from e
+
+        except Exception as e:
+            log.error("Database operation failed", error=str(e))
+            raise UnknownException("Database operation failed") from e
+
+    @classmethod
+    def _list_by_created_day(
+        cls,
+        record_type: Type[ItemModelRecordType],
+        *,
+        client: str,
+        paginator: Paginator,
+        earliest_time: datetime | str,
+        latest_time: datetime | str | None = None,
+    ) -> Tuple[List[ItemModelRecordType], Paginator]:
+        """uses the created-day index to list items of all parents created in a time window
+
+        The window is split into UTC day buckets which are queried in order, so results are
+        sorted by created_at (descending when sort_forward is False).  The cursor records the
+        bucket and key to resume from.  latest_time defaults to now.
+
+        Items created before the index existed have no CreatedDay and are not returned until
+        :meth:`backfill_created_days` has been run.
+        """
+        earliest_time = Paginator.validate_date(earliest_time)
+        latest_time = Paginator.validate_date(latest_time) or make_default_time()
+        if earliest_time is None:
+            raise BadRequestException("earliest_time must be a valid date")
+
+        sort_forward = paginator.sort_forward is not False
+
+        model_class = record_type.model_class(client)
+
+        try:
+            buckets = day_buckets(earliest_time, latest_time, sort_forward=sort_forward)
+            range_key_condition = model_class.created_at.between(earliest_time, latest_time)
+
+            count = None
+            if paginator.with_total:
+                count = start_count(
+                    count_cache_key(client, model_class, "created_day_index", range_key_condition),
+                    count_buckets,
+                    model_class.created_day_index,
+                    buckets,
+                    range_key_condition=range_key_condition,
+                )
+
+            result, next_cursor = query_buckets(
+                model_class.created_day_index,
+                buckets,
+                limit=paginator.limit,
+                cursor=paginator.last_evaluated_key,
+                sort_forward=sort_forward,
+                range_key_condition=range_key_condition,
+                page_size=paginator.page_size,
+            )
+
+            data_list: List[ItemModelRecordType] = [record_type.from_model(item) for item in result]  # type: ignore[call-arg]
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = next_cursor
+            paginator.total_count = resolve_count(count, len(data_list))
+
+            return data_list, paginator
+
+        except ValueError as e:
+            raise BadRequestException(f"Invalid item query: {e}")
+
+        except QueryError as e:
+            log.error("Database operation failed while querying items", error=str(e))
+            raise UnknownException("Database operation failed while querying items") from e
+
+        except Exception as e:
+            log.error("Database operation failed", error=str(e))
+            raise UnknownException("Database operation failed") from e
+
+    @classmethod
+    def list_by_status(
+        cls,
+        record_type: Type[ItemModelRecordType],
+        *,
+        client: str,
+        item_type: str,
+        status: str,
+        earliest_time: datetime | str | None = None,
+        latest_time: datetime | str | None = None,
+        **kwargs,
+    ) -> Tuple[List[ItemModelRecordType], Paginator]:
+        """List items of one type currently in a given status.
+
+        Queries the sparse status index, so only items with that status are read.  Results are
+        ordered by updated_at (newest first when sort_forward is False) and can be limited to
+        items updated within a time window.
+
+        Items whose status has not changed since the index existed have no StatusKey and are
+        not returned until :meth:`backfill_status_keys` has been run.
+
+        Args:
+            record_type: The specific ItemModelRecord subclass to return
+            client (str): Client identifier for table isolation
+            item_type (str): The item type, e.g. "build" or "component"
+            status (str): The status to match, e.g. "RUNNING"
+            earliest_time (datetime | str, optional): Only items updated at or after this time
+            latest_time (datetime | str, optional): Only items updated at or before this time
+            **kwargs: Pagination options (limit, cursor, sort_forward, page_size)
+
+        Returns:
+            Tuple containing the list of items and pagination metadata.
+
+        Raises:
+            BadRequestException: If client, item type, or status is missing
+            UnknownException: If database operation fails
+        """
+        if not client:
+            raise BadRequestException("Client is required for item listing")
+
+        if not item_type or not status:
+            raise BadRequestException("item_type and status are required")
+
+        try:
+            paginator = Paginator(**kwargs)
+        except ValueError as e:
+            raise BadRequestException(f"Invalid pagination parameters: {e}")
+
+        model_class = record_type.model_class(client)
+
+        earliest_time = Paginator.validate_date(earliest_time)
+        latest_time = Paginator.validate_date(latest_time)
+
+        query_args = paginator.get_query_args()
+        if earliest_time and latest_time:
+            query_args["range_key_condition"] = model_class.updated_at.between(earliest_time, latest_time)
+        elif earliest_time:
+            query_args["range_key_condition"] = model_class.updated_at >= earliest_time
+        elif latest_time:
+            query_args["range_key_condition"] = model_class.updated_at <= latest_time
+
+        status_key = get_status_key(item_type, status)
+
+        try:
+
+            count = None
+            if paginator.with_total:
+                range_key_condition = query_args.get("range_key_condition")
+                count = start_count(
+                    count_cache_key(client, model_class, "status_index", status_key, range_key_condition),
+                    count_query,
+                    model_class.status_index,
+                    status_key,
+                    range_key_condition=range_key_condition,
+                )
+
+            result = model_class.status_index.query(hash_key=status_key, **query_args)
+
+            data_list: List[ItemModelRecordType] = [record_type.from_model(item) for item in result]  # type: ignore[call-arg]
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
+            paginator.total_count = resolve_count(count, len(data_list))
 
             return data_list, paginator
 
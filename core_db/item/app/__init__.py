@@ -202,7 +202,15 @@ Note:
     implement appropriate cleanup or prevention logic.
 """
 
-from .actions import AppActions
-from .models import AppModel, AppItem
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AppActions": ".actions",
+        "AppModel": ".models",
+        "AppItem": ".models",
+    },
+)
 
 __all__ = ["AppActions", "AppModel", "AppItem"]
@@ -264,7 +264,15 @@ Note:
     Consider cascading effects and implement appropriate cleanup logic.
 """
 
-from .actions import BranchActions
-from .models import BranchModel, BranchItem
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BranchActions": ".actions",
+        "BranchModel": ".models",
+        "BranchItem": ".models",
+    },
+)
 
 __all__ = ["BranchActions", "BranchModel", "BranchItem"]
@@ -9,9 +9,18 @@ while inheriting common item management functionality.
 """
 
 from typing import List, Tuple
+from datetime import datetime
+
+from pynamodb.exceptions import UpdateError
+
+import core_logging as log
+
+from core_framework.time_utils import make_default_time
+
 from core_db.models import Paginator
+from ...exceptions import BadRequestException, UnknownException
 from ..actions import ItemTableActions
-from .models import BranchItem
+from .models import BranchItem, LatestBuildAttribute
 
 
 class BranchActions(ItemTableActions):
@@ -121,3 +130,57 @@ class BranchActions(ItemTableActions):
                 - data (Dict): Updated branch item dictionary
         """
         return super().patch(BranchItem, client=client, **kwargs)
+
+    @classmethod
+    def update_latest_build(cls, *, client: str, prn: str, status: str | None, updated_at: datetime | None = None) -> bool:
+        """Record a build status change in the LatestBuild summary of its branch.
+
+        The summary is only replaced if it is absent or older than ``updated_at``, so
+        status changes that arrive out of order can never regress it.  This keeps
+        "latest build per branch" a single query on the branches of an app.
+
+        Args:
+            client (str): Client identifier for table isolation
+            prn (str): PRN of the build whose status changed
+            status (str, optional): The new build status
+            updated_at (datetime, optional): When the status changed.  Defaults to now.
+
+        Returns:
+            bool: True if the summary was updated, False if it already holds a newer change
+                or the branch does not exist.
+
+        Raises:
+            BadRequestException: If the build PRN is missing
+            UnknownException: If the database operation fails
+        """
+        if not client:
+            raise BadRequestException("Client is required for branch update")
+
+        if not prn:
+            raise BadRequestException("Build PRN is required to update the latest build")
+
+        if updated_at is None:
+            updated_at = make_default_time()
+
+        branch_prn = BranchItem.get_parent_prn(prn)
+
+        model_class = BranchItem.model_class(client)
+
+        item = model_class(parent_prn=BranchItem.get_parent_prn(branch_prn), prn=branch_prn)
+
+        latest_build = LatestBuildAttribute(prn=prn, status=status, updated_at=updated_at)
+
+        condition = model_class.prn.exists() & (
+            model_class.latest_build.does_not_exist() | (model_class.latest_build.updated_at <= updated_at)
+        )
+
+        try:
+            item.update(actions=[model_class.latest_build.set(latest_build)], condition=condition)
+            return True
+
+        except UpdateError as e:
+            if "ConditionalCheckFailedException" in str(e):
+                log.debug("Latest build of branch %s not updated; a newer change exists or the branch is missing", branch_prn)
+                return False
+
+            raise UnknownException("Database operation failed while updating latest build") from e
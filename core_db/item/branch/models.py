@@ -8,6 +8,7 @@ Key Components:
     - **BranchModel**: PynamoDB model with branch-specific field extensions
     - **BranchModelFactory**: Factory for client-specific model management
     - **ReleaseInfo**: Pydantic model for released build information
+    - **LatestBuildInfo**: Pydantic model for the denormalized latest build summary
     - **BranchItem**: Pydantic model with validation and serialization
 
 Branch items track the relationship between source code branches and their deployed
@@ -16,17 +17,32 @@ Portfolio -> App -> Branch -> Build -> Component
 """
 
 from typing import Type, Dict, Any, Optional
+from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from pynamodb.attributes import UnicodeAttribute, MapAttribute
+from pynamodb.attributes import UnicodeAttribute, MapAttribute, UTCDateTimeAttribute
 
 import core_framework as util
 
-from ...models import TableFactory
+from ...models import TableFactory, EnhancedMapAttribute
 from ..models import ItemModel, ItemModelRecord
 
 
+class LatestBuildAttribute(EnhancedMapAttribute):
+    """Summary of the most recent build status change on a branch.
+
+    Attributes:
+        prn (str): PRN of the build
+        status (str): Status of the build
+        updated_at (datetime): When the build status changed.  Used to reject out-of-order writes.
+    """
+
+    prn = UnicodeAttribute(attr_name="Prn")
+    status = UnicodeAttribute(null=True, attr_name="Status")
+    updated_at = UTCDateTimeAttribute(attr_name="UpdatedAt")
+
+
 class BranchModel(ItemModel):
     """Branch model field extensions for branch items in the CMDB.
 
@@ -50,6 +66,8 @@ class BranchModel(ItemModel):
             Format: "prn:portfolio"
         app_prn (str): App PRN that this branch belongs to.
             Format: "prn:portfolio:app"
+        latest_build (LatestBuildAttribute, optional): Denormalized summary (prn, status, updated_at) of the
+            most recent build status change.  Maintained by BuildActions; never regresses to an older change.
 
     Note:
         Branch items represent Git branches or deployment environments within an
@@ -66,6 +84,8 @@ class BranchModel(ItemModel):
     portfolio_prn = UnicodeAttribute(null=False, attr_name="PortfolioPrn")
     app_prn = UnicodeAttribute(null=False, attr_name="AppPrn")
 
+    latest_build = LatestBuildAttribute(null=True, attr_name="LatestBuild")
+
     def __repr__(self) -> str:
         """Return string representation of the BranchModel.
 
@@ -204,6 +224,36 @@ class ReleaseInfo(BaseModel):
         return values
 
 
+class LatestBuildInfo(BaseModel):
+    """Pydantic model for the latest build summary in branch items.
+
+    Attributes:
+        prn (str): Pipeline Reference Number (PRN) of the build
+        status (str, optional): Status of the build
+        updated_at (datetime): When the build status changed
+    """
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+
+    prn: str = Field(
+        ...,
+        alias="Prn",
+        description="Pipeline Reference Number of the latest build",
+    )
+    status: Optional[str] = Field(
+        None,
+        alias="Status",
+        description="Status of the latest build",
+    )
+    updated_at: datetime = Field(
+        ...,
+        alias="UpdatedAt",
+        description="When the latest build status changed",
+    )
+
+
 class BranchItem(ItemModelRecord):
     """Pydantic model for Branch items with validation and serialization.
 
@@ -220,6 +270,7 @@ class BranchItem(ItemModelRecord):
         released_build (ReleaseInfo): Released build information for this branch
         portfolio_prn (str): Portfolio PRN that this branch belongs to
         app_prn (str): App PRN that this branch belongs to
+        latest_build (LatestBuildInfo, optional): Latest build status summary (read-only, system maintained)
     """
 
     # Branch-specific fields with PascalCase aliases
@@ -243,6 +294,11 @@ class BranchItem(ItemModelRecord):
         alias="ReleasedBuild",
         description="Released build information for this branch",
     )
+    latest_build: Optional[LatestBuildInfo] = Field(
+        None,
+        alias="LatestBuild",
+        description="Latest build status summary for this branch (system maintained)",
+    )
 
     @model_validator(mode="before")
     def validate_fields(cls, ov: Dict[str, Any]) -> Dict[str, Any]:
@@ -320,7 +320,15 @@ Note:
     capabilities. Consider retention policies for build artifacts and metadata.
 """
 
-from .actions import BuildActions
-from .models import BuildModel, BuildItem
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BuildActions": ".actions",
+        "BuildModel": ".models",
+        "BuildItem": ".models",
+    },
+)
 
 __all__ = ["BuildActions", "BuildModel", "BuildItem"]
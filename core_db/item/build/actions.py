@@ -5,13 +5,17 @@ Build items represent specific infrastructure deployment instances within branch
 deployment lifecycle from initiation to completion.
 
 The BuildActions class extends ItemTableActions to provide build-specific CRUD operations
-while inheriting common item management functionality.
+while inheriting common item management functionality.  Every build write that carries a
+status is also rolled up into the LatestBuild summary of the parent branch.
 """
 
 from typing import List, Tuple
 
+import core_logging as log
+
 from ...models import Paginator
 from ..actions import ItemTableActions
+from ..branch.actions import BranchActions
 from .models import BuildItem
 
 
@@ -40,6 +44,19 @@ class BuildActions(ItemTableActions):
         """
         return super().list(BuildItem, client=client, **kwargs)
 
+    @classmethod
+    def list_by_status(cls, *, client: str, status: str, **kwargs) -> Tuple[List[BuildItem], Paginator]:
+        """List build items currently in the given status.
+
+        Args:
+            status (str): The status to match, e.g. "RUNNING" or "FAILED".
+            **kwargs: Optional earliest_time/latest_time window on updated_at and pagination options.
+
+        Returns:
+            Tuple containing list of build items and pagination metadata.
+        """
+        return super().list_by_status(BuildItem, client=client, item_type="build", status=status, **kwargs)
+
     @classmethod
     def get(cls, *, client: str, **kwargs) -> BuildItem:
         """Retrieve a specific build item by PRN.
@@ -63,7 +80,7 @@ class BuildActions(ItemTableActions):
         Returns:
             BuildItem containing the created build item data.
         """
-        return super().create(BuildItem, client=client, **kwargs)
+        return cls._rollup(client, super().create(BuildItem, client=client, **kwargs))
 
     @classmethod
     def update(cls, *, client: str, **kwargs) -> BuildItem:
@@ -76,7 +93,7 @@ class BuildActions(ItemTableActions):
         Returns:
             BuildItem containing the updated build item data.
         """
-        return super().update(BuildItem, client=client, **kwargs)
+        return cls._rollup(client, super().update(BuildItem, client=client, **kwargs))
 
     @classmethod
     def patch(cls, *, client: str, **kwargs) -> BuildItem:
@@ -89,7 +106,7 @@ class BuildActions(ItemTableActions):
         Returns:
             BuildItem containing the updated build item data.
         """
-        return super().patch(BuildItem, client=client, **kwargs)
+        return cls._rollup(client, super().patch(BuildItem, client=client, **kwargs))
 
     @classmethod
     def delete(cls, *, client: str, **kwargs) -> bool:
@@ -102,3 +119,16 @@ class BuildActions(ItemTableActions):
             bool with confirmation of the deletion.
         """
         return super().delete(BuildItem, client=client, **kwargs)
+
+    @classmethod
+    def _rollup(cls, client: str, build: BuildItem) -> BuildItem:
+        """Update the LatestBuild summary of the parent branch from a written build.
+
+        A failed rollup is logged and does not fail the build write.
+        """
+        if build is not None and build.status:
+            try:
+                BranchActions.update_latest_build(client=client, prn=build.prn, status=build.status, updated_at=build.updated_at)
+            except Exception as e:
+                log.warning("Failed to update latest build of branch for %s: %s", build.prn, str(e))
+        return build
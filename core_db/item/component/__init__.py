@@ -405,7 +405,15 @@ Note:
     monitoring. Components are directly mapped to AWS resources and services.
 """
 
-from .actions import ComponentActions
-from .models import ComponentModel, ComponentItem
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ComponentActions": ".actions",
+        "ComponentModel": ".models",
+        "ComponentItem": ".models",
+    },
+)
 
 __all__ = ["ComponentActions", "ComponentModel", "ComponentItem"]
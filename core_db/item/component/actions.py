@@ -40,6 +40,19 @@ class ComponentActions(ItemTableActions):
         """
         return super().list(ComponentItem, client=client, **kwargs)
 
+    @classmethod
+    def list_by_status(cls, *, client: str, status: str, **kwargs) -> Tuple[List[ComponentItem], Paginator]:
+        """List component items currently in the given status.
+
+        Args:
+            status (str): The status to match, e.g. "RUNNING" or "FAILED".
+            **kwargs: Optional earliest_time/latest_time window on updated_at and pagination options.
+
+        Returns:
+            Tuple containing list of component items and pagination metadata.
+        """
+        return super().list_by_status(ComponentItem, client=client, item_type="component", status=status, **kwargs)
+
     @classmethod
     def get(cls, *, client: str, **kwargs) -> ComponentItem:
         """Retrieve a specific component item by PRN.
@@ -34,6 +34,57 @@ class ParentCreatedAtIndex(GlobalSecondaryIndex):
     created_at = UTCDateTimeAttribute(range_key=True, attr_name="CreatedAt")
 
 
+class CreatedDayIndex(GlobalSecondaryIndex):
+    """Global Secondary Index for listing items of every parent by creation time.
+
+    Items are bucketed by the UTC day they were created so a time window becomes one
+    query per day instead of a filtered scan of the whole table.
+
+    Attributes:
+        created_day (str): UTC day of the creation timestamp, "YYYY-MM-DD" (hash key)
+        created_at (datetime): Timestamp of the item creation (range key)
+    """
+
+    class Meta:
+        index_name = "created-day-index"
+        projection = AllProjection()
+
+    created_day = UnicodeAttribute(hash_key=True, attr_name="CreatedDay")
+    created_at = UTCDateTimeAttribute(range_key=True, attr_name="CreatedAt")
+
+
+class StatusIndex(GlobalSecondaryIndex):
+    """Sparse Global Secondary Index for listing items by type and status.
+
+    Only items that carry a status (builds and components) have a StatusKey, so the
+    index contains exactly the rows a deployment dashboard polls, newest change last.
+
+    Attributes:
+        status_key (str): Item type and status joined by "#", e.g. "build#RUNNING" (hash key)
+        updated_at (datetime): Timestamp of the last item change (range key)
+    """
+
+    class Meta:
+        index_name = "status-updated_at-index"
+        projection = AllProjection()
+
+    status_key = UnicodeAttribute(hash_key=True, attr_name="StatusKey")
+    updated_at = UTCDateTimeAttribute(range_key=True, attr_name="UpdatedAt")
+
+
+def get_status_key(item_type: str, status: str) -> str:
+    """Return the StatusKey value for an item type and status.
+
+    Args:
+        item_type (str): The item type, e.g. "build"
+        status (str): The item status, e.g. "RUNNING"
+
+    Returns:
+        str: The key, e.g. "build#RUNNING"
+    """
+    return f"{item_type}#{status}"
+
+
 class ItemModel(DatabaseTable):
     """Configuration Management Database (CMDB) model for AWS infrastructure items.
 
@@ -70,8 +121,15 @@ class ItemModel(DatabaseTable):
         updated_at (datetime): Timestamp when the item was last modified in the CMDB (auto-updated).
             Updated automatically on every save() or update() operation.
             Used for change tracking and data freshness validation.
+        created_day (str): UTC day bucket of created_at ("YYYY-MM-DD"). Set automatically on item creation.
+        status_key (str, optional): "<item_type>#<status>" for items that have a status.  Maintained
+            automatically by ItemTableActions create, update, and patch.
         parent_created_at_index (ParentCreatedAtIndex): Global Secondary Index enabling efficient queries
             by parent PRN and creation date.
+        created_day_index (CreatedDayIndex): Global Secondary Index enabling efficient time-window
+            queries across all parents.
+        status_index (StatusIndex): Sparse Global Secondary Index enabling efficient queries by
+            item type and status.
 
     Note:
         **AWS Resource Traceability**: When AWS components are deployed, they may not always have
@@ -121,8 +179,16 @@ class ItemModel(DatabaseTable):
     # Any optional metadata for the item
     metadata = MapAttribute(null=True, attr_name="Metadata")
 
+    # Time bucket of created_at for the created_day_index
+    created_day = UnicodeAttribute(null=True, attr_name="CreatedDay")
+
+    # "<item_type>#<status>" for items with a status, absent otherwise (sparse status_index)
+    status_key = UnicodeAttribute(null=True, attr_name="StatusKey")
+
     # Indexes
     parent_created_at_index = ParentCreatedAtIndex()
+    created_day_index = CreatedDayIndex()
+    status_index = StatusIndex()
 
     def __repr__(self) -> str:
         """Return string representation of the ItemModel.
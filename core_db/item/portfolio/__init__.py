@@ -111,5 +111,14 @@ Note:
     effects and implement appropriate cleanup or prevention logic.
 """
 
-from .actions import PortfolioActions
-from .models import PortfolioModel, PortfolioModelFactory, PortfolioItem
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PortfolioActions": ".actions",
+        "PortfolioModel": ".models",
+        "PortfolioModelFactory": ".models",
+        "PortfolioItem": ".models",
+    },
+)
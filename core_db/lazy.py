@@ -0,0 +1,68 @@
+"""Lazy package exports.
+
+The ``core_db`` packages re-export their public names (``from core_db.item import ItemActions``)
+without importing the defining modules up front.  Each package ``__init__`` declares where its
+names live, and the module is imported on first access.  A Lambda that only writes events then
+loads the event modules, not every item, registry and facter module.
+
+Exports are given as ``"module"`` (the attribute has the exported name) or ``"module:attribute"``
+(the attribute is exported under another name).  Modules are relative to the package.
+
+Examples:
+    >>> # core_db/event/__init__.py
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {
+    ...     "EventModel": ".models",
+    ...     "EventActions": ".actions",
+    ... })
+
+    >>> # core_db/item/__init__.py: export ItemTableActions as ItemActions
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"ItemActions": ".actions:ItemTableActions"})
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+import importlib
+import sys
+
+
+def resolve(spec: str, package: str | None = None) -> Any:
+    """Import ``"module"`` or ``"module:attribute"`` and return the module or attribute.
+
+    Args:
+        spec (str): Module path, optionally followed by ``:attribute``
+        package (str, optional): Package that relative module paths are relative to
+
+    Returns:
+        Any: The module, or the attribute of the module
+    """
+    module_name, _, attribute = spec.partition(":")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, attribute) if attribute else module
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module-level ``__getattr__`` and ``__dir__`` of a package.
+
+    Resolved names are stored in the package namespace, so each one is imported once.
+
+    Args:
+        package (str): The package name (``__name__`` in the package ``__init__``)
+        exports (dict[str, str]): Exported name -> ``"module"`` or ``"module:attribute"``
+
+    Returns:
+        tuple: The ``__getattr__`` and ``__dir__`` functions for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        spec = exports.get(name)
+        if spec is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        if ":" not in spec:
+            spec = f"{spec}:{name}"
+        value = resolve(spec, package)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -43,15 +43,14 @@ import threading
 from abc import ABC
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
-import base64
 from dateutil import parser
-import json
 
 # Third-party imports
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     field_validator,
     model_validator,
 )
@@ -71,18 +70,24 @@ from pynamodb.attributes import (
     UTCDateTimeAttribute,
 )
 from pynamodb.constants import MAP, NULL
-from pynamodb.exceptions import AttributeNullError
+from pynamodb.exceptions import AttributeNullError, TableDoesNotExist
 from pynamodb.models import Model
 
 import core_framework as util
+import core_logging as log
 
 # Local imports
+from .cache import TTLCache
 from .config import get_dynamodb_host, get_region, get_table_name
+from .cursor import decode_cursor, encode_cursor
 
 # Type variables
 _T = TypeVar("_T")
 T = TypeVar("T", bound=Model)
 
+TABLE_STATUS_TTL = 30.0
+"""Seconds a cached DescribeTable result (including "table does not exist") is used."""
+
 
 def _get_class_for_serialize(value):
     """Return the class needed to serialize the given value.
@@ -601,8 +606,8 @@ class DatabaseTable(EnhancedInit, Model):
 
         Attributes:
             table_name (str): DynamoDB table name (must be overridden)
-            host (str): DynamoDB host endpoint
-            region (str): AWS region
+            host (str): DynamoDB host endpoint.  Resolved from configuration on first connection if None.
+            region (str): AWS region.  Resolved from configuration on first connection if None.
             read_capacity_units (int): Read capacity for provisioned mode
             write_capacity_units (int): Write capacity for provisioned mode
             billing_mode (str): DynamoDB billing mode
@@ -615,8 +620,8 @@ class DatabaseTable(EnhancedInit, Model):
         """
 
         table_name = None
-        host = get_dynamodb_host()
-        region = get_region()
+        host = None
+        region = None
         read_capacity_units = 1
         write_capacity_units = 1
         billing_mode = "PAY_PER_REQUEST"
@@ -624,6 +629,16 @@ class DatabaseTable(EnhancedInit, Model):
     created_at = UTCDateTimeAttribute(null=True, attr_name="CreatedAt")
     updated_at = UTCDateTimeAttribute(null=True, attr_name="UpdatedAt")
 
+    @classmethod
+    def _get_connection(cls):
+        # host and region are read from configuration here rather than when the Meta class is
+        # defined, so importing the models does not touch configuration
+        if cls.Meta.host is None:
+            cls.Meta.host = get_dynamodb_host()
+        if cls.Meta.region is None:
+            cls.Meta.region = get_region()
+        return super()._get_connection()
+
 
 class TableFactory:
     """Thread-safe factory for creating client-specific PynamoDB models.
@@ -635,12 +650,18 @@ class TableFactory:
     Attributes:
         _model_cache (Dict[str, Type[Model]]): Cache of created model classes
         _cache_lock (threading.Lock): Thread lock for cache operations
+        _table_cache (TTLCache): DescribeTable results by table name (None if the table does not exist)
+        _verified_tables (set[str]): Tables whose GSIs were compared with the model in this process
 
     Features:
         - **Dynamic Model Creation**: Client-specific models with proper table names
         - **Thread Safety**: Safe for concurrent access and model creation
         - **Performance Caching**: Avoids recreating identical model classes
         - **Table Management**: Create, delete, and check table existence
+        - **Table Status Caching**: ``exists`` and ``describe`` reuse a DescribeTable result for
+          ``TABLE_STATUS_TTL`` seconds; ``create_table`` and ``delete_table`` invalidate it
+        - **Schema Verification**: The first description of an ACTIVE table is compared with the
+          model's GSIs, once per process, and differences are logged as warnings
 
     Examples:
         >>> # Get client-specific model
@@ -661,6 +682,8 @@ class TableFactory:
 
     _model_cache: Dict[str, Type[Model]] = {}
     _cache_lock = threading.Lock()
+    _table_cache = TTLCache(maxsize=1024, ttl=TABLE_STATUS_TTL)
+    _verified_tables: set[str] = set()
 
     @classmethod
     def get_model(cls, base_model: Type[T], client: str | None = None) -> Type[T]:
@@ -752,8 +775,11 @@ class TableFactory:
         """
         model_class = cls.get_model(base_model, client)
 
-        if not model_class.exists():
-            model_class.create_table(wait=wait)
+        if not cls.exists(base_model, client):
+            try:
+                model_class.create_table(wait=wait)
+            finally:
+                cls.invalidate(base_model, client)
             return True
         return False
 
@@ -784,8 +810,11 @@ class TableFactory:
         """
         model_class = cls.get_model(base_model, client)
 
-        if model_class.exists():
-            result = model_class.delete_table(wait=wait)
+        if cls.exists(base_model, client):
+            try:
+                model_class.delete_table(wait=wait)
+            finally:
+                cls.invalidate(base_model, client)
             return True
         return False
 
@@ -793,6 +822,9 @@ class TableFactory:
     def exists(cls, base_model: Type[T], client: str | None = None) -> bool:
         """Check if the table for a client-specific model exists.
 
+        Uses the cached table description (see :meth:`describe`), so repeated checks do not
+        each cost a DescribeTable call.
+
         Args:
             base_model (Type[T]): Base model class (e.g., ClientFactsModel)
             client (str): Client name for table naming
@@ -814,14 +846,110 @@ class TableFactory:
             ...         TableFactory.create_table(ItemModel, client)
             ...         print(f"Created table for {client}")
         """
+        return cls.describe(base_model, client) is not None
+
+    @classmethod
+    def describe(cls, base_model: Type[T], client: str | None = None, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the DescribeTable result for a client-specific model's table.
+
+        Results are cached per table for ``TABLE_STATUS_TTL`` seconds, including the fact
+        that the table does not exist.  The first time an ACTIVE table is described in this
+        process, its GSIs are compared with the model (see :meth:`verify_schema`).
+
+        Args:
+            base_model (Type[T]): Base model class (e.g., ClientFactsModel)
+            client (str): Client name for table naming
+            refresh (bool, optional): Ignore the cached result. Defaults to False.
+
+        Returns:
+            dict | None: The table description (TableStatus, KeySchema, GlobalSecondaryIndexes, ...),
+            or None if the table does not exist.  Callers must not modify it.
+
+        Examples:
+            >>> description = TableFactory.describe(PortfolioFactsModel, "acme")
+            >>> description["TableStatus"]
+            'ACTIVE'
+        """
+        model_class = cls.get_model(base_model, client)
+        table_name = model_class.Meta.table_name
+
+        if not refresh:
+            cached = cls._table_cache.get(table_name, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+        try:
+            description = model_class._get_connection().describe_table()
+        except TableDoesNotExist:
+            description = None
+
+        cls._table_cache.set(table_name, description)
+
+        if description is not None and description.get("TableStatus") == "ACTIVE" and table_name not in cls._verified_tables:
+            cls._verified_tables.add(table_name)
+            cls._log_schema_differences(table_name, _schema_differences(model_class, description))
+
+        return description
+
+    @classmethod
+    def verify_schema(cls, base_model: Type[T], client: str | None = None) -> list[str]:
+        """Compare the live table's GSIs with the model definition.
+
+        Differences (indexes missing from the table or from the model, different key schema
+        or projection) are logged as warnings and returned.
+
+        Args:
+            base_model (Type[T]): Base model class (e.g., ClientFactsModel)
+            client (str): Client name for table naming
+
+        Returns:
+            list[str]: One message per difference; empty if the table matches or does not exist
+
+        Examples:
+            >>> TableFactory.verify_schema(AuthAuditModel, "acme")
+            ['index audit-day-index is missing from table acme-core-automation-auth-audit']
+        """
         model_class = cls.get_model(base_model, client)
-        return model_class.exists()
+        table_name = model_class.Meta.table_name
+
+        description = cls.describe(base_model, client, refresh=True)
+        if description is None:
+            return []
+
+        cls._verified_tables.add(table_name)
+        differences = _schema_differences(model_class, description)
+        cls._log_schema_differences(table_name, differences)
+        return differences
+
+    @staticmethod
+    def _log_schema_differences(table_name: str, differences: list[str]) -> None:
+        for difference in differences:
+            log.warning("Table %s does not match its model: %s", table_name, difference)
+
+    @classmethod
+    def invalidate(cls, base_model: Type[T] | None = None, client: str | None = None) -> None:
+        """Forget the cached description of a table, or of all tables.
+
+        Call this after changing a table outside of :meth:`create_table` and :meth:`delete_table`.
+
+        Args:
+            base_model (Type[T], optional): Base model class. Forget all tables if None.
+            client (str): Client name for table naming
+
+        Examples:
+            >>> TableFactory.invalidate(PortfolioFactsModel, "acme")
+            >>> TableFactory.invalidate()
+        """
+        if base_model is None:
+            cls._table_cache.clear()
+            return
+        cls._table_cache.invalidate(cls.get_model(base_model, client).Meta.table_name)
 
     @classmethod
     def clear_cache(cls):
         """Clear the model cache (useful for testing).
 
-        Removes all cached client-specific model classes. This is primarily
+        Removes all cached client-specific model classes and table descriptions. This is primarily
         used in testing scenarios to ensure clean state between tests.
 
         Examples:
@@ -835,6 +963,40 @@ class TableFactory:
         """
         with cls._cache_lock:
             cls._model_cache.clear()
+        cls._table_cache.clear()
+        cls._verified_tables.clear()
+
+
+_MISSING = object()
+
+
+def _key_schema(key_schema: list[dict]) -> list[tuple[str, str]]:
+    return sorted((k["KeyType"], k["AttributeName"]) for k in key_schema)
+
+
+def _projection(projection: dict) -> tuple[str, list[str]]:
+    return projection.get("ProjectionType", ""), sorted(projection.get("NonKeyAttributes", []))
+
+
+def _schema_differences(model_class: Type[Model], description: Dict[str, Any]) -> list[str]:
+    """Compare the GSIs of a DescribeTable result with the model's GSIs."""
+    table_name = model_class.Meta.table_name
+    live = {index["IndexName"]: index for index in description.get("GlobalSecondaryIndexes", [])}
+    declared = {index["index_name"]: index for index in model_class._get_schema().get("global_secondary_indexes", [])}
+
+    differences = []
+    for name, index in declared.items():
+        if name not in live:
+            differences.append(f"index {name} is missing from table {table_name}")
+            continue
+        if _key_schema(index["key_schema"]) != _key_schema(live[name].get("KeySchema", [])):
+            differences.append(f"index {name} has key schema {live[name].get('KeySchema')}, model declares {index['key_schema']}")
+        if _projection(index["projection"]) != _projection(live[name].get("Projection", {})):
+            differences.append(f"index {name} has projection {live[name].get('Projection')}, model declares {index['projection']}")
+    for name in live:
+        if name not in declared:
+            differences.append(f"index {name} of table {table_name} is not declared by the model")
+    return differences
 
 
 class DatabaseRecord(BaseModel, ABC):
@@ -974,6 +1136,21 @@ class Paginator(BaseModel):
     page_size: int | None = Field(default=None, ge=1, le=100, description="Number of items per page")
 
     total_count: int = Field(default=0, description="Total count of items in the result set")
+    with_total: bool = Field(
+        default=False,
+        description="Count every matching item (see core_db.counts) instead of reporting the page size in total_count",
+    )
+    fill: bool = Field(
+        default=False,
+        description="Keep reading until limit matching items are found or the results are exhausted (see core_db.pagefill)",
+    )
+    max_scanned: int | None = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of items DynamoDB may evaluate while filling a page",
+    )
+
+    _cursor_cache: tuple[str, dict | None] | None = PrivateAttr(default=None)
 
     def get_query_args(self) -> dict:
         args = {"limit": self.limit}
@@ -997,16 +1174,40 @@ class Paginator(BaseModel):
 
         return args
 
+    def get_fill_args(self, scan: bool = False) -> dict:
+        """Return query or scan arguments for a page-fill read (see ``core_db.pagefill.fill_page``).
+
+        The limit is left out so the result iterator keeps reading pages; fill_page stops at the limit.
+
+        Args:
+            scan (bool): True for scan arguments, False for query arguments
+
+        Returns:
+            dict: The arguments
+        """
+        args = self.get_scan_args() if scan else self.get_query_args()
+        args.pop("limit", None)
+        args["page_size"] = self.page_size or self.limit
+        return args
+
     @property
     def last_evaluated_key(self) -> dict | None:
-        """Return the last evaluated key (cursor)."""
-        return self._decode_cursor(self.cursor)
+        """Return the last evaluated key (cursor).
+
+        The decoded key is cached until the cursor changes.
+        """
+        if self.cursor is None:
+            return None
+        if self._cursor_cache is None or self._cursor_cache[0] != self.cursor:
+            self._cursor_cache = (self.cursor, self._decode_cursor(self.cursor))
+        return self._cursor_cache[1]
 
     @last_evaluated_key.setter
     def last_evaluated_key(self, value: dict | None) -> None:
-        """Set the last evaluated key (cursor) from a dict.  Use the 'cursor' key for the base64 string."""
+        """Set the last evaluated key (cursor) from a dict.  Use the 'cursor' key for the encoded string."""
         if isinstance(value, dict):
             self.cursor = self._encode_cursor(value)
+            self._cursor_cache = (self.cursor, value)
 
     @property
     def sort(self) -> str:
@@ -1038,25 +1239,33 @@ class Paginator(BaseModel):
         """Validate latest_time to ensure it is a valid datetime or None."""
         return cls.validate_date(v)
 
+    @field_validator("cursor", mode="after")
+    def validate_cursor(cls, v: Optional[str]) -> Optional[str]:
+        """Reject cursors whose signature does not verify.
+
+        Legacy base64 JSON cursors are accepted only while CORE_DB_ACCEPT_LEGACY_CURSORS is on.
+        """
+        if v:
+            decode_cursor(v)
+        return v
+
     @staticmethod
-    def _decode_cursor(cursor: str | dict) -> Optional[dict]:
-        """Decode a base64 encoded cursor string to a dictionary."""
+    def _decode_cursor(cursor: str | None) -> Optional[dict]:
+        """Decode a cursor string to a LastEvaluatedKey dictionary.
+
+        Raises:
+            ValueError: If the cursor fails signature verification
+        """
         if cursor is None:
             return None
-        try:
-            decoded = base64.b64decode(cursor).decode(encoding="utf-8")
-            # Don't use my parser.  My parser converts date string to datetime, which is not what we want here.
-            return json.loads(decoded)
-        except (ValueError, TypeError):
-            return None
+        return decode_cursor(cursor)
 
     @staticmethod
-    def _encode_cursor(cursor: str | None) -> str:
-        """Return the last evaluated key as a JSON string."""
+    def _encode_cursor(cursor: dict | None) -> str | None:
+        """Encode a LastEvaluatedKey dictionary as a compact signed cursor string."""
         if cursor is None:
             return None
-        json_str = json.dumps(cursor)
-        return base64.b64encode(json_str.encode(encoding="utf-8")).decode(encoding="utf-8")
+        return encode_cursor(cursor)
 
     @classmethod
     def validate_date(cls, date: Any) -> datetime | None:
@@ -1,8 +1,25 @@
-from .authorization import Authorizations, AuthorizationsModel, AuthorizationsModelFactory
-from .ratelimits import RateLimits, RateLimitsModel, RateLimitModelFactory
-from .forgotpass import ForgotPassword, ForgotPasswordModel, ForgotPasswordModelFactory
-from .actions import AuthActions, RateLimitActions, ForgotPasswordActions
-from .oauthtable import OAuthTableModel, OAuthRecord, OAuthTableModelFactory
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Authorizations": ".authorization",
+        "AuthorizationsModel": ".authorization",
+        "AuthorizationsModelFactory": ".authorization",
+        "RateLimits": ".ratelimits",
+        "RateLimitsModel": ".ratelimits",
+        "RateLimitModelFactory": ".ratelimits",
+        "ForgotPassword": ".forgotpass",
+        "ForgotPasswordModel": ".forgotpass",
+        "ForgotPasswordModelFactory": ".forgotpass",
+        "AuthActions": ".actions",
+        "RateLimitActions": ".actions",
+        "ForgotPasswordActions": ".actions",
+        "OAuthTableModel": ".oauthtable",
+        "OAuthRecord": ".oauthtable",
+        "OAuthTableModelFactory": ".oauthtable",
+    },
+)
 
 __all__ = [
     "Authorizations",
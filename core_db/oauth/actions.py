@@ -4,11 +4,15 @@ from pynamodb.exceptions import (
     DeleteError,
     DoesNotExist,
     PutError,
+    QueryError,
     ScanError,
     UpdateError,
 )
 from functools import reduce
 from pydantic import ValidationError
+from pynamodb.constants import ALL_OLD
+
+import core_logging as log
 
 from core_framework.time_utils import make_default_time
 
@@ -20,10 +24,11 @@ from ..exceptions import (
 )
 from ..models import Paginator
 from ..actions import TableActions
-from .oauthtable import OAuthRecord
-from .authorization import Authorizations
-from .ratelimits import RateLimits
-from .forgotpass import ForgotPassword
+from ..buckets import query_buckets
+from .oauthtable import OAuthRecord, record_shard, record_shards
+from .authorization import Authorizations, AuthorizationsModelFactory
+from .ratelimits import RateLimits, RateLimitModelFactory
+from .forgotpass import ForgotPassword, ForgotPasswordModelFactory
 
 
 class OAuthActions(TableActions):
@@ -51,6 +56,7 @@ class OAuthActions(TableActions):
         try:
             data: OAuthRecord = record_type(**kwargs)
             item = data.to_model(client)
+            item.record_shard = record_shard(item.record_type, item.code)
 
             # Prevent overwrite
             item.save(condition=type(item).code.does_not_exist())
@@ -68,15 +74,20 @@ class OAuthActions(TableActions):
 
     @classmethod
     def list(cls, record_type: OAuthRecord, **kwargs) -> Tuple[List[OAuthRecord], Paginator]:
-        """List authorization codes for a client.
+        """List the records of one record type for a client, one page at a time.
+
+        The OAuth table is shared by all record types; the record-type-index partitions it
+        so only rows of this type are read.  The partitions of the type (see
+        :func:`~core_db.oauth.oauthtable.record_shard`) are walked in turn, so records are
+        ordered by code within a partition only.  The index holds keys only; the records are
+        read from the table with BatchGetItem.  Rows written before the index existed are not
+        listed until :meth:`backfill_record_types` has been run.
 
         Args:
-            **kwargs: Must include client.
+            **kwargs: Must include client.  Pagination options (limit, cursor) are optional.
 
         Returns:
-            BaseModel: BaseModel object with structure:
-                - data (List[Dict]): List of authorization code dictionaries.
-                - metadata (Dict): Pagination information.
+            Tuple[List[OAuthRecord], Paginator]: The records and the paginator for the next page.
         """
         client = kwargs.get("client", kwargs.get("Client"))
 
@@ -84,19 +95,85 @@ class OAuthActions(TableActions):
             raise BadRequestException("Missing client parameter")
 
         try:
-            model_class = record_type.model_class(client)
-            result = model_class.scan()
-            data = [record_type.from_model(item) for item in result]
+            paginator = Paginator(**kwargs)
+        except (ValueError, ValidationError) as e:
+            raise BadRequestException(f"Invalid pagination parameters: {e}") from e
 
-            paginator = Paginator(total_count=len(data))
+        try:
+            model_class = record_type.model_class(client)
+            keys, next_cursor = query_buckets(
+                model_class.record_type_index,
+                record_shards(model_class.record_type.default),
+                limit=paginator.limit,
+                cursor=paginator.last_evaluated_key,
+                sort_forward=paginator.sort_forward is not False,
+                page_size=paginator.page_size,
+            )
+
+            codes = [key.code for key in keys]
+            items = {item.code: item for item in model_class.batch_get(list(dict.fromkeys(codes)))}
+            # records deleted since listing are dropped
+            data = [record_type.from_model(items[code]) for code in codes if code in items]
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = next_cursor
+            paginator.total_count = len(data)
 
             return data, paginator
 
-        except ScanError as e:
+        except QueryError as e:
             raise UnknownException(f"Failed to list authorizations: {e}") from e
         except Exception as e:
             raise UnknownException(f"Failed to list authorizations: {e}") from e
 
+    @classmethod
+    def backfill_record_types(cls, *, client: str) -> int:
+        """Set RecordType, RecordShard and TTL on OAuth rows written before the record-type-index existed.
+
+        The type of a legacy row is recognised from the attributes only that type has.
+        Rows written before the index was sharded have a RecordType and get their RecordShard.
+        Safe to run repeatedly; rows that already have a RecordShard are skipped.
+
+        Args:
+            client (str): The client identifier.
+
+        Returns:
+            int: Number of rows updated.
+
+        Raises:
+            UnknownException: If the scan or an update fails.
+        """
+        legacy = [
+            (AuthorizationsModelFactory.get_model(client), "redirect_url"),
+            (ForgotPasswordModelFactory.get_model(client), "reset_token"),
+            (RateLimitModelFactory.get_model(client), "attempts"),
+        ]
+
+        updated = 0
+        try:
+            for model_class, marker in legacy:
+                attributes = model_class.get_attributes()
+                condition = model_class.record_shard.does_not_exist() & attributes[marker].exists()
+
+                for item in model_class.scan(filter_condition=condition):
+                    type_name = model_class.record_type.default
+                    actions = [
+                        model_class.record_type.set(type_name),
+                        model_class.record_shard.set(record_shard(type_name, item.code)),
+                    ]
+                    if "expires_at" in attributes and item.expires_at is not None:
+                        actions.append(model_class.ttl.set(item.expires_at))
+                    item.update(actions=actions)
+                    updated += 1
+
+        except (ScanError, UpdateError) as e:
+            log.error("Failed to backfill OAuth record types: %s", str(e))
+            raise UnknownException(f"Failed to backfill OAuth record types: {e}") from e
+
+        log.info("Backfilled RecordType on %d OAuth records for client %s", updated, client)
+
+        return updated
+
     @classmethod
     def get(cls, record_type: OAuthRecord, **kwargs) -> OAuthRecord:
         """Get a single authorization code record.
@@ -132,6 +209,72 @@ class OAuthActions(TableActions):
         except Exception as e:
             raise UnknownException(f"Failed to retrieve authorization: {e}") from e
 
+    @classmethod
+    def consume(cls, record_type: OAuthRecord, **kwargs) -> OAuthRecord:
+        """Redeem a single-use code: delete it and return the deleted record.
+
+        One conditional ``DeleteItem`` with ``ReturnValues=ALL_OLD`` replaces a ``get``
+        followed by a ``delete``.  The condition requires the code to exist as a record of
+        this type, not to be expired or already used and, when client_id is given, to belong
+        to that client, so of two concurrent redemptions of the same code exactly one succeeds.
+
+        Args:
+            **kwargs: Must include client and code.  client_id is optional.
+
+        Returns:
+            OAuthRecord: The record as it was before it was consumed.
+
+        Raises:
+            NotFoundException: If the code does not exist (or was consumed concurrently).
+            ConflictException: If the code exists but is expired, used, issued to another client
+                or stored as another record type.
+        """
+        client = kwargs.get("client", kwargs.get("Client"))
+        code = kwargs.get("code", kwargs.get("Code"))
+        client_id = kwargs.get("client_id", kwargs.get("ClientId", kwargs.get("clientId")))
+
+        if not client:
+            raise BadRequestException("Missing client parameter")
+
+        if not code:
+            raise BadRequestException("Missing authorization code")
+
+        model_class = record_type.model_class(client)
+        attributes = model_class.get_attributes()
+
+        now = make_default_time()
+
+        conditions = [model_class.code.exists(), model_class.record_type == model_class.record_type.default]
+        if "expires_at" in attributes:
+            conditions.append(model_class.expires_at.does_not_exist() | (model_class.expires_at > now))
+        if "used" in attributes:
+            conditions.append((model_class.used == False) | model_class.used.does_not_exist())  # noqa: E712
+        if client_id and "client_id" in attributes:
+            conditions.append(model_class.client_id == client_id)
+        condition = reduce(lambda a, b: a & b, conditions)
+
+        try:
+            response = model_class._get_connection().delete_item(code, condition=condition, return_values=ALL_OLD)
+
+            return record_type.from_model(model_class.from_raw_data(response["Attributes"]))
+
+        except DeleteError as e:
+            if "ConditionalCheckFailed" not in str(e):
+                raise UnknownException(f"Failed to consume authorization: {e}") from e
+
+        except Exception as e:
+            raise UnknownException(f"Failed to consume authorization: {e}") from e
+
+        # Only a failed redemption pays for a read, to report why it failed
+        try:
+            model_class.get(code)
+        except DoesNotExist:
+            raise NotFoundException(f"Authorization code {code} not found")
+        except Exception as e:
+            raise UnknownException(f"Failed to consume authorization: {e}") from e
+
+        raise ConflictException(f"Authorization code {code} is expired, already used, issued to another client or of another type")
+
     @classmethod
     def update(cls, record_type: OAuthRecord, **kwargs) -> OAuthRecord:
         """Update an authorization record; if a field value is None, remove the attribute.
@@ -212,10 +355,14 @@ class OAuthActions(TableActions):
                             raise BadRequestException("client_id is required when marking used=True")
                         actions.append(attributes["used_at"].set(now))
                         # If marking used=True, ensure it was previously False (or not set)
-                        conditions.append((model_class.used == False) | model_class.used.does_not_exist())
+                        conditions.append((model_class.used == False) | model_class.used.does_not_exist())  # noqa: E712
                         conditions.append(model_class.client_id == client_id)
                         conditions.append(model_class.expires_at > now)
 
+            # Keep the TTL in step with the expiry
+            if values.get("expires_at") is not None and "expires_at" in attributes:
+                actions.append(model_class.ttl.set(values["expires_at"]))
+
             # Always update updated_at
             actions.append(model_class.updated_at.set(now))
 
@@ -302,6 +449,10 @@ class AuthActions(OAuthActions):
     def delete(cls, **kwargs) -> bool:
         return super().delete(record_type=Authorizations, **kwargs)
 
+    @classmethod
+    def consume(cls, **kwargs) -> Authorizations:
+        return super().consume(record_type=Authorizations, **kwargs)
+
 
 class RateLimitActions(OAuthActions):
 
@@ -355,3 +506,7 @@ class ForgotPasswordActions(OAuthActions):
     @classmethod
     def delete(cls, **kwargs) -> bool:
         return super().delete(record_type=ForgotPassword, **kwargs)
+
+    @classmethod
+    def consume(cls, **kwargs) -> ForgotPassword:
+        return super().consume(record_type=ForgotPassword, **kwargs)
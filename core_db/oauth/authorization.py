@@ -4,7 +4,7 @@ from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute, BooleanA
 from pydantic import Field
 
 from ..models import TableFactory
-from .oauthtable import OAuthTableModel, OAuthRecord
+from .oauthtable import OAuthTableModel, OAuthTableModelFactory, OAuthRecord
 
 
 class AuthorizationsModel(OAuthTableModel):
@@ -12,6 +12,7 @@ class AuthorizationsModel(OAuthTableModel):
     class Meta(OAuthTableModel.Meta):
         pass
 
+    record_type = UnicodeAttribute(null=False, attr_name="RecordType", default="authorization")
     client = UnicodeAttribute(null=False, attr_name="Client")
     client_id = UnicodeAttribute(null=False, attr_name="ClientId")
     subject = UnicodeAttribute(null=False, attr_name="Subject")
@@ -35,7 +36,11 @@ class AuthorizationsModelFactory(TableFactory):
 
     @classmethod
     def create_table(cls, client: str, wait: bool = True) -> bool:
-        return TableFactory.create_table(AuthorizationsModel, client, wait=wait)
+        created = TableFactory.create_table(AuthorizationsModel, client, wait=wait)
+        if wait:
+            # existing tables get TTL too; it needs an ACTIVE table
+            OAuthTableModelFactory.enable_ttl(client)
+        return created
 
     @classmethod
     def delete_table(cls, client: str, wait: bool = True) -> bool:
@@ -114,4 +119,7 @@ class Authorizations(OAuthRecord):
     def to_model(self, client: str) -> AuthorizationsModel:
 
         model_class = TableFactory.get_model(AuthorizationsModel, client)
-        return model_class(**self.model_dump(by_alias=False))
+        model = model_class(**self.model_dump(by_alias=False))
+        # DynamoDB deletes the row once it has expired
+        model.ttl = self.expires_at
+        return model
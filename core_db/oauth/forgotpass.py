@@ -3,7 +3,7 @@ from pynamodb.attributes import UnicodeAttribute, BooleanAttribute, UTCDateTimeA
 from pydantic import Field
 
 from ..models import TableFactory
-from .oauthtable import OAuthTableModel, OAuthRecord
+from .oauthtable import OAuthTableModel, OAuthTableModelFactory, OAuthRecord
 
 
 class ForgotPasswordModel(OAuthTableModel):
@@ -11,6 +11,7 @@ class ForgotPasswordModel(OAuthTableModel):
     class Meta(OAuthTableModel.Meta):
         pass
 
+    record_type = UnicodeAttribute(null=False, attr_name="RecordType", default="forgot-password")
     client = UnicodeAttribute(null=False, attr_name="Client")
     client_id = UnicodeAttribute(null=False, attr_name="ClientID")
     user_id = UnicodeAttribute(null=False, attr_name="UserID")
@@ -33,7 +34,11 @@ class ForgotPasswordModelFactory(TableFactory):
 
     @classmethod
     def create_table(cls, client: str, wait: bool = True) -> bool:
-        return TableFactory.create_table(ForgotPasswordModel, client, wait=wait)
+        created = TableFactory.create_table(ForgotPasswordModel, client, wait=wait)
+        if wait:
+            # existing tables get TTL too; it needs an ACTIVE table
+            OAuthTableModelFactory.enable_ttl(client)
+        return created
 
     @classmethod
     def delete_table(cls, client: str, wait: bool = True) -> bool:
@@ -89,4 +94,7 @@ class ForgotPassword(OAuthRecord):
     def to_model(self, client: str) -> ForgotPasswordModel:
 
         model_class = TableFactory.get_model(ForgotPasswordModel, client)
-        return model_class(**self.model_dump(by_alias=False))
+        model = model_class(**self.model_dump(by_alias=False))
+        # DynamoDB deletes the row once it has expired
+        model.ttl = self.expires_at
+        return model
@@ -1,15 +1,76 @@
-from pynamodb.attributes import UnicodeAttribute
+from typing import List
+import zlib
+
+from pynamodb.attributes import TTLAttribute, UnicodeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, KeysOnlyProjection
 from pydantic import Field
 
+import core_logging as log
+
 from ..models import DatabaseRecord, DatabaseTable, TableFactory
 
+RECORD_TYPE_SHARDS = 16
+"""Partitions of each record type in the record-type-index.
+
+Rate limits are written on every login attempt.  With one index partition per record type,
+those writes all land on one GSI partition, and a throttled GSI throttles the table.
+"""
+
+
+def record_shard(record_type: str, code: str) -> str:
+    """Return the record-type-index partition of a record, e.g. ``rate-limit#7``.
+
+    The shard is derived from the code (CRC-32, stable across processes), so rewriting a
+    record keeps it in the same partition.
+    """
+    return f"{record_type}#{zlib.crc32(code.encode('utf-8')) % RECORD_TYPE_SHARDS}"
+
+
+def record_shards(record_type: str) -> List[str]:
+    """Return every record-type-index partition of a record type."""
+    return [f"{record_type}#{shard}" for shard in range(RECORD_TYPE_SHARDS)]
+
+
+class OAuthRecordTypeIndex(GlobalSecondaryIndex):
+    """GSI partitioning the shared OAuth table by record type.
+
+    Authorization codes, rate limits and forgot-password records share one table;
+    listing one kind queries its partitions instead of scanning the whole table.  Each
+    record type is spread over :data:`RECORD_TYPE_SHARDS` partitions (see :func:`record_shard`)
+    and only the keys are projected, so the index copy of a write stays small.  Listings
+    read the full records from the table.
+
+    Tables created with the earlier index (hash key RecordType, all attributes projected) are
+    migrated with ``core_db.tenant.provision_global_tables(rebuild_indexes=True)``, which
+    recreates the index, followed by ``OAuthActions.backfill_record_types`` to set RecordShard
+    on existing rows.
+    """
+
+    class Meta:
+        index_name = "record-type-index"
+        projection = KeysOnlyProjection()
+
+    record_shard = UnicodeAttribute(hash_key=True, attr_name="RecordShard")
+    code = UnicodeAttribute(range_key=True, attr_name="Code")
+
 
 class OAuthTableModel(DatabaseTable):
+    """Base model of the shared OAuth table.
+
+    Every record type sets ``record_type`` and ``record_shard`` (the hash key of the
+    record-type-index) and may set ``ttl``, the table's TTL attribute, so expired rows are
+    removed by DynamoDB.
+    """
 
     class Meta(DatabaseTable.Meta):
         pass
 
     code = UnicodeAttribute(hash_key=True, attr_name="Code")
+    record_type = UnicodeAttribute(null=True, attr_name="RecordType")
+    record_shard = UnicodeAttribute(null=True, attr_name="RecordShard")
+    ttl = TTLAttribute(null=True, attr_name="TTL")
+
+    record_type_index = OAuthRecordTypeIndex()
 
 
 class OAuthTableModelFactory(TableFactory):
@@ -20,7 +81,11 @@ class OAuthTableModelFactory(TableFactory):
 
     @classmethod
     def create_table(cls, client: str, wait: bool = True) -> bool:
-        return TableFactory.create_table(OAuthTableModel, client, wait=wait)
+        created = TableFactory.create_table(OAuthTableModel, client, wait=wait)
+        if wait:
+            # existing tables get TTL too; it needs an ACTIVE table
+            cls.enable_ttl(client)
+        return created
 
     @classmethod
     def delete_table(cls, client: str, wait: bool = True) -> bool:
@@ -30,6 +95,23 @@ class OAuthTableModelFactory(TableFactory):
     def exists(cls, client: str) -> bool:
         return TableFactory.exists(OAuthTableModel, client)
 
+    @classmethod
+    def enable_ttl(cls, client: str) -> bool:
+        """Enable DynamoDB TTL on the TTL attribute of the shared OAuth table, unless it already is.
+
+        Errors are logged and ignored, as local DynamoDB may not support TTL.
+
+        Returns:
+            bool: True if TTL was enabled by this call
+        """
+        from ..tenant import _enable_ttl
+
+        try:
+            return _enable_ttl(cls.get_model(client))
+        except Exception as e:
+            log.warning("Failed to enable TTL on the OAuth table: %s", str(e))
+            return False
+
 
 class OAuthRecord(DatabaseRecord):
 
@@ -1,9 +1,9 @@
 from typing import List
-from pynamodb.attributes import NumberAttribute, ListAttribute
+from pynamodb.attributes import NumberAttribute, ListAttribute, UnicodeAttribute
 from pydantic import Field
 
 from ..models import TableFactory
-from .oauthtable import OAuthTableModel, OAuthRecord
+from .oauthtable import OAuthTableModel, OAuthTableModelFactory, OAuthRecord
 
 
 class RateLimitsModel(OAuthTableModel):
@@ -11,7 +11,9 @@ class RateLimitsModel(OAuthTableModel):
     class Meta(OAuthTableModel.Meta):
         pass
 
+    record_type = UnicodeAttribute(null=False, attr_name="RecordType", default="rate-limit")
     attempts = ListAttribute(of=NumberAttribute, null=False, attr_name="Attempts")
+    # epoch seconds, stored in the table's TTL attribute
     ttl = NumberAttribute(null=False, attr_name="TTL")
 
     # created_at is defined in DatabaseTable parent class
@@ -26,7 +28,11 @@ class RateLimitModelFactory(TableFactory):
 
     @classmethod
     def create_table(cls, client: str, wait: bool = True) -> bool:
-        return TableFactory.create_table(RateLimitsModel, client, wait=wait)
+        created = TableFactory.create_table(RateLimitsModel, client, wait=wait)
+        if wait:
+            # existing tables get TTL too; it needs an ACTIVE table
+            OAuthTableModelFactory.enable_ttl(client)
+        return created
 
     @classmethod
     def delete_table(cls, client: str, wait: bool = True) -> bool:
@@ -0,0 +1,72 @@
+"""Page-fill for filtered queries and scans.
+
+Some list actions filter rows in Python after DynamoDB has returned them (e.g. matching an
+app regex, or an AWS account id nested in a map).  Reading one ``limit``-sized page and then
+filtering returns short, often empty, pages that still carry a cursor.
+
+:func:`fill_page` instead reads the result iterator until ``limit`` rows have been accepted or
+the table (or key range) is exhausted, and returns the cursor of the exact row to resume from.
+The read is bounded by a budget of items evaluated by DynamoDB (``ScannedCount``), which is
+what read units are charged for; when the budget runs out the page is returned short with a
+cursor at the end of the last page read, so the caller can continue where it stopped.
+
+List actions enable this with ``Paginator(fill=True)``, optionally with ``max_scanned``.
+
+Examples:
+    >>> paginator = Paginator(limit=10, fill=True)
+    >>> result = model_class.query(portfolio, **paginator.get_fill_args())
+    >>> data, cursor = fill_page(result, limit=paginator.limit, accept=lambda item: item.app_regex is not None)
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+
+from pynamodb.pagination import ResultIterator
+
+DEFAULT_MAX_SCANNED = 10000
+"""Items DynamoDB may evaluate while filling one page when the paginator sets no budget."""
+
+
+def fill_page(
+    results: ResultIterator,
+    *,
+    limit: int,
+    accept: Optional[Callable[[Any], bool]] = None,
+    max_scanned: Optional[int] = None,
+) -> Tuple[List[Any], Optional[dict]]:
+    """Collect up to ``limit`` accepted rows from a query or scan.
+
+    The iterator must have been created without a ``limit`` (see ``Paginator.get_fill_args``)
+    so that it keeps reading pages.
+
+    The budget is checked after every row at the end of a DynamoDB page.  Rows removed by a
+    server-side ``filter_condition`` are never yielded, so a run of pages with no matches is
+    only interrupted once a row comes back; prefer a Python ``accept`` filter for sparse matches.
+
+    Args:
+        results (ResultIterator): The query or scan to read
+        limit (int): Maximum number of rows to return
+        accept (Callable, optional): Predicate selecting the rows to return.  All rows if None.
+        max_scanned (int, optional): Budget of items DynamoDB may evaluate.  Defaults to
+            :data:`DEFAULT_MAX_SCANNED`.
+
+    Returns:
+        tuple[list, dict | None]: The accepted rows and the LastEvaluatedKey to resume from,
+        or None if the results are exhausted.
+    """
+    budget = max_scanned or DEFAULT_MAX_SCANNED
+
+    data: List[Any] = []
+    for item in results:
+        if accept is None or accept(item):
+            data.append(item)
+            if len(data) >= limit:
+                # resume after this row, even in the middle of a page
+                return data, results.last_evaluated_key
+
+        if results.page_iter.total_scanned_count >= budget:
+            last_evaluated_key = results.last_evaluated_key
+            if last_evaluated_key is None or last_evaluated_key == results.page_iter.last_evaluated_key:
+                # end of a page: stop here rather than read another one
+                return data, last_evaluated_key
+
+    return data, None
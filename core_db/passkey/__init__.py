@@ -1,3 +1,13 @@
-from .passkeys import PassKeyActions, PassKey, PassKeysModelFactory, PassKeysModel
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PassKeyActions": ".passkeys",
+        "PassKey": ".passkeys",
+        "PassKeysModelFactory": ".passkeys",
+        "PassKeysModel": ".passkeys",
+    },
+)
 
 __all__ = ["PassKeyActions", "PassKey", "PassKeysModelFactory", "PassKeysModel"]
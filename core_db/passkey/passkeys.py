@@ -17,6 +17,7 @@ from pynamodb.exceptions import (
     DeleteError,
 )
 from pynamodb.expressions.update import Action
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 from pydantic import Field, field_validator
 
 from core_framework import from_json
@@ -32,6 +33,20 @@ from ..exceptions import (
 )
 
 
+class PassKeyIdIndex(GlobalSecondaryIndex):
+    """GSI for finding a passkey by its credential id.
+
+    A WebAuthn assertion carries only the credential id, so discoverable-credential login
+    looks the key up here instead of scanning the table.
+    """
+
+    class Meta:
+        index_name = "key-id-index"
+        projection = AllProjection()
+
+    key_id = UnicodeAttribute(hash_key=True)
+
+
 class PassKeysModel(DatabaseTable):
 
     class Meta(DatabaseTable.Meta):
@@ -61,6 +76,8 @@ class PassKeysModel(DatabaseTable):
     deleted = BooleanAttribute(null=True)
     deleted_at = UTCDateTimeAttribute(null=True)
 
+    key_id_index = PassKeyIdIndex()
+
 
 class PassKeysModelFactory(TableFactory):
 
@@ -225,6 +242,107 @@ class PassKeyActions(TableActions):
         except Exception as e:
             raise UnknownException(str(e)) from e
 
+    @classmethod
+    def get_by_key_id(cls, *, key_id: str) -> PassKey:
+        """Return the passkey with the given credential id, without knowing its user.
+
+        Args:
+            key_id (str): The WebAuthn credential id
+
+        Returns:
+            PassKey: The passkey
+
+        Raises:
+            BadRequestException: If key_id is missing
+            NotFoundException: If no passkey has this credential id
+            UnknownException: If the query fails
+        """
+        if not key_id:
+            raise BadRequestException(code=400, message="key_id is required")
+
+        model_class = PassKey.get_model()
+
+        try:
+            for item in model_class.key_id_index.query(key_id, limit=1):
+                return PassKey.from_item(item)
+
+        except QueryError as e:
+            raise UnknownException(str(e)) from e
+        except Exception as e:
+            raise UnknownException(str(e)) from e
+
+        raise NotFoundException("PassKey not found")
+
+    @classmethod
+    def record_sign_count(cls, *, user_id: str, key_id: str, sign_count: int, uv: bool = False) -> PassKey:
+        """Record a successful assertion with one conditional UpdateItem.
+
+        The stored sign count is replaced only if the new one is greater, as WebAuthn requires.
+        Authenticators that do not implement a counter always report 0; that is accepted while
+        the stored count is 0 too.  A counter that did not increase means the credential may
+        have been cloned: the key is flagged with ``clone_warning`` and a ConflictException is
+        raised so the caller can refuse the login.
+
+        Args:
+            user_id (str): The passkey owner
+            key_id (str): The WebAuthn credential id
+            sign_count (int): The signature counter from the authenticator data
+            uv (bool): Whether the assertion was user-verified
+
+        Returns:
+            PassKey: The updated passkey
+
+        Raises:
+            BadRequestException: If user_id or key_id is missing
+            ConflictException: If the sign count did not increase
+            NotFoundException: If the passkey does not exist
+            UnknownException: If the update fails
+        """
+        if not user_id or not key_id:
+            raise BadRequestException(code=400, message="user_id and key_id are required")
+
+        model_class = PassKey.get_model()
+
+        now = make_default_time()
+
+        actions: list[Action] = [
+            model_class.sign_count.set(sign_count),
+            model_class.last_used_at.set(now),
+            model_class.updated_at.set(now),
+        ]
+        if uv:
+            actions.append(model_class.last_uv_at.set(now))
+
+        if sign_count > 0:
+            counter_condition = model_class.sign_count.does_not_exist() | (model_class.sign_count < sign_count)
+        else:
+            counter_condition = model_class.sign_count.does_not_exist() | (model_class.sign_count == 0)
+
+        item = model_class(user_id=user_id, key_id=key_id)
+
+        try:
+            # ALL_NEW is returned by UpdateItem, so the item holds the stored record afterwards
+            item.update(actions=actions, condition=model_class.user_id.exists() & counter_condition)
+
+            return PassKey.from_item(item)
+
+        except UpdateError as e:
+            if "ConditionalCheckFailedException" not in str(e):
+                raise UnknownException(str(e)) from e
+
+        except Exception as e:
+            raise UnknownException(str(e)) from e
+
+        # The key is missing or its counter went backwards
+        try:
+            item.update(actions=[model_class.clone_warning.set(True)], condition=model_class.user_id.exists())
+        except UpdateError as e:
+            if "ConditionalCheckFailedException" in str(e):
+                raise NotFoundException("PassKey not found")
+            raise UnknownException(str(e)) from e
+
+        raise ConflictException("PassKey sign count did not increase")
+
     @classmethod
     def create(cls, **kwargs) -> PassKey:
 
@@ -1,5 +1,17 @@
 """Module to hold the distribution files for the core-automation database"""
 
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "StreamProcessor": ".streams",
+        "StreamRecord": ".streams",
+        "SideEffects": ".streams",
+        "MemoryCheckpoints": ".streams",
+    },
+)
+
 templates = [
     "core-automation-api-facts.yaml",
     "core-automation-api-items.yaml",
@@ -8,4 +20,4 @@ templates = [
 
 specs = ["deployspec.yaml", "teardownspec.yaml"]
 
-__all__ = ["templates", "specs"]
+__all__ = ["templates", "specs", "StreamProcessor", "StreamRecord", "SideEffects", "MemoryCheckpoints"]
@@ -1,55 +1,85 @@
-import json
-import boto3
-import os
-from boto3.dynamodb.conditions import Attr
-
-
-def handler(event, context):
-    dynamodb = boto3.resource("dynamodb")
-
-    # When removing portfolios, we need to remove apps and zones for the portfolio
-
-    apps_table = dynamodb.Table(os.environ["APPS_TABLE"])
-    zones_table = dynamodb.Table(os.environ["ZONES_TABLE"])
-
-    log_level = os.environ.get("LOG_LEVEL", "ERROR").upper()
-
-    try:
-        count = 0
-        for record in event["Records"]:
-            if record["eventName"] == "REMOVE":
-                client = record["dynamodb"]["OldImage"]["Client"]["S"]
-                portfolio = record["dynamodb"]["OldImage"]["Portfolio"]["S"]
-
-                portfolio_facts = f"{client}:{portfolio}"
-
-                response = apps_table.scan(FilterExpression=Attr("ClientPortfolio").eq(portfolio_facts))
-
-                for item in response["Items"]:
-                    app_regex = item["AppRegex"]
-                    apps_table.delete_item(Key={"ClientPortfolio": portfolio_facts, "AppRegex": app_regex})
-                    count += 1
-                    if log_level == "INFO":
-                        print(f"SUCCESS: [{portfolio_facts}], AppRegex [{app_regex}] deleted")
-
-                response = zones_table.scan(FilterExpression=Attr("ClientPortfolio").eq(portfolio_facts))
-
-                for item in response["Items"]:
-                    zone = item["Zone"]
-                    zones_table.delete_item(Key={"ClientPortfolio": portfolio_facts, "Zone": zone})
-                    count += 1
-                    if log_level == "INFO":
-                        print(f"SUCCESS: [{portfolio_facts}], zone [{zone}] deleted")
-
-                count += 1
-                if log_level == "INFO":
-                    print(f"SUCCESS: [{portfolio_facts}] deleted")
-
-        print(f"SUCCESS: {count} records deleted")
-        return {
-            "statusCode": 200,
-            "body": json.dumps(f'Success: {len(event["Records"])} events deleted'),  # Should be {count}
-        }
-    except Exception as e:
-        print(f"ERROR: {str(e)}")
-        return {"statusCode": 500, "body": json.dumps(f"Error: {str(e)}")}
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+# When removing portfolios, we need to remove apps and zones for the portfolio.
+# Both tables are keyed by ClientPortfolio, so each portfolio is one paginated query per
+# table, and matches are deleted with BatchWriteItem.  Stream records are processed in
+# parallel; failed records are reported so Lambda retries only those (deletes are idempotent).
+
+APPS_TABLE = os.environ["APPS_TABLE"]
+ZONES_TABLE = os.environ["ZONES_TABLE"]
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "ERROR").upper()
+MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "8"))
+
+_local = threading.local()
+
+
+def get_table(name):
+    # boto3 resources are not thread safe: one session per worker thread
+    if not hasattr(_local, "dynamodb"):
+        _local.dynamodb = boto3.session.Session().resource("dynamodb")
+    return _local.dynamodb.Table(name)
+
+
+def delete_children(table_name, range_key, portfolio_facts):
+    table = get_table(table_name)
+    query_args = {
+        "KeyConditionExpression": Key("ClientPortfolio").eq(portfolio_facts),
+        "ProjectionExpression": "#rk",
+        "ExpressionAttributeNames": {"#rk": range_key},
+    }
+    count = 0
+    with table.batch_writer() as batch:
+        while True:
+            response = table.query(**query_args)
+            for item in response["Items"]:
+                batch.delete_item(Key={"ClientPortfolio": portfolio_facts, range_key: item[range_key]})
+                count += 1
+                if LOG_LEVEL == "INFO":
+                    print(f"SUCCESS: [{portfolio_facts}], {range_key} [{item[range_key]}] deleted")
+            if "LastEvaluatedKey" not in response:
+                break
+            query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    return count
+
+
+def process_record(record):
+    if record["eventName"] != "REMOVE":
+        return 0
+
+    client = record["dynamodb"]["OldImage"]["Client"]["S"]
+    portfolio = record["dynamodb"]["OldImage"]["Portfolio"]["S"]
+
+    portfolio_facts = f"{client}:{portfolio}"
+
+    count = delete_children(APPS_TABLE, "AppRegex", portfolio_facts)
+    count += delete_children(ZONES_TABLE, "Zone", portfolio_facts)
+
+    if LOG_LEVEL == "INFO":
+        print(f"SUCCESS: [{portfolio_facts}] deleted")
+
+    return count + 1
+
+
+def handler(event, context):
+    records = event.get("Records", [])
+
+    count = 0
+    failures = []
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(records)))) as executor:
+        futures = [executor.submit(process_record, record) for record in records]
+        for record, future in zip(records, futures):
+            try:
+                count += future.result()
+            except Exception as e:
+                sequence_number = record["dynamodb"]["SequenceNumber"]
+                print(f"ERROR: record {sequence_number}: {str(e)}")
+                failures.append({"itemIdentifier": sequence_number})
+
+    print(f"SUCCESS: {count} records deleted, {len(failures)} of {len(records)} stream records failed")
+
+    return {"batchItemFailures": failures}
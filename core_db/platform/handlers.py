@@ -0,0 +1,75 @@
+"""Registry stream consumers built on :mod:`core_db.platform.streams`.
+
+Each processor is a Lambda entry point (``handler(event, context)``) for the stream of one
+registry table.  The client is taken from the table name in the stream ARN, so one function
+serves every client's table.
+
+    - :data:`portfolio_handler`: when a portfolio is removed, delete its apps.
+
+The handlers work on the per-client registry tables (``<client>-core-automation-portfolios``
+and so on).  There, apps are keyed by portfolio, but zones are keyed by zone name alone and
+are shared by every portfolio of the client, so removing a portfolio leaves its client's
+zones in place.  ``files/portfolio_lambda.py`` also deletes zones because it serves the
+shared tables, where zones are keyed by ``ClientPortfolio``.
+
+``core-automation-db-facts.yaml`` deploys the self-contained lambdas in ``files/``, not these
+handlers.  To use them, deploy a function packaged with ``core_db`` whose handler is
+``core_db.platform.handlers.portfolio_handler`` and map it to the stream of each client's
+portfolios table.
+
+Examples:
+    >>> from core_db.platform.handlers import portfolio_handler
+    >>> portfolio_handler(event, context)
+    {'batchItemFailures': []}
+"""
+
+from typing import Optional
+
+from ..config import get_table_name
+from ..registry.app.models import AppFactsFactory
+from ..registry.portfolio.models import PortfolioFactsModel
+from .streams import SideEffects, StreamProcessor, StreamRecord
+
+_CLIENT_MARK = "\x00"
+
+
+def client_from_table_name(table_name: Optional[str], model_class: type) -> Optional[str]:
+    """Return the client of a client-specific table name, or None if it does not match.
+
+    Args:
+        table_name (str): e.g. "acme-core-automation-portfolios"
+        model_class (type): The registry model class of the table
+
+    Returns:
+        str | None: The client, e.g. "acme"
+    """
+    if not table_name:
+        return None
+    prefix, suffix = get_table_name(model_class, _CLIENT_MARK).split(_CLIENT_MARK, 1)
+    if len(table_name) <= len(prefix) + len(suffix) or not table_name.startswith(prefix) or not table_name.endswith(suffix):
+        return None
+    return table_name[len(prefix) : len(table_name) - len(suffix)]
+
+
+portfolio_processor = StreamProcessor(PortfolioFactsModel)
+
+
+@portfolio_processor.on("REMOVE")
+def delete_portfolio_apps(record: StreamRecord, effects: SideEffects) -> None:
+    """Delete the apps of a removed portfolio.
+
+    Zones are not deleted: a client's zones are not owned by a portfolio (see the module docstring).
+    """
+    client = client_from_table_name(record.table_name, PortfolioFactsModel)
+    if client is None:
+        raise ValueError(f"Cannot determine the client of table {record.table_name}")
+
+    app_model = AppFactsFactory.get_model(client)
+    hash_key_name = app_model._hash_key_attribute().attr_name
+    range_key_name = app_model._range_key_attribute().attr_name
+
+    for app in app_model.query(record.old.portfolio, attributes_to_get=[hash_key_name, range_key_name]):
+        effects.delete(app)
+
+
+portfolio_handler = portfolio_processor
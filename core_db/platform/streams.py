@@ -0,0 +1,320 @@
+"""DynamoDB Streams consumer framework for registry side effects.
+
+Registry tables (portfolios, apps, zones) publish their changes on DynamoDB Streams, and
+Lambda consumers react with side effects: cascading deletes, cache invalidation, rollups.
+:class:`StreamProcessor` gives those consumers one pipeline:
+
+    - **Typed images**: every record's ``OldImage``/``NewImage`` is deserialized lazily into
+      the registry model class (e.g. ``PortfolioFactsModel``) with ``Model.from_raw_data``.
+    - **Client reuse**: the processor is created at module level, so PynamoDB connections
+      (cached per model class) and the worker pool are reused across invocations.
+    - **Parallel, ordered handling**: records are grouped by item key.  Groups run in
+      parallel; records of one key run in stream order, and once one fails the later records
+      of that key are not run.
+    - **Batched side effects**: handlers do not write; they request writes on a
+      :class:`SideEffects` collector.  After all handlers ran, requested writes are
+      de-duplicated (the last request per key wins) and executed with ``BatchWriteItem``
+      per table, in parallel.  Callbacks (e.g. cache invalidation) run once each.
+    - **Idempotency checkpoints**: records whose effects completed are remembered by
+      ``eventID`` in a :class:`MemoryCheckpoints` store (or any object with ``seen`` and
+      ``mark``), so a retried batch does not repeat them.
+    - **Partial batch response**: the processor returns ``{"batchItemFailures": [...]}`` with
+      the sequence numbers of failed records.  The event source mapping must enable
+      ``ReportBatchItemFailures``.
+
+Processors take plain event dicts, so recorded stream events can be replayed locally.
+
+Examples:
+    >>> processor = StreamProcessor(PortfolioFactsModel)
+    >>> @processor.on("REMOVE")
+    ... def cascade(record: StreamRecord, effects: SideEffects) -> None:
+    ...     for app in AppFactsFactory.get_model(client).query(record.old.portfolio):
+    ...         effects.delete(app)
+    >>> handler = processor  # Lambda entry point: handler(event, context)
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import json
+
+from pynamodb.models import Model
+
+import core_logging as log
+
+from ..cache import TTLCache
+
+EVENT_NAMES = ("INSERT", "MODIFY", "REMOVE")
+"""Stream event names a handler can be registered for."""
+
+DEFAULT_MAX_WORKERS = 8
+"""Key groups handled, and tables written, at the same time."""
+
+CHECKPOINT_TTL = 24 * 60 * 60.0
+"""Seconds a completed record is remembered.  Streams keep records for 24 hours."""
+
+_UNSET = object()
+
+
+class StreamRecord:
+    """One DynamoDB stream record.
+
+    Args:
+        raw (dict): The record as delivered to Lambda
+        model_class (type[Model], optional): Model the images are deserialized into
+    """
+
+    def __init__(self, raw: dict, model_class: Optional[type[Model]] = None):
+        self.raw = raw
+        self.model_class = model_class
+
+        stream = raw.get("dynamodb", {})
+        self.event_id: Optional[str] = raw.get("eventID")
+        self.event_name: Optional[str] = raw.get("eventName")
+        self.event_source_arn: Optional[str] = raw.get("eventSourceARN")
+        self.sequence_number: Optional[str] = stream.get("SequenceNumber")
+        self.keys: dict = stream.get("Keys", {})
+
+        self._old: Any = _UNSET
+        self._new: Any = _UNSET
+
+    @property
+    def table_name(self) -> Optional[str]:
+        """Name of the table the record came from, parsed from the stream ARN."""
+        # arn:aws:dynamodb:<region>:<account>:table/<name>/stream/<label>
+        if not self.event_source_arn or ":table/" not in self.event_source_arn:
+            return None
+        return self.event_source_arn.split(":table/", 1)[1].split("/", 1)[0]
+
+    @property
+    def item_key(self) -> str:
+        """Stable identity of the item the record is about, used to keep per-item order."""
+        return json.dumps(self.keys, sort_keys=True)
+
+    @property
+    def old(self) -> Any:
+        """The item before the change, as a model instance (None for INSERT)."""
+        if self._old is _UNSET:
+            self._old = self._image("OldImage")
+        return self._old
+
+    @property
+    def new(self) -> Any:
+        """The item after the change, as a model instance (None for REMOVE)."""
+        if self._new is _UNSET:
+            self._new = self._image("NewImage")
+        return self._new
+
+    def _image(self, name: str) -> Any:
+        image = self.raw.get("dynamodb", {}).get(name)
+        if image is None:
+            return None
+        if self.model_class is None:
+            return image
+        return self.model_class.from_raw_data(image)
+
+
+class SideEffects:
+    """Writes and callbacks requested by stream handlers for one record."""
+
+    def __init__(self):
+        self.writes: List[Tuple[type[Model], Hashable, str, Model]] = []
+        self.callbacks: List[Tuple[Hashable, Callable[[], Any]]] = []
+
+    def save(self, item: Model) -> None:
+        """Request a put of ``item``."""
+        self.writes.append((type(item), _item_key(item), "save", item))
+
+    def delete(self, item: Model) -> None:
+        """Request a delete of ``item`` (only its keys need to be set)."""
+        self.writes.append((type(item), _item_key(item), "delete", item))
+
+    def call(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        """Request a callback.  Callbacks with the same key run once per batch."""
+        self.callbacks.append((key, fn))
+
+
+class MemoryCheckpoints:
+    """In-process checkpoint store of completed stream records.
+
+    Lambda usually retries a batch in the same execution environment, so this skips most
+    repeated work.  Side effects must still be idempotent: a retry may land elsewhere.
+
+    Args:
+        maxsize (int): Maximum number of remembered records
+        ttl (float): Seconds a record is remembered
+    """
+
+    def __init__(self, maxsize: int = 100000, ttl: float = CHECKPOINT_TTL):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def seen(self, event_id: str) -> bool:
+        """Return True if the record completed before."""
+        return self._cache.get(event_id) is not None
+
+    def mark(self, event_id: str) -> None:
+        """Remember that the record completed."""
+        self._cache.set(event_id, True)
+
+
+StreamHandler = Callable[[StreamRecord, SideEffects], None]
+
+
+class StreamProcessor:
+    """Runs registered handlers over a DynamoDB stream batch.
+
+    Args:
+        model_class (type[Model], optional): Model the images are deserialized into.
+            Images stay raw AttributeValue dicts if None.
+        checkpoints (optional): Checkpoint store.  Defaults to a :class:`MemoryCheckpoints`.
+        max_workers (int): Key groups handled, and tables written, at the same time
+    """
+
+    def __init__(
+        self,
+        model_class: Optional[type[Model]] = None,
+        *,
+        checkpoints: Optional[Any] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.model_class = model_class
+        self.checkpoints = checkpoints if checkpoints is not None else MemoryCheckpoints()
+        self.max_workers = max_workers
+        self._handlers: Dict[str, List[StreamHandler]] = {name: [] for name in EVENT_NAMES}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="core-db-stream")
+
+    def on(self, *event_names: str) -> Callable[[StreamHandler], StreamHandler]:
+        """Register a handler for some event names (all of them if none are given).
+
+        Raises:
+            ValueError: If an event name is not INSERT, MODIFY or REMOVE
+        """
+        names = event_names or EVENT_NAMES
+        for name in names:
+            if name not in self._handlers:
+                raise ValueError(f"Unknown stream event name {name}; expected one of {', '.join(EVENT_NAMES)}")
+
+        def _register(fn: StreamHandler) -> StreamHandler:
+            for name in names:
+                self._handlers[name].append(fn)
+            return fn
+
+        return _register
+
+    def __call__(self, event: dict, context: Any = None) -> dict:
+        return self.process(event)
+
+    def process(self, event: dict) -> dict:
+        """Process a stream batch.
+
+        Args:
+            event (dict): The Lambda event with its ``Records``
+
+        Returns:
+            dict: The partial batch response ``{"batchItemFailures": [{"itemIdentifier": ...}]}``
+        """
+        records = [StreamRecord(raw, self.model_class) for raw in event.get("Records", [])]
+
+        pending = [r for r in records if not (r.event_id and self.checkpoints.seen(r.event_id))]
+        skipped = len(records) - len(pending)
+
+        # keep stream order within an item, run different items in parallel
+        groups: Dict[str, List[StreamRecord]] = {}
+        for record in pending:
+            groups.setdefault(record.item_key, []).append(record)
+
+        failed: Dict[int, StreamRecord] = {}
+        effects: Dict[int, SideEffects] = {}
+        for group_effects, group_failed in self._executor.map(self._handle_group, groups.values()):
+            effects.update(group_effects)
+            failed.update(group_failed)
+
+        for record in self._apply(pending, effects, failed):
+            failed[id(record)] = record
+
+        for record in pending:
+            if id(record) not in failed and record.event_id:
+                self.checkpoints.mark(record.event_id)
+
+        log.info(
+            "Processed %d stream records: %d skipped as already done, %d failed",
+            len(records),
+            skipped,
+            len(failed),
+        )
+
+        failures = [r for r in pending if id(r) in failed]
+        return {"batchItemFailures": [{"itemIdentifier": r.sequence_number} for r in failures]}
+
+    def _handle_group(self, group: List[StreamRecord]) -> Tuple[Dict[int, SideEffects], Dict[int, StreamRecord]]:
+        effects: Dict[int, SideEffects] = {}
+        failed: Dict[int, StreamRecord] = {}
+        for i, record in enumerate(group):
+            record_effects = SideEffects()
+            try:
+                for fn in self._handlers.get(record.event_name or "", []):
+                    fn(record, record_effects)
+            except Exception as e:
+                log.error("Stream handler failed for record %s: %s", record.sequence_number, str(e))
+                # later changes to the same item must not overtake this one
+                for later in group[i:]:
+                    failed[id(later)] = later
+                break
+            effects[id(record)] = record_effects
+        return effects, failed
+
+    def _apply(
+        self, pending: List[StreamRecord], effects: Dict[int, SideEffects], failed: Dict[int, StreamRecord]
+    ) -> List[StreamRecord]:
+        """Execute the requested side effects and return the records whose effects failed."""
+
+        # last request per (table, key) wins, in stream order
+        writes: Dict[type[Model], Dict[Hashable, Tuple[str, Model, List[StreamRecord]]]] = {}
+        callbacks: Dict[Hashable, Tuple[Callable[[], Any], List[StreamRecord]]] = {}
+        for record in pending:
+            record_effects = effects.get(id(record))
+            if record_effects is None or id(record) in failed:
+                continue
+            for model_class, key, op, item in record_effects.writes:
+                table = writes.setdefault(model_class, {})
+                owners = table[key][2] if key in table else []
+                table[key] = (op, item, owners + [record])
+            for key, fn in record_effects.callbacks:
+                owners = callbacks[key][1] if key in callbacks else []
+                callbacks[key] = (fn, owners + [record])
+
+        failures: List[StreamRecord] = []
+        for table_failures in self._executor.map(_write_table, writes.values()):
+            failures.extend(table_failures)
+
+        for fn, owners in callbacks.values():
+            try:
+                fn()
+            except Exception as e:
+                log.error("Stream side effect failed: %s", str(e))
+                failures.extend(owners)
+
+        return failures
+
+
+def _item_key(item: Model) -> Hashable:
+    hash_key, range_key = item._get_hash_range_key_serialized_values()
+    return (json.dumps(hash_key, sort_keys=True), json.dumps(range_key, sort_keys=True))
+
+
+def _write_table(requests: Dict[Hashable, Tuple[str, Model, List[StreamRecord]]]) -> List[StreamRecord]:
+    """Write one table's requests with BatchWriteItem; return the owners of a failed batch."""
+    if not requests:
+        return []
+    model_class = type(next(iter(requests.values()))[1])
+    try:
+        # PynamoDB resubmits unprocessed items itself; an exception means it gave up
+        with model_class.batch_write() as batch:
+            for op, item, _ in requests.values():
+                if op == "save":
+                    batch.save(item)
+                else:
+                    batch.delete(item)
+        return []
+    except Exception as e:
+        log.error("Stream batch write to %s failed: %s", model_class.Meta.table_name, str(e))
+        return [owner for _, _, owners in requests.values() for owner in owners]
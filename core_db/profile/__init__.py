@@ -344,7 +344,16 @@ Note:
     proper audit trails. Consider data privacy regulations when storing user information.
 """
 
-from .actions import ProfileActions
-from .model import UserProfile, ProfileModelFactory, ProfileModel
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ProfileActions": ".actions",
+        "UserProfile": ".model",
+        "ProfileModelFactory": ".model",
+        "ProfileModel": ".model",
+    },
+)
 
 __all__ = ["ProfileActions", "UserProfile", "ProfileModelFactory", "ProfileModel"]
@@ -22,12 +22,14 @@ Note:
     initialize the ProfileModel through the factory pattern.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 from pynamodb.exceptions import (
     UpdateError,
     DoesNotExist,
     PutError,
+    DeleteError,
     GetError,
     ScanError,
     QueryError,
@@ -41,6 +43,7 @@ import core_logging as log
 from core_db.models import Paginator
 
 from ..actions import TableActions
+from ..cache import TTLCache
 from ..exceptions import (
     BadRequestException,
     ConflictException,
@@ -82,6 +85,75 @@ class ProfileActions(TableActions):
         "SessionCount",
     ]
 
+    _email_cache = TTLCache(maxsize=4096, ttl=300.0)
+    """(client, email) -> ((user_id, profile_name), ...) for :meth:`resolve_email`.  Invalidated by profile writes."""
+
+    @classmethod
+    def resolve_email(cls, *, client: str, email: str) -> Tuple[str, List[str]]:
+        """Resolve an email address to the user_id and profile names that use it.
+
+        Reads keys only from the email-keys-index and caches the answer per (client, email),
+        so repeated identity resolution during login is a memory hit.  Profile writes through
+        this class invalidate the affected entries; writes from other processes are picked up
+        when the entry expires.
+
+        Args:
+            client (str): Client identifier for table isolation
+            email (str): Email address to resolve
+
+        Returns:
+            tuple[str, list[str]]: The user_id and its profile names for this email
+
+        Raises:
+            BadRequestException: If client or email is missing
+            NotFoundException: If no profile uses this email
+            ConflictException: If profiles of more than one user use this email
+            UnknownException: If the query fails
+        """
+        if not client:
+            raise BadRequestException("Client is required")
+        if not email:
+            raise BadRequestException("Email is required to resolve a user")
+
+        keys = cls._get_email_keys(client, email)
+
+        if not keys:
+            raise NotFoundException(f"No profiles found for email: {email}")
+
+        if len({user_id for user_id, _ in keys}) > 1:
+            raise ConflictException(f"Email {email} is used by more than one user")
+
+        return keys[0][0], [profile_name for _, profile_name in keys]
+
+    @classmethod
+    def _get_email_keys(cls, client: str, email: str) -> Tuple[Tuple[str, str], ...]:
+        """Return the (user_id, profile_name) keys of the profiles using an email, cached."""
+        entry = cls._email_cache.get((client, email))
+        if entry is not None:
+            return entry
+
+        model_class = UserProfile.model_class(client)
+
+        try:
+            results = model_class.email_keys_index.query(email, attributes_to_get=["UserId", "ProfileName"])
+            entry = tuple((item.user_id, item.profile_name) for item in results)
+        except QueryError as e:
+            raise UnknownException(f"Failed to resolve email {email}: {str(e)}") from e
+
+        # unknown emails are not cached so a profile created elsewhere is found immediately
+        if entry:
+            cls._email_cache.set((client, email), entry)
+
+        return entry
+
+    @classmethod
+    def _invalidate_email_cache(cls, client: str, *, email: str | None = None, user_id: str | None = None) -> None:
+        """Drop cached email resolutions affected by a profile write."""
+        if email:
+            cls._email_cache.invalidate((client, email))
+        if user_id:
+            cls._email_cache.invalidate_where(lambda key, value: key[0] == client and any(u == user_id for u, _ in value))
+
     @classmethod
     def list(
         cls, *, client: str, user_id: str | None = None, email: str | None = None, **kwargs
@@ -110,7 +182,7 @@ class ProfileActions(TableActions):
         if "only_active" in kwargs:
             only_active = str(kwargs.get("only_active", "true")).lower() == "true"
             if only_active:
-                query_args["filter_conditions"] = model_class.is_active == True
+                query_args["filter_condition"] = model_class.is_active == True
 
         query_args["attributes_to_get"] = cls.LIST_RETURN_FILEDS
 
@@ -118,8 +190,8 @@ class ProfileActions(TableActions):
 
         try:
 
-            # all profiles for this email
-            result = model_class.email_index.query(email, **query_args)
+            # all profiles for this email; the listing fields are projected into the narrow index
+            result = model_class.email_keys_index.query(email, **query_args)
 
             data = [UserProfile.from_model(item) for item in result]
 
@@ -248,6 +320,8 @@ class ProfileActions(TableActions):
             item = record.to_model(client)
             item.save(type(item).user_id.does_not_exist() & type(item).profile_name.does_not_exist())
 
+            cls._invalidate_email_cache(client, email=record.email, user_id=record.user_id)
+
             return record
 
         except PutError as e:
@@ -307,6 +381,8 @@ class ProfileActions(TableActions):
             item = model_class.get(hash_key=user_id, range_key=profile_name)
             item.delete()
 
+            cls._invalidate_email_cache(client, email=item.email, user_id=user_id)
+
             return True
 
         except DoesNotExist:
@@ -337,20 +413,18 @@ class ProfileActions(TableActions):
 
         try:
 
-            # Query all profiles for the user
-            results = model_class.query(hash_key=user_id)
+            # Query the keys of all profiles for the user
+            keys = cls._get_user_profile_keys(model_class, user_id)
 
-            if not results:
-                raise NotFoundException(f"No profiles found for user_id={user_id}")
+        except Exception as e:
+            raise UnknownException(f"Failed to delete profiles for user {user_id}: {str(e)}")
 
-            # Delete each profile
-            for item in results:
-                item.delete()
+        if not keys:
+            raise NotFoundException(f"No profiles found for user_id={user_id}")
 
-            return True
+        cls.delete_many(client=client, keys=keys)
 
-        except Exception as e:
-            raise UnknownException(f"Failed to delete profiles for user {user_id}: {str(e)}")
+        return True
 
     @classmethod
     def _delete_user_profile_by_email(cls, client: str, email: str, profile_name: str) -> bool:
@@ -364,7 +438,10 @@ class ProfileActions(TableActions):
 
             range_key_condition = model_class.profile_name == profile_name
 
-            results = model_class.email_index.query(hash_key=email, range_key_condition=range_key_condition)
+            # keys only; the profile is deleted by its primary key
+            results = model_class.email_keys_index.query(
+                hash_key=email, range_key_condition=range_key_condition, attributes_to_get=["UserId", "ProfileName"]
+            )
 
             # read the result stream
             data: list[ProfileModel] = [item for item in results]
@@ -378,7 +455,9 @@ class ProfileActions(TableActions):
                 )
 
             # Delete the single profile found
-            data[0].delete()
+            model_class(user_id=data[0].user_id, profile_name=data[0].profile_name).delete()
+
+            cls._invalidate_email_cache(client, email=email, user_id=data[0].user_id)
 
             return True
 
@@ -409,20 +488,120 @@ class ProfileActions(TableActions):
 
         try:
 
-            # Query using GSI for email index
-            results = model_class.email_index.query(email)
+            # Query keys only using the narrow email index
+            results = model_class.email_keys_index.query(email, attributes_to_get=["UserId", "ProfileName"])
+            keys = [(item.user_id, item.profile_name) for item in results]
 
-            if not results:
-                raise NotFoundException(f"No profiles found for email: {email}")
+        except Exception as e:
+            raise UnknownException(f"Failed to delete profiles for email {email}: {str(e)}")
 
-            # Delete each profile
-            for item in results:
-                item.delete()
+        if not keys:
+            raise NotFoundException(f"No profiles found for email: {email}")
 
-            return True
+        cls.delete_many(client=client, keys=keys)
+        cls._invalidate_email_cache(client, email=email)
 
-        except Exception as e:
-            raise UnknownException(f"Failed to delete profiles for email {email}: {str(e)}")
+        return True
+
+    @classmethod
+    def _get_user_profile_keys(cls, model_class, user_id: str) -> List[Tuple[str, str]]:
+        """Return the (user_id, profile_name) keys of all profiles of a user, reading keys only."""
+        results = model_class.query(user_id, attributes_to_get=["UserId", "ProfileName"])
+        return [(item.user_id, item.profile_name) for item in results]
+
+    @classmethod
+    def delete_many(cls, *, client: str, keys: List[Tuple[str, str]]) -> int:
+        """Delete profiles by primary key with batched writes.
+
+        Keys are sent to DynamoDB in BatchWriteItem requests of 25; unprocessed items are
+        retried by PynamoDB with backoff.  Keys that do not exist are ignored.
+
+        Args:
+            client (str): Client identifier for table isolation
+            keys (list[tuple[str, str]]): (user_id, profile_name) keys to delete
+
+        Returns:
+            int: Number of keys deleted
+
+        Raises:
+            BadRequestException: If client is missing
+            UnknownException: If the batch write fails
+        """
+        if not client:
+            raise BadRequestException("Client parameter is required to delete profiles")
+
+        if not keys:
+            return 0
+
+        model_class = UserProfile.model_class(client)
+
+        try:
+            with model_class.batch_write() as batch:
+                for user_id, profile_name in keys:
+                    batch.delete(model_class(user_id=user_id, profile_name=profile_name))
+
+        except (DeleteError, PutError) as e:
+            log.error(f"Failed to delete profiles: {str(e)}")
+            raise UnknownException(f"Failed to delete profiles: {str(e)}") from e
+
+        finally:
+            # some deletes may have been written even if the batch failed
+            for user_id in {user_id for user_id, _ in keys}:
+                cls._invalidate_email_cache(client, user_id=user_id)
+
+        return len(keys)
+
+    @classmethod
+    def erase_users(
+        cls,
+        *,
+        client: str,
+        user_ids: List[str] | None = None,
+        emails: List[str] | None = None,
+        max_workers: int = 8,
+    ) -> Dict[str, dict]:
+        """Delete every profile of many users, e.g. for a data erasure job.
+
+        Users are processed concurrently.  Each user's keys are read with a keys-only query
+        (by user_id, or through the email-keys-index by email) and deleted with batched writes.
+        A failure for one user does not stop the others.
+
+        Args:
+            client (str): Client identifier for table isolation
+            user_ids (list[str], optional): Users to erase by user_id
+            emails (list[str], optional): Users to erase by email address
+            max_workers (int): Number of users processed at the same time
+
+        Returns:
+            dict[str, dict]: Result per user_id or email: ``{"deleted": int, "error": str | None}``.
+            A user without profiles is reported with ``deleted`` 0 and no error.
+
+        Raises:
+            BadRequestException: If client is missing
+        """
+        if not client:
+            raise BadRequestException("Client parameter is required to erase profiles")
+
+        model_class = UserProfile.model_class(client)
+
+        def _erase(identifier: str, by_email: bool) -> dict:
+            try:
+                if by_email:
+                    results = model_class.email_keys_index.query(identifier, attributes_to_get=["UserId", "ProfileName"])
+                    keys = [(item.user_id, item.profile_name) for item in results]
+                    cls._invalidate_email_cache(client, email=identifier)
+                else:
+                    keys = cls._get_user_profile_keys(model_class, identifier)
+                return {"deleted": cls.delete_many(client=client, keys=keys), "error": None}
+            except Exception as e:
+                log.error(f"Failed to erase profiles for {identifier}: {str(e)}")
+                return {"deleted": 0, "error": str(e)}
+
+        work = [(user_id, False) for user_id in user_ids or []] + [(email, True) for email in emails or []]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(work) or 1))) as executor:
+            results = executor.map(lambda job: _erase(*job), work)
+            return {identifier: result for (identifier, _), result in zip(work, results)}
 
     @classmethod
     def _update(
@@ -516,6 +695,9 @@ class ProfileActions(TableActions):
             )
             item.refresh()
 
+            # the email may have changed: drop the user's old resolution and the new email's
+            cls._invalidate_email_cache(client, email=item.email, user_id=user_id)
+
             return UserProfile.from_model(item)
 
         except UpdateError as e:
@@ -565,42 +747,31 @@ class ProfileActions(TableActions):
 
     @classmethod
     def _get_single_profile_by_email(cls, client: str, email: str, profile_name: str) -> UserProfile:
-        """Retrieve all user profiles associated with a specific email address.
+        """Retrieve the profile with a given name for the user owning an email address.
 
         Args:
             email (str): Email address to search for
             profile_name (str): Profile name to search for
 
         Returns:
-            BaseModel: BaseModel object with structure:
-                - data (List[Dict]): List of profiles associated with the email.
+            UserProfile: The profile
+
+        Raises:
+            NotFoundException: If no profile of that name uses the email
+            BadRequestException: If profiles of that name of several users use the email
         """
         if not email or not profile_name:
             raise BadRequestException("Email and profile_name are required to retrieve profiles")
 
-        model_class = UserProfile.model_class(client)
-
-        try:
-
-            range_key_condition = model_class.profile_name == profile_name
+        # email -> user_id is usually cached; the profile itself is read by primary key
+        user_ids = [user_id for user_id, name in cls._get_email_keys(client, email) if name == profile_name]
 
-            results = model_class.email_index.query(hash_key=email, range_key_condition=range_key_condition)
+        if len(user_ids) == 0:
+            raise NotFoundException(f"No profiles found for email: {email} and profile_name: {profile_name}")
 
-            # read the result stream
-            data = [item for item in results]
-
-            if len(data) == 0:
-                raise NotFoundException(f"No profiles found for email: {email} and profile_name: {profile_name}")
-
-            if len(data) >= 1:
-                raise BadRequestException(
-                    f"Multiple profiles found for email: {email} and profile_name: {profile_name}. Please specify user_id and profile_name."
-                )
-
-            return UserProfile.from_model(data[0])
-
-        except QueryError as e:
-            raise UnknownException(f"Failed to query profiles by email {email}: {str(e)}")
+        if len(user_ids) > 1:
+            raise BadRequestException(
+                f"Multiple profiles found for email: {email} and profile_name: {profile_name}. Please specify user_id and profile_name."
+            )
 
-        except Exception as e:
-            raise UnknownException(f"Failed to load profiles by email {email}: {str(e)}")
+        return cls._get_single_profile_by_user_id(client, user_id=user_ids[0], profile_name=profile_name)
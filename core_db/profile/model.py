@@ -13,30 +13,30 @@ from pynamodb.attributes import (
     BooleanAttribute,
     NumberAttribute,
 )
-from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
+from pynamodb.indexes import GlobalSecondaryIndex, IncludeProjection
 
 from ..models import TableFactory, DatabaseTable, DatabaseRecord
 
 
-class ProfileByEmailIndex(GlobalSecondaryIndex):
-    """Global secondary index for querying profiles by email address.
+class ProfileEmailKeysIndex(GlobalSecondaryIndex):
+    """Narrow global secondary index for resolving an email address to its profiles.
 
-    Allows efficient lookup of user profiles by email address across
-    all users and profile names. Multiple profiles may be returned
-    for the same email if a user has multiple roles/profiles.
+    Projects the keys (Email, ProfileName, UserId) plus the few attributes shown in
+    profile listings, so identity resolution and listings by email read small index rows
+    instead of full profile documents.
+
+    It replaces ``email-index``, which projected every attribute.  Existing profiles tables
+    still maintain that index on every write until ``core_db.tenant.provision_tenant(client,
+    rebuild_indexes=True)`` deletes it.
 
     Attributes:
         email (str): User's email address as hash key for the GSI
-
-    Note:
-        Uses AllProjection to include all profile attributes in the index
-        for efficient queries without additional table reads.
-        Multiple profiles can have the same email address.
+        profile_name (str): Profile name as range key for the GSI
     """
 
     class Meta:
-        index_name = "email-index"
-        projection = AllProjection()
+        index_name = "email-keys-index"
+        projection = IncludeProjection(["IsActive", "CreatedAt", "UpdatedAt", "LastLogin", "SessionCount"])
         billing_mode = "PAY_PER_REQUEST"
 
     email = UnicodeAttribute(hash_key=True, attr_name="Email")
@@ -98,8 +98,8 @@ class ProfileModel(DatabaseTable):
             Tracked separately per profile for analytics. Default: 0
         is_active (bool, optional): Whether this specific profile is active and enabled.
             Allows disabling specific roles without affecting others. Default: True
-        email_index (ProfileByEmailIndex): Global secondary index for email-based queries.
-            Returns all profiles associated with an email address.
+        email_keys_index (ProfileEmailKeysIndex): Narrow global secondary index for email
+            resolution and listings; projects keys and listing attributes only.
         user_profiles_index (ProfileByUserIdIndex): Local secondary index for user-based queries.
             Returns all profiles for a specific user.
 
@@ -169,7 +169,7 @@ class ProfileModel(DatabaseTable):
     is_active = BooleanAttribute(attr_name="IsActive", default=True)
 
     # Indexes
-    email_index = ProfileByEmailIndex()
+    email_keys_index = ProfileEmailKeysIndex()
 
     def update_last_login(self) -> None:
         """Update the last login timestamp to current UTC time for this profile.
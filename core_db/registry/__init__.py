@@ -264,15 +264,21 @@ Note:
     crucial for effective automated deployment and resource management.
 """
 
-from .client.actions import ClientActions
-from .zone.actions import ZoneActions
-from .portfolio.actions import PortfolioActions
-from .app.actions import AppActions
-
-from .client.models import ClientFact
-from .zone.models import ZoneFact
-from .portfolio.models import PortfolioFact
-from .app.models import AppFact
+from ..lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClientActions": ".client.actions",
+        "ZoneActions": ".zone.actions",
+        "PortfolioActions": ".portfolio.actions",
+        "AppActions": ".app.actions",
+        "ClientFact": ".client.models",
+        "ZoneFact": ".zone.models",
+        "PortfolioFact": ".portfolio.models",
+        "AppFact": ".app.models",
+    },
+)
 
 __all__ = [
     "ClientActions",
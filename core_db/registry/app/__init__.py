@@ -232,7 +232,16 @@ Note:
     to accommodate application naming conventions. Always test patterns before production use.
 """
 
-from .models import AppFact, AppFactsFactory, AppFactsModel
-from .actions import AppActions
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AppFact": ".models",
+        "AppFactsFactory": ".models",
+        "AppFactsModel": ".models",
+        "AppActions": ".actions",
+    },
+)
 
 __all__ = ["AppFact", "AppActions", "AppFactsFactory", "AppFactsModel"]
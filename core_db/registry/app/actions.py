@@ -64,6 +64,7 @@ from ...exceptions import (
 )
 
 from ...models import Paginator
+from ...pagefill import fill_page
 from ..actions import RegistryAction
 from .models import AppFact
 
@@ -80,6 +81,18 @@ def _is_app_id_taken(client: str, portfolio: str, candidate: str) -> bool:
         return True
 
 
+def _taken_app_ids(client: str, portfolio: str, candidates: List[str]) -> set[str]:
+    """Return the candidates that already exist in the portfolio, with one BatchGetItem."""
+    try:
+        Model = AppFact.model_class(client)
+        keys = [(portfolio, candidate) for candidate in dict.fromkeys(candidates)]
+        return {item.app for item in Model.batch_get(keys, attributes_to_get=["Portfolio", "App"])}
+    except Exception as e:
+        # Probe one at a time, which is conservative on unexpected errors
+        log.warning(f"Batch lookup of app slugs failed, probing one at a time: {str(e)}")
+        return {candidate for candidate in candidates if _is_app_id_taken(client, portfolio, candidate)}
+
+
 def generate_app_slug(
     name: str,
     *,
@@ -103,20 +116,17 @@ def generate_app_slug(
             b = b[: max_length - len(sfx)]
         return b + sfx
 
-    # no collision
+    # no collision (the common case: one GetItem)
     if not _is_app_id_taken(client, portfolio, base):
         return base
 
-    # deterministic short hash first
+    # deterministic short hash first, then a numeric counter; all checked with one batch read
     digest = hashlib.blake2b(f"{portfolio}:{source}".encode("utf-8"), digest_size=3).hexdigest()
-    cand = with_suffix(base, digest)
-    if not _is_app_id_taken(client, portfolio, cand):
-        return cand
-
-    # fallback numeric counter
-    for i in range(2, 50):
-        cand = with_suffix(base, str(i))
-        if not _is_app_id_taken(client, portfolio, cand):
+    candidates = [with_suffix(base, digest)] + [with_suffix(base, str(i)) for i in range(2, 50)]
+
+    taken = _taken_app_ids(client, portfolio, candidates)
+    for cand in candidates:
+        if cand not in taken:
             return cand
 
     # last resort: longer hash
@@ -237,30 +247,37 @@ class AppActions(RegistryAction):
 
         model_class = AppFact.model_class(client)
 
-        try:
+        def _matches(item) -> bool:
+            try:
+                # Check if the provided value matches the stored regex pattern
+                if item.app_regex and re.match(item.app_regex, app_regex):
+                    log.debug(
+                        "Value '%s' matches pattern '%s'",
+                        app_regex,
+                        item.app_regex,
+                    )
+                    return True
+            except re.error:
+                # Skip invalid regex patterns
+                log.warning("Invalid regex pattern in app_regex: %s", item.app_regex)
+            return False
 
-            query_kwargs = paginator.get_query_args()
+        try:
 
-            result = model_class.query(portfolio, **query_kwargs)
+            if paginator.fill:
+                result = model_class.query(portfolio, **paginator.get_fill_args())
+                items, last_evaluated_key = fill_page(
+                    result, limit=paginator.limit, accept=_matches, max_scanned=paginator.max_scanned
+                )
+            else:
+                result = model_class.query(portfolio, **paginator.get_query_args())
+                items = [item for item in result if _matches(item)]
+                last_evaluated_key = getattr(result, "last_evaluated_key", None)
 
-            data = []
-            for item in result:
-                app_fact = AppFact.from_model(item)
-                try:
-                    # Check if the provided value matches the stored regex pattern
-                    if app_fact.app_regex and re.match(app_fact.app_regex, app_regex):
-                        data.append(app_fact)
-                        log.debug(
-                            "Value '%s' matches pattern '%s'",
-                            app_regex,
-                            app_fact.app_regex,
-                        )
-                except re.error:
-                    # Skip invalid regex patterns
-                    log.warning("Invalid regex pattern in app_regex: %s", app_fact.app_regex)
-                    continue
+            data = [AppFact.from_model(item) for item in items]
 
-            paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
+            paginator.cursor = None
+            paginator.last_evaluated_key = last_evaluated_key
             paginator.total_count = len(data)
 
             log.info("Successfully filtered %d apps matching name: %s", len(data), app_regex)
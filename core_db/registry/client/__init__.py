@@ -242,7 +242,16 @@ Note:
     Client changes may affect related portfolios, applications, and deployments.
 """
 
-from .models import ClientFact, ClientFactsFactory, ClientFactsModel
-from .actions import ClientActions
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClientFact": ".models",
+        "ClientFactsFactory": ".models",
+        "ClientFactsModel": ".models",
+        "ClientActions": ".actions",
+    },
+)
 
 __all__ = ["ClientFact", "ClientActions", "ClientFactsFactory", "ClientFactsModel"]
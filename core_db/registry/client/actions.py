@@ -18,6 +18,7 @@ from pynamodb.exceptions import (
     DoesNotExist,
     PutError,
     DeleteError,
+    QueryError,
     ScanError,
     UpdateError,
 )
@@ -28,6 +29,7 @@ import core_logging as log
 from core_framework.time_utils import make_default_time
 
 from ...models import Paginator
+from ...cache import TTLCache
 from ...exceptions import (
     ConflictException,
     NotFoundException,
@@ -40,6 +42,9 @@ from .models import ClientFact
 
 class ClientActions(RegistryAction):
 
+    _client_id_cache = TTLCache(maxsize=256, ttl=60.0)
+    """client_id -> ClientFact for :meth:`get_by_client_id`.  Cleared by every client write."""
+
     @classmethod
     def list(cls, *, client_id: str | None = None, **kwargs) -> Tuple[list[ClientFact], Paginator]:
 
@@ -88,19 +93,26 @@ class ClientActions(RegistryAction):
         model_class = ClientFact.model_class()
 
         try:
-            # Retrieve the client item from the database
-            items = model_class.scan(
-                filter_condition=(model_class.client_id == client_id),
-                **paginator.get_scan_args(),
-            )
+            # Keyed query on the client-id index; every row returned matches, so pages are always full
+            results = model_class.client_id_index.query(client_id, **paginator.get_query_args())
+            items = list(results)
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = getattr(results, "last_evaluated_key", None)
+            paginator.total_count = len(items)
 
             # Validate and convert PynamoDB item to ClientFact instance
             return [ClientFact.from_model(item) for item in items], paginator
 
-        except ScanError as e:
+        except QueryError as e:
             if "ResourceNotFoundException" in str(e):
                 raise NotFoundException(f"Client with client_id '{client_id}' not found") from e
 
+            if "specified index" in str(e):
+                # tables created before the index existed get it from core_db.tenant.provision_global_tables()
+                log.error(f"The clients table has no client-id-index; run provision_global_tables(): {str(e)}")
+                raise UnknownException(f"Failed to retrieve client '{client_id}'") from e
+
             log.error(f"GetError while retrieving client by client_id '{client_id}': {str(e)}")
             raise UnknownException(f"Failed to retrieve client '{client_id}'") from e
 
@@ -108,6 +120,40 @@ class ClientActions(RegistryAction):
             log.error(f"Error while retrieving client by client_id '{client_id}': {str(e)}")
             raise UnknownException(f"Failed to retrieve client '{client_id}'") from e
 
+    @classmethod
+    def get_by_client_id(cls, client_id: str) -> ClientFact:
+        """Resolve a client by its OAuth client_id.
+
+        Uses the client-id index and keeps the answer in memory for a minute, so repeated
+        token requests for the same client do not read the table.  Clients that are not found
+        are not cached.
+
+        Args:
+            client_id (str): OAuth client identifier
+
+        Returns:
+            ClientFact: The client
+
+        Raises:
+            BadRequestException: If client_id is missing
+            NotFoundException: If no client has this client_id
+            UnknownException: If the query fails
+        """
+        if not client_id:
+            raise BadRequestException("client_id is required to load ClientFact")
+
+        record = cls._client_id_cache.get(client_id)
+        if record is not None:
+            return record.model_copy(deep=True)
+
+        data, _ = cls._list_by_client_id(client_id, limit=1)
+        if not data:
+            raise NotFoundException(f"Client with client_id '{client_id}' not found")
+
+        cls._client_id_cache.set(client_id, data[0])
+
+        return data[0].model_copy(deep=True)
+
     @classmethod
     def get(cls, client: str) -> ClientFact:
 
@@ -145,6 +191,8 @@ class ClientActions(RegistryAction):
             item = record.to_model()
             item.save(model_class.client.does_not_exist())
 
+            cls._client_id_cache.clear()
+
             return record
 
         except PutError as e:
@@ -172,6 +220,8 @@ class ClientActions(RegistryAction):
             item = model_class(client)
             item.delete(condition=model_class.client.exists())
 
+            cls._client_id_cache.clear()
+
             return True
 
         except DeleteError as e:
@@ -225,6 +275,8 @@ class ClientActions(RegistryAction):
             item.update(actions=actions, condition=model_class.client.exists())
             item.refresh()
 
+            cls._client_id_cache.clear()
+
             return ClientFact.from_model(item)
 
         except (ValueError, ValidationError) as e:
@@ -18,10 +18,27 @@ from typing import Optional, Type, List
 from pydantic import BaseModel, Field, ConfigDict
 
 from pynamodb.attributes import UnicodeAttribute, ListAttribute, MapAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 
 from ...models import TableFactory, DatabaseRecord, DatabaseTable
 
 
+class ClientIdIndex(GlobalSecondaryIndex):
+    """Global Secondary Index for resolving a client by its OAuth client_id.
+
+    Sparse: clients without a ClientId are not in the index.
+
+    Attributes:
+        client_id (str): OAuth client identifier (hash key)
+    """
+
+    class Meta:
+        index_name = "client-id-index"
+        projection = AllProjection()
+
+    client_id = UnicodeAttribute(hash_key=True, attr_name="ClientId")
+
+
 class ClientFactsModel(DatabaseTable):
 
     class Meta(DatabaseTable.Meta):
@@ -75,6 +92,9 @@ class ClientFactsModel(DatabaseTable):
     # Resource naming and scoping
     scope = UnicodeAttribute(null=True, attr_name="Scope")
 
+    # Indexes
+    client_id_index = ClientIdIndex()
+
     def __repr__(self) -> str:
         return f"<ClientFactsModel(client={self.client},name={self.client_name})>"
 
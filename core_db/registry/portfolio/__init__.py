@@ -334,20 +334,25 @@ Note:
     multi-tenant operations and team collaboration.
 """
 
-from .models import (
-    PortfolioFact,
-    PortfolioFactsFactory,
-    PortfolioFactsModel,
-    ContactFacts,
-    ApproverFacts,
-    OwnerFacts,
-    ProjectFacts,
-    ContactFactsItem,
-    ApproverFactsItem,
-    OwnerFactsItem,
-    ProjectFactsItem,
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "PortfolioFact": ".models",
+        "PortfolioFactsFactory": ".models",
+        "PortfolioFactsModel": ".models",
+        "ContactFacts": ".models",
+        "ApproverFacts": ".models",
+        "OwnerFacts": ".models",
+        "ProjectFacts": ".models",
+        "ContactFactsItem": ".models",
+        "ApproverFactsItem": ".models",
+        "OwnerFactsItem": ".models",
+        "ProjectFactsItem": ".models",
+        "PortfolioActions": ".actions",
+    },
 )
-from .actions import PortfolioActions
 
 __all__ = [
     "PortfolioFact",
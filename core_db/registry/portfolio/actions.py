@@ -76,6 +76,7 @@ from ...exceptions import (
 )
 
 from ...models import Paginator
+from ...counts import count_cache_key, count_scan, resolve_count, start_count
 from ..actions import RegistryAction
 from .models import PortfolioFact
 
@@ -101,13 +102,17 @@ class PortfolioActions(RegistryAction):
 
             scan_args = paginator.get_scan_args()
 
+            count = None
+            if paginator.with_total:
+                count = start_count(count_cache_key(client, model_class, "scan"), count_scan, model_class)
+
             result = model_class.scan(**scan_args)
 
             # Convert PynamoDB items to simple dictionaries
             data = [PortfolioFact.from_model(item) for item in result]
 
             paginator.last_evaluated_key = getattr(result, "last_evaluated_key", None)
-            paginator.total_count = len(data)
+            paginator.total_count = resolve_count(count, len(data))
 
             log.info("Successfully retrieved %d portfolios for client: %s", len(data), client)
 
@@ -367,22 +367,27 @@ Note:
     scalable, and cost-effective multi-environment operations.
 """
 
-from .models import (
-    ZoneFact,
-    ZoneFactsFactory,
-    ZoneFactsModel,
-    AccountFacts,
-    RegionFacts,
-    KmsFacts,
-    SecurityAliasFacts,
-    ProxyFacts,
-    AccountFactsItem,
-    RegionFactsItem,
-    ProxyFactsItem,
-    KmsFactsItem,
-    SecurityAliasFactsItem,
+from ...lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ZoneFact": ".models",
+        "ZoneFactsFactory": ".models",
+        "ZoneFactsModel": ".models",
+        "AccountFacts": ".models",
+        "RegionFacts": ".models",
+        "KmsFacts": ".models",
+        "SecurityAliasFacts": ".models",
+        "ProxyFacts": ".models",
+        "AccountFactsItem": ".models",
+        "RegionFactsItem": ".models",
+        "ProxyFactsItem": ".models",
+        "KmsFactsItem": ".models",
+        "SecurityAliasFactsItem": ".models",
+        "ZoneActions": ".actions",
+    },
 )
-from .actions import ZoneActions
 
 __all__ = [
     "ZoneFact",
@@ -76,6 +76,8 @@ from pynamodb.expressions.update import Action
 import core_framework as util
 
 from ...models import Paginator
+from ...counts import count_cache_key, count_scan, resolve_count, start_count
+from ...pagefill import fill_page
 from ...exceptions import (
     ConflictException,
     UnknownException,
@@ -120,12 +122,16 @@ class ZoneActions(RegistryAction):
 
             scan_args = paginator.get_scan_args()
 
+            count = None
+            if paginator.with_total:
+                count = start_count(count_cache_key(client, model_class, "scan"), count_scan, model_class)
+
             results = model_class.scan(**scan_args)
 
             result = [ZoneFact.from_model(item) for item in results]
 
             paginator.last_evaluated_key = getattr(results, "last_evaluated_key", None)
-            paginator.total_count = len(result)
+            paginator.total_count = resolve_count(count, len(result))
 
             log.info("Found %d zones for client: %s", len(result), client)
 
@@ -145,18 +151,24 @@ class ZoneActions(RegistryAction):
         try:
             log.debug("Querying zones for client: %s", client)
 
-            query_args = paginator.get_scan_args()
+            def _matches(item) -> bool:
+                return isinstance(item, model_class) and item.account_facts.aws_account_id == aws_account_id
 
             # retrieve ALL zones, then we will see if it has the given AWS account ID
-            results = model_class.scan(**query_args)
-
-            data = []
-            for item in results:
-                if not isinstance(item, model_class) or item.account_facts.aws_account_id != aws_account_id:
-                    continue
-                data.append(ZoneFact.from_model(item))
-
-            paginator.last_evaluated_key = getattr(results, "last_evaluated_key", None)
+            if paginator.fill:
+                results = model_class.scan(**paginator.get_fill_args(scan=True))
+                items, last_evaluated_key = fill_page(
+                    results, limit=paginator.limit, accept=_matches, max_scanned=paginator.max_scanned
+                )
+            else:
+                results = model_class.scan(**paginator.get_scan_args())
+                items = [item for item in results if _matches(item)]
+                last_evaluated_key = getattr(results, "last_evaluated_key", None)
+
+            data = [ZoneFact.from_model(item) for item in items]
+
+            paginator.cursor = None
+            paginator.last_evaluated_key = last_evaluated_key
             paginator.total_count = len(data)
 
             log.info("Found %d zones for client: %s", len(data), client)
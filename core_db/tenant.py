@@ -0,0 +1,407 @@
+"""Provisioning and teardown of a client's (tenant's) tables.
+
+Onboarding a client creates one table per tenant-aware model: profiles, auth-audit, zones,
+portfolios, apps, items and events.  Creating them one at a time with
+``*Factory.create_table(client, wait=True)`` waits for each table to become ACTIVE before
+the next one starts.  :func:`provision_tenant` issues every ``CreateTable`` at once and
+waits for all of them together, so onboarding takes about as long as the slowest table.
+
+Provisioning is idempotent and also brings existing tables up to date:
+
+    - Missing tables are created with their GSIs (from the PynamoDB model).
+    - GSIs that the model declares but an existing table lacks are added with
+      ``UpdateTable``, one at a time per table (DynamoDB builds one new index at a time).
+    - TTL is enabled on the table's TTL attribute when it is not already: the model's
+      ``TTLAttribute``, or ``Meta.ttl_attribute`` for models that keep epoch seconds in a
+      plain ``NumberAttribute``.
+    - GSIs whose key schema or projection differs from the model's are logged.  DynamoDB
+      cannot change an index in place, so with ``rebuild_indexes=True`` they are deleted and
+      created again.  Queries on such an index fail until it is rebuilt and backfilled, so run
+      it in a maintenance window.  Without the rebuild, an index that projects more than the
+      model declares (e.g. ``ALL`` instead of ``INCLUDE``) keeps working; it just stores more.
+    - GSIs that the table has but the model no longer declares are logged, and deleted with
+      ``rebuild_indexes=True``.  Every write keeps maintaining such an index until it is gone.
+
+:func:`teardown_tenant` deletes the same tables concurrently.
+
+The clients, OAuth and passkeys tables are shared by all clients.  :func:`provision_global_tables`
+creates or updates them the same way; run it on every upgrade, as it adds the GSIs that newer
+releases query (``client-id-index``, ``record-type-index``, ``key-id-index``) to existing tables.
+
+Examples:
+    >>> provision_tenant("acme")
+    {'acme-core-automation-profiles': 'created', 'acme-core-automation-items': 'created', ...}
+
+    >>> provision_tenant("acme")
+    {'acme-core-automation-profiles': 'exists', ...}
+
+    >>> provision_tenant("acme", rebuild_indexes=True)
+    {'acme-core-automation-auth-audit': 'updated', ...}
+
+    >>> teardown_tenant("acme")
+    {'acme-core-automation-profiles': 'deleted', ...}
+
+    >>> provision_global_tables()
+    {'core-automation-clients': 'updated', 'core-automation-oauth': 'exists', ...}
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from pynamodb.constants import ACTIVE, TABLE_STATUS
+from pynamodb.exceptions import TableDoesNotExist
+from pynamodb.models import Model
+
+import core_logging as log
+
+from .exceptions import BadRequestException, UnknownException
+from .models import TableFactory, _key_schema, _projection
+
+TABLE_POLL_INTERVAL = 2.0
+"""Seconds between DescribeTable calls while waiting for tables."""
+
+DEFAULT_TIMEOUT = 900.0
+"""Seconds provision_tenant and teardown_tenant wait for all tables."""
+
+DEFAULT_MAX_WORKERS = 8
+"""Tables created or deleted at the same time."""
+
+CREATED = "created"
+UPDATED = "updated"
+EXISTS = "exists"
+DELETED = "deleted"
+MISSING = "missing"
+
+
+def tenant_models() -> List[type[Model]]:
+    """Return the base models of the tables every client has.
+
+    Models that share a table (e.g. the item types) are represented by their base model.
+    """
+    # imported on use so that importing this module does not load every model package
+    from .audit.audit import AuthAuditModel
+    from .event.models import EventModel
+    from .item.models import ItemModel
+    from .profile.model import ProfileModel
+    from .registry.app.models import AppFactsModel
+    from .registry.portfolio.models import PortfolioFactsModel
+    from .registry.zone.models import ZoneFactsModel
+
+    return [ProfileModel, AuthAuditModel, ZoneFactsModel, PortfolioFactsModel, AppFactsModel, ItemModel, EventModel]
+
+
+def global_models() -> List[type[Model]]:
+    """Return the base models of the tables shared by all clients."""
+    from .oauth.oauthtable import OAuthTableModel
+    from .passkey.passkeys import PassKeysModel
+    from .registry.client.models import ClientFactsModel
+
+    return [ClientFactsModel, OAuthTableModel, PassKeysModel]
+
+
+def provision_tenant(
+    client: str,
+    *,
+    wait: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rebuild_indexes: bool = False,
+) -> Dict[str, str]:
+    """Create or update all tables of a client concurrently.
+
+    Args:
+        client (str): The client identifier
+        wait (bool): Wait until every table is ACTIVE.  Adding GSIs to existing tables and
+            enabling TTL need an ACTIVE table, so they are skipped when False.
+        timeout (float): Seconds to wait for all tables
+        max_workers (int): Tables provisioned at the same time
+        rebuild_indexes (bool): Delete and recreate GSIs whose key schema or projection differs
+            from the model, and delete GSIs the model does not declare
+
+    Returns:
+        dict[str, str]: Table name -> "created", "updated" (GSIs or TTL added) or "exists"
+
+    Raises:
+        BadRequestException: If client is missing
+        UnknownException: If any table could not be provisioned (after all others finished)
+    """
+    if not client:
+        raise BadRequestException("Client identifier is required")
+
+    deadline = time.monotonic() + timeout
+    return _for_each_table(
+        tenant_models(),
+        client,
+        lambda model_class: _provision_table(model_class, wait, deadline, rebuild_indexes),
+        max_workers,
+        "provision",
+    )
+
+
+def provision_global_tables(
+    *,
+    wait: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rebuild_indexes: bool = False,
+) -> Dict[str, str]:
+    """Create or update the tables shared by all clients concurrently.
+
+    Args:
+        wait (bool): Wait until every table is ACTIVE.  Adding GSIs to existing tables and
+            enabling TTL need an ACTIVE table, so they are skipped when False.
+        timeout (float): Seconds to wait for all tables
+        max_workers (int): Tables provisioned at the same time
+        rebuild_indexes (bool): Delete and recreate GSIs whose key schema or projection differs
+            from the model, and delete GSIs the model does not declare
+
+    Returns:
+        dict[str, str]: Table name -> "created", "updated" (GSIs or TTL added) or "exists"
+
+    Raises:
+        UnknownException: If any table could not be provisioned (after all others finished)
+    """
+    deadline = time.monotonic() + timeout
+    return _for_each_table(
+        global_models(),
+        None,
+        lambda model_class: _provision_table(model_class, wait, deadline, rebuild_indexes),
+        max_workers,
+        "provision",
+    )
+
+
+def teardown_tenant(
+    client: str,
+    *,
+    wait: bool = True,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, str]:
+    """Delete all tables of a client concurrently.
+
+    Args:
+        client (str): The client identifier
+        wait (bool): Wait until every table is gone
+        timeout (float): Seconds to wait for all tables
+        max_workers (int): Tables deleted at the same time
+
+    Returns:
+        dict[str, str]: Table name -> "deleted" or "missing"
+
+    Raises:
+        BadRequestException: If client is missing
+        UnknownException: If any table could not be deleted (after all others finished)
+    """
+    if not client:
+        raise BadRequestException("Client identifier is required")
+
+    deadline = time.monotonic() + timeout
+    return _for_each_table(
+        tenant_models(), client, lambda model_class: _teardown_table(model_class, wait, deadline), max_workers, "teardown"
+    )
+
+
+def _for_each_table(
+    base_models: List[type[Model]],
+    client: Optional[str],
+    fn: Callable[[type[Model]], str],
+    max_workers: int,
+    action: str,
+) -> Dict[str, str]:
+    tables: Dict[str, type[Model]] = {}
+    for base_model in base_models:
+        model_class = TableFactory.get_model(base_model, client)
+        tables.setdefault(model_class.Meta.table_name, model_class)
+
+    results: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tables)))) as executor:
+        futures = {name: executor.submit(fn, model_class) for name, model_class in tables.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                log.error("Failed to %s table %s: %s", action, name, str(e))
+                errors[name] = str(e)
+
+    for base_model in base_models:
+        TableFactory.invalidate(base_model, client)
+
+    scope = f"client {client}" if client else "global tables"
+
+    if errors:
+        raise UnknownException(f"Failed to {action} tables for {scope}: {errors}")
+
+    log.info("%s %s complete", scope.capitalize(), action, details=results)
+
+    return results
+
+
+def _describe(model_class: type[Model]) -> Optional[Dict[str, Any]]:
+    try:
+        return model_class._get_connection().describe_table()
+    except TableDoesNotExist:
+        return None
+
+
+def _is_active(description: Dict[str, Any]) -> bool:
+    if description.get(TABLE_STATUS) != ACTIVE:
+        return False
+    return all(index.get("IndexStatus") == ACTIVE for index in description.get("GlobalSecondaryIndexes", []))
+
+
+def _wait_active(model_class: type[Model], deadline: float) -> Dict[str, Any]:
+    while True:
+        description = _describe(model_class)
+        if description is not None and _is_active(description):
+            return description
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Table {model_class.Meta.table_name} is not ACTIVE")
+        time.sleep(TABLE_POLL_INTERVAL)
+
+
+def _provision_table(model_class: type[Model], wait: bool, deadline: float, rebuild_indexes: bool = False) -> str:
+    status = EXISTS
+    if _describe(model_class) is None:
+        # TTL is enabled below, once the table is ACTIVE
+        model_class.create_table(wait=False, ignore_update_ttl_errors=True)
+        status = CREATED
+
+    if not wait:
+        return status
+
+    description = _wait_active(model_class, deadline)
+
+    if _drop_changed_indexes(model_class, description, deadline, rebuild_indexes):
+        # the dropped indexes are created again, with the model's projection, below
+        description = _wait_active(model_class, deadline)
+        status = UPDATED
+
+    if _add_missing_indexes(model_class, description, deadline) and status == EXISTS:
+        status = UPDATED
+
+    if _enable_ttl(model_class) and status == EXISTS:
+        status = UPDATED
+
+    return status
+
+
+def _drop_changed_indexes(model_class: type[Model], description: Dict[str, Any], deadline: float, rebuild: bool) -> bool:
+    live = {index["IndexName"]: index for index in description.get("GlobalSecondaryIndexes", [])}
+    declared = {index["index_name"]: index for index in model_class._get_schema()["global_secondary_indexes"]}
+    changed = [name for name, index in declared.items() if name in live and _index_changed(index, live[name])]
+    # indexes the model no longer declares still cost a write per item
+    removed = [name for name in live if name not in declared]
+    if not changed and not removed:
+        return False
+
+    table_name = model_class.Meta.table_name
+    if not rebuild:
+        if changed:
+            log.warning("Table %s has indexes whose key schema or projection differs from the model: %s", table_name, changed)
+        if removed:
+            log.warning("Table %s has indexes the model does not declare: %s", table_name, removed)
+        return False
+
+    botocore_client = model_class._get_connection().connection.client
+
+    for name in changed + removed:
+        if name in removed:
+            log.warning("Deleting index %s of table %s, which the model does not declare", name, table_name)
+        else:
+            log.warning("Deleting index %s of table %s to rebuild it as the model declares it", name, table_name)
+        botocore_client.update_table(TableName=table_name, GlobalSecondaryIndexUpdates=[{"Delete": {"IndexName": name}}])
+
+        # DynamoDB runs one index update at a time; wait until the index is gone
+        while any(index["IndexName"] == name for index in (_describe(model_class) or {}).get("GlobalSecondaryIndexes", [])):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Index {name} of table {table_name} was not deleted")
+            time.sleep(TABLE_POLL_INTERVAL)
+
+    return True
+
+
+def _index_changed(declared: Dict[str, Any], live: Dict[str, Any]) -> bool:
+    if _projection(declared["projection"]) != _projection(live.get("Projection", {})):
+        return True
+    return "KeySchema" in live and _key_schema(declared["key_schema"]) != _key_schema(live["KeySchema"])
+
+
+def _add_missing_indexes(model_class: type[Model], description: Dict[str, Any], deadline: float) -> bool:
+    existing = {index["IndexName"] for index in description.get("GlobalSecondaryIndexes", [])}
+    missing = [index for index in model_class._get_schema()["global_secondary_indexes"] if index["index_name"] not in existing]
+    if not missing:
+        return False
+
+    botocore_client = model_class._get_connection().connection.client
+    provisioned = description.get("BillingModeSummary", {}).get("BillingMode", "PROVISIONED") == "PROVISIONED"
+
+    for index in missing:
+        create: Dict[str, Any] = {
+            "IndexName": index["index_name"],
+            "KeySchema": sorted(index["key_schema"], key=lambda k: k["KeyType"]),
+            "Projection": index["projection"],
+        }
+        if provisioned:
+            create["ProvisionedThroughput"] = {
+                "ReadCapacityUnits": index["provisioned_throughput"].get("ReadCapacityUnits", 1),
+                "WriteCapacityUnits": index["provisioned_throughput"].get("WriteCapacityUnits", 1),
+            }
+
+        log.info("Adding index %s to table %s", index["index_name"], model_class.Meta.table_name)
+        botocore_client.update_table(
+            TableName=model_class.Meta.table_name,
+            AttributeDefinitions=index["attribute_definitions"],
+            GlobalSecondaryIndexUpdates=[{"Create": create}],
+        )
+        # DynamoDB builds one new index at a time
+        _wait_active(model_class, deadline)
+
+    return True
+
+
+def _ttl_attribute_name(model_class: type[Model]) -> Optional[str]:
+    ttl_attribute = model_class._ttl_attribute()
+    if ttl_attribute is not None:
+        return ttl_attribute.attr_name
+    return getattr(model_class.Meta, "ttl_attribute", None)
+
+
+def _enable_ttl(model_class: type[Model]) -> bool:
+    attribute_name = _ttl_attribute_name(model_class)
+    if not attribute_name:
+        return False
+
+    botocore_client = model_class._get_connection().connection.client
+    table_name = model_class.Meta.table_name
+
+    current = botocore_client.describe_time_to_live(TableName=table_name).get("TimeToLiveDescription", {})
+    if current.get("TimeToLiveStatus") in ("ENABLED", "ENABLING"):
+        return False
+
+    botocore_client.update_time_to_live(
+        TableName=table_name,
+        TimeToLiveSpecification={"Enabled": True, "AttributeName": attribute_name},
+    )
+    return True
+
+
+def _teardown_table(model_class: type[Model], wait: bool, deadline: float) -> str:
+    try:
+        model_class._get_connection().delete_table()
+    except TableDoesNotExist:
+        return MISSING
+    except Exception as e:
+        # DeleteTable of a missing table surfaces as a TableError wrapping ResourceNotFound
+        if "ResourceNotFound" not in str(e):
+            raise
+        return MISSING
+
+    while wait and _describe(model_class) is not None:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Table {model_class.Meta.table_name} was not deleted")
+        time.sleep(TABLE_POLL_INTERVAL)
+
+    return DELETED
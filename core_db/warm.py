@@ -0,0 +1,131 @@
+"""Warm-up for Lambda functions.
+
+The first request of a fresh Lambda execution environment pays for work that later requests
+get for free: creating the client-specific model classes (:meth:`TableFactory.get_model`),
+creating the botocore client of each table connection, the TLS handshake with DynamoDB and
+the first registry reads.  :func:`warmup` does that work during the init phase, in parallel,
+and reports how long each step took.
+
+For every (client, table) pair, warm-up creates the model class and describes the table.
+The DescribeTable call opens the connection that later requests reuse and fills the table
+status cache used by ``TableFactory.exists``.  OAuth client ids given in ``facts`` are
+resolved into the client-id cache of ``ClientActions``, so the first token request does not
+query the clients table.
+
+Call it at module level of the Lambda handler, so it runs during init:
+
+Examples:
+    >>> import core_db
+    >>> report = core_db.warmup(clients=["acme"], facts=["acme-web"])
+    >>> report["elapsed"]
+    0.412
+    >>> report["tasks"]["table acme-core-automation-items"]
+    {'status': 'ok', 'seconds': 0.198}
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
+
+from pynamodb.models import Model
+
+import core_logging as log
+
+from .models import TableFactory
+
+DEFAULT_BUDGET = 8.0
+"""Seconds warm-up may take.  Lambda allows 10 seconds for the init phase."""
+
+DEFAULT_MAX_WORKERS = 16
+"""Warm-up tasks run at the same time."""
+
+
+def warmup(
+    clients: Optional[List[Optional[str]]] = None,
+    tables: Optional[List[type[Model]]] = None,
+    facts: Optional[List[str]] = None,
+    *,
+    budget: float = DEFAULT_BUDGET,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, Any]:
+    """Preload models, connections and hot registry reads.
+
+    Warm-up never raises: failed tasks are reported and logged, and tasks still running when
+    the budget is spent are reported as "timeout" and left to finish in the background.
+
+    Args:
+        clients (list[str], optional): Clients whose tables are warmed
+        tables (list[type[Model]], optional): Base model classes (e.g. ``ItemModel``), warmed
+            for each client.  Defaults to every client's tables (see
+            :func:`core_db.tenant.tenant_models`) plus the global tables (see
+            :func:`core_db.tenant.global_models`).
+        facts (list[str], optional): OAuth client ids to resolve into the client-id cache
+        budget (float): Seconds to wait for the tasks
+        max_workers (int): Tasks run at the same time
+
+    Returns:
+        dict: ``{"elapsed": seconds, "tasks": {name: {"status": ..., "seconds": ...}}}`` where
+        status is "ok", "timeout" or "error: <message>"
+    """
+    start = time.perf_counter()
+
+    pairs = []
+    if tables is None:
+        from .tenant import global_models, tenant_models
+
+        pairs.extend((base_model, None) for base_model in global_models())
+        pairs.extend((base_model, client) for client in clients or [] for base_model in tenant_models())
+    else:
+        pairs.extend((base_model, client) for client in clients or [None] for base_model in tables)
+
+    tasks: Dict[str, Callable[[], Any]] = {}
+    for base_model, client in pairs:
+        # model classes are created here, before the pool starts, under the factory lock
+        model_class = TableFactory.get_model(base_model, client)
+        tasks.setdefault(f"table {model_class.Meta.table_name}", _describe_task(base_model, client))
+
+    for client_id in facts or []:
+        tasks[f"facts {client_id}"] = _client_id_task(client_id)
+
+    report: Dict[str, Dict[str, Any]] = {}
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))), thread_name_prefix="core-db-warmup")
+    try:
+        futures = {executor.submit(_timed, fn): name for name, fn in tasks.items()}
+        done, _ = wait(futures, timeout=max(0.0, budget - (time.perf_counter() - start)))
+        for future, name in futures.items():
+            report[name] = future.result() if future in done else {"status": "timeout", "seconds": None}
+    finally:
+        # do not hold up init for tasks that ran over the budget
+        executor.shutdown(wait=False)
+
+    elapsed = round(time.perf_counter() - start, 3)
+    failed = [name for name, result in report.items() if result["status"] != "ok"]
+    if failed:
+        log.warning("Warm-up finished in %ss; %d of %d tasks did not complete", elapsed, len(failed), len(report), details=report)
+    else:
+        log.info("Warm-up finished in %ss", elapsed, details=report)
+
+    return {"elapsed": elapsed, "tasks": report}
+
+
+def _timed(fn: Callable[[], Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        fn()
+        status = "ok"
+    except Exception as e:
+        status = f"error: {str(e)}"
+    return {"status": status, "seconds": round(time.perf_counter() - start, 3)}
+
+
+def _describe_task(base_model: type[Model], client: Optional[str]) -> Callable[[], Any]:
+    return lambda: TableFactory.describe(base_model, client, refresh=True)
+
+
+def _client_id_task(client_id: str) -> Callable[[], Any]:
+    def _resolve() -> Any:
+        from .registry.client.actions import ClientActions
+
+        return ClientActions.get_by_client_id(client_id)
+
+    return _resolve
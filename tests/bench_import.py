@@ -0,0 +1,67 @@
+"""Import-time benchmark for Lambda cold starts.
+
+Each case runs in a fresh interpreter, as a Lambda cold start would, and reports the median
+wall time of its import statement and the number of modules it loaded.  The "eager" case
+resolves every route in ``actions_routes``, which is what importing ``core_db.dbhelper`` cost
+before package imports were made lazy; the other cases are what callers pay now.
+
+Run from the repository root (DynamoDB is not contacted)::
+
+    python -m tests.bench_import
+    python -m tests.bench_import --repeat 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "eager (all actions_routes resolved)": "import core_db.dbhelper as h\nfor route in h.actions_routes:\n    h.actions_routes[route]",
+    "import core_db.dbhelper": "import core_db.dbhelper",
+    "from core_db.event import EventActions": "from core_db.event import EventActions",
+    "from core_db.registry.zone import ZoneActions": "from core_db.registry.zone import ZoneActions",
+    "import core_db": "import core_db",
+}
+
+_RUNNER = """
+import sys, time
+before = len(sys.modules)
+start = time.perf_counter()
+exec(compile({statement!r}, "<bench>", "exec"))
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules) - before)
+"""
+
+
+def measure(statement: str, repeat: int) -> tuple[float, int]:
+    """Return the median seconds and the module count of ``statement`` in fresh interpreters."""
+    times = []
+    modules = 0
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _RUNNER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        modules = int(output[1])
+    return statistics.median(times), modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per case")
+    args = parser.parse_args()
+
+    results = {name: measure(statement, args.repeat) for name, statement in CASES.items()}
+    baseline, _ = next(iter(results.values()))
+
+    print(f"{'case':<50} {'median ms':>10} {'modules':>8} {'vs eager':>9}")
+    for name, (seconds, modules) in results.items():
+        print(f"{name:<50} {seconds * 1000:>10.1f} {modules:>8} {seconds / baseline:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
+import hashlib
+
 import pytest
 from unittest.mock import patch
 
 import core_framework as util
 
-from core_db.registry.app.actions import AppActions
+from core_db.registry.app.actions import AppActions, generate_app_slug
 from core_db.registry.app.models import AppFact
 from core_db.exceptions import (
     BadRequestException,
@@ -733,3 +735,36 @@ def test_validation_enforcement_methods():
 
     # Clean up
     AppActions.delete(client=client, portfolio=response.portfolio, app=response.app)
+
+
+def test_generate_app_slug_skips_taken_candidates():
+    """Slugs of colliding names are the first free candidate, in the documented order."""
+
+    portfolio = "slug-test"
+    digest = hashlib.blake2b(f"{portfolio}:Billing".encode("utf-8"), digest_size=3).hexdigest()
+
+    def create(app: str):
+        AppActions.create(
+            client=client,
+            portfolio=portfolio,
+            app=app,
+            app_regex="billing-.*",
+            name="Billing",
+            zone="slug-zone",
+            region="us-east-1",
+        )
+
+    assert generate_app_slug("Billing", client=client, portfolio=portfolio) == "billing"
+
+    created = ["billing"]
+    create("billing")
+    assert generate_app_slug("Billing", client=client, portfolio=portfolio) == f"billing-{digest}"
+
+    for app in [f"billing-{digest}", "billing-2", "billing-3"]:
+        created.append(app)
+        create(app)
+    assert generate_app_slug("Billing", client=client, portfolio=portfolio) == "billing-4"
+
+    # Clean up
+    for app in created:
+        AppActions.delete(client=client, portfolio=portfolio, app=app)
@@ -183,6 +183,22 @@ def test_get_client_facts():
     assert response.client_status == "active"
 
 
+def test_get_client_by_client_id():
+    """Test resolving a client through the client-id index."""
+
+    clients, _ = ClientActions.list(client_id="ACME001")
+    assert [c.client for c in clients] == ["acme-corp"]
+
+    response: ClientFact = ClientActions.get_by_client_id("ACME001")
+    assert response.client == "acme-corp"
+
+    # served from the cache the second time
+    assert ClientActions.get_by_client_id("ACME001").client == "acme-corp"
+
+    with pytest.raises(NotFoundException):
+        ClientActions.get_by_client_id("NO-SUCH-CLIENT")
+
+
 def test_list_client_facts():
     """Test listing all client facts with pagination."""
     client_facts, paginator = ClientActions.list(limit=3)
@@ -23,6 +23,7 @@ from core_framework.status import (
 import core_framework as util
 
 from core_db.event import EventActions, EventItem
+from core_db.event import actions as event_actions
 from core_db.models import Paginator
 
 from .bootstrap import *  # noqa: F403, F401
@@ -411,3 +412,61 @@ def test_list_events_with_date_range():
     assert len(list_response) == 3, "Should have only the three events in the date range"
 
     print("✅ Date range list test passed")
+
+
+def test_list_all_events_before_backfill():
+    # An event written before EventDay existed is still listed, by scan, until the backfill is recorded
+    event_actions._event_days_backfilled.clear()
+    legacy = EventActions.create(client=client, prn="prn:portfolio:app:branch:build:1.2.1", timestamp="2024-01-15T16:00:00Z")
+    model_class = EventItem.model_class(client)
+    model_class(prn=legacy.prn, timestamp=legacy.timestamp).update(actions=[model_class.event_day.remove()])
+
+    assert EventActions.event_days_backfilled(client) is False
+
+    prns = set()
+    cursor = None
+    while True:
+        page, paginator = EventActions.list(
+            client=client, earliest_time="2024-01-15T15:35:45.123456Z", latest_time="2024-01-15T23:59:59Z", cursor=cursor
+        )
+        prns.update(event.prn for event in page)
+        cursor = paginator.cursor
+        if not cursor:
+            break
+
+    assert legacy.prn in prns
+
+
+def test_list_all_events_by_event_day():
+    assert EventActions.backfill_event_days(client=client) >= 1
+    assert EventActions.event_days_backfilled(client) is True
+
+    # The window spans two day buckets; events are created by earlier tests in this module
+    EventActions.create(client=client, prn="prn:portfolio:app:branch:build:1.2.0", timestamp="2024-01-16T00:05:00Z", status="ok")
+
+    earliest_date = "2024-01-15T15:35:45.123456Z"
+    latest_date = "2024-01-16T23:59:59Z"
+
+    events: List[EventItem] = []
+    cursor = None
+    while True:
+        page, paginator = EventActions.list(
+            client=client,
+            earliest_time=earliest_date,
+            latest_time=latest_date,
+            sort="descending",
+            limit=2,
+            cursor=cursor,
+        )
+        assert len(page) <= 2
+        events.extend(page)
+        cursor = paginator.cursor
+        if not cursor:
+            break
+
+    timestamps = [event.timestamp for event in events]
+    assert timestamps == sorted(timestamps, reverse=True), "Events should be newest first across day buckets"
+    assert timestamps[0] == datetime.fromisoformat("2024-01-16T00:05:00+00:00")
+    assert all(ts >= datetime.fromisoformat(earliest_date) for ts in timestamps)
+
+    print("✅ Event day index list test passed")
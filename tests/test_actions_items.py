@@ -1,6 +1,10 @@
+from datetime import datetime, timedelta, timezone
+
 import core_framework as util
+from core_framework.status import INIT, DEPLOY_IN_PROGRESS
 
 from core_db.event import EventItem
+from core_db.item import ItemActions
 from core_db.item.portfolio import PortfolioActions, PortfolioItem
 from core_db.item.app import AppActions, AppItem
 from core_db.item.branch import BranchActions, BranchItem
@@ -123,6 +127,62 @@ def test_portfolio_items_list():
     print(f"✅ Listed portfolios, found: {len(response)} items")
 
 
+def test_portfolio_items_list_by_created_day():
+    """List items created in a time window through the created-day index."""
+
+    latest_time = datetime.now(timezone.utc)
+    earliest_time = latest_time - timedelta(hours=1)
+
+    response, paginator = PortfolioActions.list(
+        client=client, earliest_time=earliest_time, latest_time=latest_time, sort="descending"
+    )
+
+    assert any(item.prn == "prn:test-portfolio" for item in response)
+    assert all(earliest_time <= item.created_at <= latest_time for item in response)
+
+    created = [item.created_at for item in response]
+    assert created == sorted(created, reverse=True)
+
+
+def test_portfolio_items_backfill_created_days():
+    """Items written before the created-day index existed are listed once backfilled."""
+
+    portfolio = PortfolioActions.get(client=client, prn="prn:test-portfolio")
+    model_class = PortfolioItem.model_class(client)
+    model_class(parent_prn=portfolio.parent_prn, prn=portfolio.prn).update(actions=[model_class.created_day.remove()])
+
+    latest_time = datetime.now(timezone.utc)
+    earliest_time = latest_time - timedelta(hours=1)
+
+    response, _ = PortfolioActions.list(client=client, earliest_time=earliest_time, latest_time=latest_time)
+    assert all(item.prn != "prn:test-portfolio" for item in response)
+
+    assert ItemActions.backfill_created_days(client=client) >= 1
+    assert ItemActions.backfill_created_days(client=client) == 0
+
+    response, _ = PortfolioActions.list(client=client, earliest_time=earliest_time, latest_time=latest_time)
+    assert any(item.prn == "prn:test-portfolio" for item in response)
+
+
+def test_portfolio_items_list_with_total():
+    """A total count covers every matching item, not just the page."""
+
+    latest_time = datetime.now(timezone.utc)
+    earliest_time = latest_time - timedelta(hours=1)
+
+    response, paginator = PortfolioActions.list(client=client, limit=1, with_total=True)
+    assert len(response) == 1
+    assert paginator.total_count >= len(response)
+
+    everything, _ = PortfolioActions.list(client=client, limit=1000)
+    assert paginator.total_count == len(everything)
+
+    response, paginator = PortfolioActions.list(
+        client=client, earliest_time=earliest_time, latest_time=latest_time, limit=1, with_total=True
+    )
+    assert paginator.total_count >= 1
+
+
 def test_portfolio_items_update():
     """Update portfolio item - depends on list test."""
     assert test_data["portfolio"] is not None, "Portfolio create and list tests must run first"
@@ -401,6 +461,78 @@ def test_build_items_update():
     print(f"✅ Updated build: {build_prn}")
 
 
+def test_build_items_list_by_status():
+    """List builds by status through the sparse status index - depends on update test."""
+    assert test_data["build"] is not None, "Build create and update tests must run first"
+
+    build_prn = "prn:test-portfolio:test-app:main:1-0-0"
+    initial_status = test_data["build"].status
+
+    response, paginator = BuildActions.list_by_status(client=client, status=initial_status)
+    assert any(item.prn == build_prn for item in response)
+
+    BuildActions.patch(client=client, prn=build_prn, status=DEPLOY_IN_PROGRESS)
+
+    response, paginator = BuildActions.list_by_status(client=client, status=DEPLOY_IN_PROGRESS)
+    assert [item.prn for item in response] == [build_prn]
+    assert paginator.total_count == 1
+
+    response, paginator = BuildActions.list_by_status(client=client, status=initial_status)
+    assert all(item.prn != build_prn for item in response), "Build should have left its previous status"
+
+    # components share the table but not the status key
+    response, paginator = ComponentActions.list_by_status(client=client, status=DEPLOY_IN_PROGRESS)
+    assert all(item.item_type == "component" for item in response)
+
+
+def test_build_items_backfill_status_keys():
+    """Builds written before the status index existed are listed by status once backfilled."""
+
+    build_prn = "prn:test-portfolio:test-app:main:9"
+    build = BuildActions.create(client=client, prn=build_prn, status=INIT)
+
+    model_class = BuildItem.model_class(client)
+    model_class(parent_prn=build.parent_prn, prn=build_prn).update(actions=[model_class.status_key.remove()])
+
+    response, _ = BuildActions.list_by_status(client=client, status=INIT)
+    assert all(item.prn != build_prn for item in response)
+
+    assert ItemActions.backfill_status_keys(client=client) >= 1
+    assert ItemActions.backfill_status_keys(client=client) == 0
+
+    response, _ = BuildActions.list_by_status(client=client, status=INIT)
+    assert any(item.prn == build_prn for item in response)
+
+    BuildActions.delete(client=client, prn=build_prn)
+
+
+def test_branch_latest_build_rollup():
+    """Build status changes roll up into the branch LatestBuild summary and never regress."""
+
+    branch = BranchActions.create(client=client, portfolio="test-portfolio", app="test-app", name="rollup")
+
+    build_prn = f"{branch.prn}:7"
+    BuildActions.create(client=client, prn=build_prn, status=INIT)
+    build = BuildActions.patch(client=client, prn=build_prn, status=DEPLOY_IN_PROGRESS)
+
+    latest = BranchActions.get(client=client, prn=branch.prn).latest_build
+    assert latest is not None
+    assert latest.prn == build_prn
+    assert latest.status == DEPLOY_IN_PROGRESS
+
+    # an older status change arriving late is rejected
+    stale = build.updated_at - timedelta(minutes=5)
+    assert BranchActions.update_latest_build(client=client, prn=build_prn, status=INIT, updated_at=stale) is False
+    assert BranchActions.get(client=client, prn=branch.prn).latest_build.status == DEPLOY_IN_PROGRESS
+
+    # a full branch update does not clear the system maintained summary
+    BranchActions.update(client=client, prn=branch.prn, name="rollup")
+    assert BranchActions.get(client=client, prn=branch.prn).latest_build.prn == build_prn
+
+    BuildActions.delete(client=client, prn=build_prn)
+    BranchActions.delete(client=client, prn=branch.prn)
+
+
 def test_build_items_delete():
     """Delete build item - depends on update test."""
     assert test_data["build"] is not None, "Build create, list, and update tests must run first"
@@ -129,6 +129,25 @@ def test_get_profiles_by_email():
     assert paginator.total_count == 2
 
 
+def test_resolve_email():
+    """Test resolving an email to a user through the narrow email index and cache."""
+
+    user_id, profile_names = ProfileActions.resolve_email(client=client, email="user4@gmail.com")
+    assert user_id == "test_single_user789"
+    assert profile_names == ["work"]
+
+    # user1@gmail.com is used by two users
+    with pytest.raises(ConflictException):
+        ProfileActions.resolve_email(client=client, email="user1@gmail.com")
+
+    # ...but the profile name tells them apart
+    result: UserProfile = ProfileActions.get(client=client, email="user1@gmail.com", profile_name="personal")
+    assert result.user_id == "test_single_user456"
+
+    with pytest.raises(NotFoundException):
+        ProfileActions.resolve_email(client=client, email="nonexistent@example.com")
+
+
 def test_get_active_profiles_by_user():
     """Test getting only active profiles for a user."""
     user_id = "test_single_user123"
@@ -408,6 +427,32 @@ def test_delete_user_by_user_id():
         ProfileActions.list(client=client, user_id=user_id)
 
 
+def test_erase_users():
+    """Test bulk erasure of many users with batched deletes."""
+    for i in range(3):
+        for profile_name in ("default", "admin"):
+            ProfileActions.create(
+                client=client,
+                user_id=f"erase_user{i}",
+                profile_name=profile_name,
+                email=f"erase{i}@gmail.com",
+                display_name=f"Erase {i}",
+            )
+
+    results = ProfileActions.erase_users(
+        client=client, user_ids=["erase_user0", "erase_user1", "nonexistent_user"], emails=["erase2@gmail.com"]
+    )
+
+    assert results["erase_user0"] == {"deleted": 2, "error": None}
+    assert results["erase_user1"] == {"deleted": 2, "error": None}
+    assert results["erase2@gmail.com"] == {"deleted": 2, "error": None}
+    assert results["nonexistent_user"] == {"deleted": 0, "error": None}
+
+    for i in range(3):
+        with pytest.raises(NotFoundException):
+            ProfileActions.list(client=client, user_id=f"erase_user{i}")
+
+
 def test_delete_nonexistent_profile():
     """Test deleting non-existent profile."""
     with pytest.raises(NotFoundException):
@@ -0,0 +1,142 @@
+import pytest
+
+import core_framework as util
+
+from core_db.archive import (
+    ArchiveActions,
+    encode_chunk,
+    decode_chunk,
+    CHUNK_FORMAT_NDJSON,
+    CHUNK_FORMAT_COLUMNAR,
+)
+from core_db.event import EventActions, EventItem
+from core_db.exceptions import BadRequestException, UnknownException
+
+from .bootstrap import *  # noqa: F403, F401
+
+client = util.get_client() or "core"
+
+prn = "prn:archive:app:branch:build"
+
+rows = [
+    {"Prn": "prn:a", "Status": "ok", "Message": "first"},
+    {"Prn": "prn:b", "Status": "error"},
+    {"Prn": "prn:c", "Details": {"nested": [1, 2]}},
+]
+
+
+@pytest.mark.parametrize("chunk_format", [CHUNK_FORMAT_NDJSON, CHUNK_FORMAT_COLUMNAR])
+def test_chunk_round_trip(chunk_format):
+
+    body = encode_chunk(rows, chunk_format)
+
+    assert body[:2] == b"\x1f\x8b"  # gzip magic number
+    assert decode_chunk(body, chunk_format) == rows
+
+
+def test_archive_bad_request(tmp_path):
+
+    with pytest.raises(BadRequestException):
+        ArchiveActions.archive_items(client=client, item_type="unknown", archive_url=str(tmp_path))
+
+    with pytest.raises(BadRequestException):
+        ArchiveActions.archive_events(client=client, chunk_format="parquet", archive_url=str(tmp_path))
+
+
+def test_archive_events_resume_and_delete(bootstrap_dynamo, tmp_path):
+
+    for minute in range(10):
+        EventActions.create(client=client, prn=prn, timestamp=f"2020-01-01T00:{minute:02d}:00Z", status="ok")
+
+    # a recent event outside the range must survive
+    EventActions.create(client=client, prn=prn, timestamp="2024-01-01T00:00:00Z", status="ok")
+
+    archive_url = str(tmp_path)
+    window = {"earliest_time": "2020-01-01T00:00:00Z", "latest_time": "2020-12-31T23:59:59Z"}
+
+    # first invocation stops early, second resumes from the persisted cursor
+    cursor = ArchiveActions.archive_events(
+        client=client, chunk_size=4, max_chunks=1, delete=True, archive_url=archive_url, **window
+    )
+    assert cursor.completed is False
+
+    persisted = ArchiveActions.load_cursor(client=client, kind="events", archive_url=archive_url)
+    assert persisted is not None
+    assert persisted.chunk_index == cursor.chunk_index
+
+    cursor = ArchiveActions.archive_events(client=client, chunk_size=4, delete=True, archive_url=archive_url, **window)
+    assert cursor.completed is True
+    assert cursor.record_count == 10
+    assert cursor.deleted_count == 10
+
+    archived = ArchiveActions.read_chunks(client=client, kind="events", archive_url=archive_url)
+    assert sorted(row["Timestamp"] for row in archived)[0].startswith("2020-01-01T00:00:00")
+    assert all(row["Prn"] == prn for row in archived)
+
+    remaining, _ = EventActions.list(client=client, prn=prn)
+    assert len(remaining) == 1
+
+
+def test_archive_interrupted_delete_keeps_chunks(bootstrap_dynamo, tmp_path, monkeypatch):
+
+    interrupted_prn = "prn:archive:app:branch:interrupted"
+    for minute in range(10):
+        EventActions.create(client=client, prn=interrupted_prn, timestamp=f"2019-01-01T00:{minute:02d}:00Z", status="ok")
+
+    archive_url = str(tmp_path)
+    window = {"earliest_time": "2019-01-01T00:00:00Z", "latest_time": "2019-12-31T23:59:59Z"}
+
+    def crash(model_class, keys):
+        raise UnknownException("Failed to delete archived rows")
+
+    # the job dies after its first chunk is written but before the rows are deleted
+    with monkeypatch.context() as m:
+        m.setattr(ArchiveActions, "_batch_delete", classmethod(crash))
+        with pytest.raises(UnknownException):
+            ArchiveActions.archive_events(client=client, chunk_size=4, delete=True, archive_url=archive_url, **window)
+
+    persisted = ArchiveActions.load_cursor(client=client, kind="events", archive_url=archive_url)
+    assert persisted.chunk_index == 1
+    assert persisted.deleted_count == 0
+
+    cursor = ArchiveActions.archive_events(client=client, chunk_size=4, delete=True, archive_url=archive_url, **window)
+    assert cursor.completed is True
+    assert len(cursor.chunks) == len(set(cursor.chunks)) == 3
+
+    # the first chunk was not overwritten: every row is archived exactly once
+    archived = ArchiveActions.read_chunks(client=client, kind="events", archive_url=archive_url)
+    assert len({row["Timestamp"] for row in archived}) == len(archived) == 10
+
+    # the rows of the interrupted chunk were archived but not deleted
+    remaining, _ = EventActions.list(client=client, prn=interrupted_prn)
+    assert len(remaining) == 4
+
+    # a restarted job picks them up without reusing the earlier chunk names
+    cursor = ArchiveActions.archive_events(
+        client=client, chunk_size=4, delete=True, restart=True, archive_url=archive_url, **window
+    )
+    assert cursor.chunks == ["part-000003.ndjson.gz"]
+    assert cursor.deleted_count == 4
+
+
+def test_archive_events_without_event_day(bootstrap_dynamo, tmp_path):
+
+    # events written before EventDay existed are archived too
+    legacy_prn = "prn:archive:app:branch:legacy"
+    model_class = EventItem.model_class(client)
+    for minute in range(3):
+        event = EventActions.create(client=client, prn=legacy_prn, timestamp=f"2018-01-01T00:{minute:02d}:00Z", status="ok")
+        model_class(prn=event.prn, timestamp=event.timestamp).update(actions=[model_class.event_day.remove()])
+
+    window = {"earliest_time": "2018-01-01T00:00:00Z", "latest_time": "2018-12-31T23:59:59Z"}
+    cursor = ArchiveActions.archive_events(client=client, chunk_size=2, archive_url=str(tmp_path), **window)
+
+    assert cursor.completed is True
+    assert cursor.record_count == 3
+    assert len(cursor.chunks) == 2
+
+
+def test_archive_rejects_unknown_options(tmp_path):
+
+    with pytest.raises(TypeError):
+        ArchiveActions.archive_events(client=client, chunksize=10, archive_url=str(tmp_path))
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import core_framework as util
+
+from core_db.audit import AuthAuditActions, AuthAuditModelFactory, AuthAuditSchemas, make_audit_pk, make_audit_sk
+
+from .bootstrap import *  # noqa: F403, F401
+
+client = util.get_client() or "core"
+
+start = datetime(2024, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def audit_records():
+
+    host = util.get_dynamodb_host()
+
+    assert host == "http://localhost:8000", "DYNAMODB_HOST must be set to http://localhost:8000"
+
+    if AuthAuditModelFactory.exists(client):
+        AuthAuditModelFactory.delete_table(client, wait=True)
+    AuthAuditModelFactory.create_table(client, wait=True)
+
+    records = []
+    for hour in range(3):
+        record = AuthAuditSchemas(
+            pk=make_audit_pk(client, "bob"),
+            sk=make_audit_sk(start + timedelta(hours=hour)),
+            actor_user_id="alice@example.com",
+            change_type="permissions.update" if hour < 2 else "roles.update",
+            role_additions=[f"role-{hour}"],
+            grant_additions=[{"resource": "prn:app", "action": "read"}],
+            before_hash=f"before-{hour}",
+            after_hash=f"after-{hour}",
+            request_id="req-1" if hour == 0 else f"req-{hour}",
+        )
+        records.append(AuthAuditActions.create(client=client, record=record))
+
+    return records
+
+
+def test_query_by_actor_hydrates_by_default(audit_records):
+
+    data, _ = AuthAuditActions.query_by_actor(client=client, actor_user_id="alice@example.com")
+
+    assert [r.sk for r in data] == [r.sk for r in audit_records]
+    assert [r.role_additions for r in data] == [["role-0"], ["role-1"], ["role-2"]]
+    assert data[0].grant_additions == [{"resource": "prn:app", "action": "read"}]
+    assert data[0].after_hash == "after-0"
+
+
+def test_query_by_actor_listing_only(audit_records):
+
+    data, _ = AuthAuditActions.query_by_actor(client=client, actor_user_id="alice@example.com", hydrate=False)
+
+    # the index projects only the listing attributes
+    assert len(data) == 3
+    assert data[0].change_type == "permissions.update"
+    assert data[0].request_id == "req-1"
+    assert data[0].role_additions == []
+    assert data[0].after_hash is None
+
+
+def test_query_by_actor_time_range(audit_records):
+
+    data, _ = AuthAuditActions.query_by_actor(
+        client=client,
+        actor_user_id="alice@example.com",
+        since=start + timedelta(hours=1),
+        until=start + timedelta(hours=1),
+    )
+
+    assert [r.role_additions for r in data] == [["role-1"]]
+
+
+def test_query_by_change_type(audit_records):
+
+    data, _ = AuthAuditActions.query_by_change_type(client=client, change_type="permissions.update")
+    assert [r.role_additions for r in data] == [["role-0"], ["role-1"]]
+
+    data, _ = AuthAuditActions.query_by_change_type(client=client, change_type="roles.update", since=start + timedelta(hours=3))
+    assert data == []
+
+
+def test_query_by_request_id(audit_records):
+
+    data, _ = AuthAuditActions.query_by_request_id(client=client, request_id="req-1")
+
+    assert len(data) == 1
+    assert data[0].sk == audit_records[0].sk
+    assert data[0].before_hash == "before-0"
+
+
+def test_list_range(audit_records):
+
+    data, paginator = AuthAuditActions.list_range(client=client, start=start, end=start + timedelta(hours=2), limit=2)
+    assert [r.role_additions for r in data] == [["role-0"], ["role-1"]]
+
+    data, _ = AuthAuditActions.list_range(client=client, start=start, end=start + timedelta(hours=2), cursor=paginator.cursor)
+    assert [r.role_additions for r in data] == [["role-2"]]
@@ -0,0 +1,130 @@
+import threading
+
+from pynamodb.exceptions import PutError
+
+from core_db.audit import writer as writer_module
+from core_db.audit.audit import AuthAuditActions, AuthAuditModelFactory, AuthAuditSchemas, make_audit_pk, make_audit_sk
+from core_db.audit.writer import AuditWriter
+from core_db.exceptions import ConflictException, UnknownException
+
+
+def audit_record(user_id: str = "bob") -> AuthAuditSchemas:
+    return AuthAuditSchemas(pk=make_audit_pk("acme", user_id), sk=make_audit_sk(), change_type="permissions.update")
+
+
+class RecordingWriter(AuditWriter):
+    """Records batches instead of writing them."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _write_batch(self, client, records):
+        self.writing.set()
+        self.release.wait(5)
+        self.batches.append((client, list(records)))
+
+
+def test_flush_and_close_drain_the_queue(monkeypatch):
+
+    created = []
+    monkeypatch.setattr(AuthAuditActions, "create", classmethod(lambda cls, client, record: created.append((client, record))))
+
+    writer = RecordingWriter(flush_interval=0.01)
+    records = [("acme" if i % 2 else "other", audit_record(f"user-{i}")) for i in range(60)]
+    for client, record in records:
+        writer.submit(client, record)
+
+    assert writer.flush(timeout=5) is True
+    assert writer.pending == 0
+
+    written = [(client, record.sk) for client, batch in writer.batches for record in batch]
+    assert sorted(written) == sorted((client, record.sk) for client, record in records)
+    assert all(len(batch) <= writer_module.BATCH_SIZE for _, batch in writer.batches)
+
+    writer.submit("acme", audit_record("last"))
+    writer.close(timeout=5)
+    assert writer.pending == 0
+    assert not writer._thread.is_alive()
+
+    # after close records are written synchronously
+    late = audit_record("late")
+    writer.submit("acme", late)
+    assert created == [("acme", late)]
+
+
+def test_full_queue_falls_back_to_synchronous_writes(monkeypatch):
+
+    created = []
+    monkeypatch.setattr(AuthAuditActions, "create", classmethod(lambda cls, client, record: created.append(record)))
+
+    writer = RecordingWriter(max_queue=1, put_timeout=0.01, flush_interval=0.01)
+    writer.release.clear()
+
+    records = [audit_record(f"user-{i}") for i in range(5)]
+    writer.submit("acme", records[0])
+    assert writer.writing.wait(5)
+
+    # the writer thread is busy and the queue holds one record; the rest are written directly
+    for record in records[1:]:
+        writer.submit("acme", record)
+    assert created == records[2:]
+
+    writer.release.set()
+    assert writer.flush(timeout=5) is True
+    written = [record for _, batch in writer.batches for record in batch]
+    assert sorted(r.sk for r in written + created) == sorted(r.sk for r in records)
+
+    writer.close(timeout=5)
+
+
+class FailingBatch:
+
+    def __init__(self, attempts: list):
+        self.attempts = attempts
+
+    def __enter__(self):
+        return self
+
+    def save(self, item):
+        pass
+
+    def __exit__(self, *args):
+        self.attempts.append(1)
+        raise PutError("ProvisionedThroughputExceededException")
+
+
+def test_retry_exhaustion_writes_records_one_at_a_time(monkeypatch):
+
+    attempts = []
+    model_class = AuthAuditModelFactory.get_model("acme")
+    monkeypatch.setattr(model_class, "batch_write", classmethod(lambda cls: FailingBatch(attempts)))
+    monkeypatch.setattr(writer_module.time, "sleep", lambda seconds: None)
+
+    written_by_batch, written, lost = audit_record("partial"), audit_record("single"), audit_record("lost")
+    created = []
+
+    def create(cls, client, record):
+        if record is written_by_batch:
+            raise ConflictException("Audit record already exists")
+        if record is lost:
+            raise UnknownException("Service unavailable")
+        created.append(record)
+
+    monkeypatch.setattr(AuthAuditActions, "create", classmethod(create))
+
+    errors = []
+    monkeypatch.setattr(writer_module.log, "error", lambda *args, **kwargs: errors.append(args))
+
+    writer = AuditWriter(max_retries=2)
+    writer._write_batch("acme", [written_by_batch, written, lost])
+
+    assert len(attempts) == 2
+    assert created == [written]
+
+    # a conflict after a failed batch means the batch wrote the record; only the lost record is logged
+    assert len(errors) == 1
+    assert lost.sk in errors[0]
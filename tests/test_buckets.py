@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+
+import pytest
+from pynamodb.pagination import ResultIterator
+
+from core_db.buckets import day_bucket, day_buckets, query_buckets_parallel
+
+
+def test_day_bucket():
+
+    assert day_bucket(datetime(2024, 1, 15, 23, 59, 59, tzinfo=timezone.utc)) == "2024-01-15"
+
+    # naive datetimes are treated as UTC, aware ones are converted to UTC
+    assert day_bucket(datetime(2024, 1, 15, 23, 59, 59)) == "2024-01-15"
+    assert day_bucket(datetime.fromisoformat("2024-01-15T20:00:00-05:00")) == "2024-01-16"
+
+
+def test_day_buckets():
+
+    earliest = datetime(2024, 2, 28, 12, tzinfo=timezone.utc)
+    latest = datetime(2024, 3, 1, 1, tzinfo=timezone.utc)
+
+    assert day_buckets(earliest, latest) == ["2024-02-28", "2024-02-29", "2024-03-01"]
+    assert day_buckets(earliest, latest, sort_forward=False) == ["2024-03-01", "2024-02-29", "2024-02-28"]
+    assert day_buckets(latest, earliest) == []
+
+    with pytest.raises(ValueError):
+        day_buckets(datetime(1990, 1, 1, tzinfo=timezone.utc), latest)
+
+
+class FakeDayIndex:
+    """Serves fixed pages of rows per bucket, the way TableConnection.query does."""
+
+    def __init__(self, rows: dict[str, list[int]], page_size: int):
+        self.rows = {bucket: [{"Day": {"S": bucket}, "Id": {"N": str(i)}} for i in ids] for bucket, ids in rows.items()}
+        self.page_size = page_size
+
+    def get_meta_table(self):
+        return self
+
+    def get_key_names(self, index_name=None):
+        return ["Day", "Id"]
+
+    def _query(self, bucket, exclusive_start_key=None, limit=None, **kwargs):
+        rows = self.rows.get(bucket, [])
+        start = rows.index(exclusive_start_key) + 1 if exclusive_start_key else 0
+        size = min(self.page_size, limit or self.page_size)
+        page = rows[start : start + size]
+        response = {"Items": page, "Count": len(page), "ScannedCount": len(page)}
+        if start + size < len(rows):
+            response["LastEvaluatedKey"] = page[-1]
+        return response
+
+    def query(self, bucket, *, limit=None, last_evaluated_key=None, **kwargs):
+        return ResultIterator(self._query, (bucket,), {"exclusive_start_key": last_evaluated_key}, limit=limit)
+
+
+def test_query_buckets_parallel_merges_in_bucket_order():
+
+    index = FakeDayIndex({"d1": [1, 2, 3], "d2": [], "d3": [4, 5], "d4": [6, 7, 8, 9]}, page_size=2)
+    buckets = ["d1", "d2", "d3", "d4", "d5"]
+
+    def ids(rows):
+        return [int(row["Id"]["N"]) for row in rows]
+
+    data, cursor = query_buckets_parallel(index, buckets, limit=4, max_workers=2)
+    assert ids(data) == [1, 2, 3, 4]
+    assert cursor == {"Bucket": "d3", "Key": {"Day": {"S": "d3"}, "Id": {"N": "4"}}}
+
+    data, cursor = query_buckets_parallel(index, buckets, limit=3, cursor=cursor, max_workers=2)
+    assert ids(data) == [5, 6, 7]
+    assert cursor == {"Bucket": "d4", "Key": {"Day": {"S": "d4"}, "Id": {"N": "7"}}}
+
+    data, cursor = query_buckets_parallel(index, buckets, limit=2, cursor=cursor, max_workers=2)
+    assert ids(data) == [8, 9]
+    assert cursor == {"Bucket": "d5"}
+
+    data, cursor = query_buckets_parallel(index, buckets, limit=10, cursor=cursor, max_workers=2)
+    assert data == []
+    assert cursor is None
@@ -2,7 +2,7 @@ import pytest
 
 import core_framework as util
 
-from core_db.config import V_CORE_AUTOMATION, get_table_name
+from core_db.config import TABLE_NAME_TEMPLATES, V_CORE_AUTOMATION, get_table_name, refresh_table_names, register_table
 
 from core_db.registry.client import ClientFactsModel
 from core_db.registry.zone import ZoneFactsModel
@@ -125,3 +125,28 @@ def table_names():
     for model, expected in tables.items():
         name = get_table_name(model, client="core")
         assert name == expected, f"Expected {expected}, got {name}"
+
+
+class WidgetModel:
+    pass
+
+
+def test_register_table():
+    """Custom tables are resolved like the built-in ones"""
+    with pytest.raises(ValueError):
+        get_table_name(WidgetModel, client="test-client")
+    assert get_table_name(WidgetModel, client="test-client", default="widgets") == "widgets"
+
+    register_table(WidgetModel, f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-widgets")
+    try:
+        assert get_table_name(WidgetModel, client="test-client") == f"test-client-{V_CORE_AUTOMATION}-widgets"
+
+        # re-registering replaces the cached name
+        register_table("WidgetModel", f"{{prefix}}{{client}}-{V_CORE_AUTOMATION}-gadgets")
+        assert get_table_name(WidgetModel, client="test-client") == f"test-client-{V_CORE_AUTOMATION}-gadgets"
+
+        with pytest.raises(ValueError):
+            register_table(WidgetModel, "{prefix}{region}-widgets")
+    finally:
+        TABLE_NAME_TEMPLATES.pop("WidgetModel", None)
+        refresh_table_names()
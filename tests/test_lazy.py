@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+from core_db.dbhelper import actions_routes
+
+
+def test_dbhelper_import_does_not_load_actions():
+
+    code = (
+        "import sys\n"
+        "import core_db.dbhelper\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('core_db.item', 'core_db.event', 'core_db.registry', 'core_db.facter'))))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.strip()
+
+    assert output == "[]"
+
+
+def test_actions_routes_resolve_on_lookup():
+
+    from core_db.event.actions import EventActions
+    from core_db.registry.zone.actions import ZoneActions
+
+    assert "event" in actions_routes
+    assert "unknown" not in actions_routes
+    assert actions_routes.get("unknown") is None
+
+    assert actions_routes["event"] is EventActions
+    assert actions_routes.get("registry:zone") is ZoneActions
+    assert len(list(actions_routes)) == len(actions_routes) == 16
+
+
+def test_package_exports_resolve_on_access():
+
+    import core_db.registry.zone as zone
+    from core_db.registry.zone.actions import ZoneActions
+
+    assert "ZoneActions" in dir(zone)
+    assert zone.ZoneActions is ZoneActions
+
+    from core_db.item import ItemActions
+    from core_db.item.actions import ItemTableActions
+
+    assert ItemActions is ItemTableActions
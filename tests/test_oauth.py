@@ -0,0 +1,218 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import core_framework as util
+
+from core_db.oauth.actions import AuthActions, ForgotPasswordActions, OAuthActions, RateLimitActions
+from core_db.oauth.authorization import AuthorizationsModelFactory
+from core_db.oauth.oauthtable import RECORD_TYPE_SHARDS, OAuthTableModelFactory, record_shard, record_shards
+from core_db.exceptions import ConflictException, NotFoundException
+
+from .bootstrap import *  # noqa: F403, F401
+
+client = util.get_client() or "core"
+
+
+def _authorization(code: str, **kwargs) -> dict:
+    data = {
+        "client": client,
+        "code": code,
+        "client_id": "web-app",
+        "subject": "user-1",
+        "scopes": "openid profile",
+        "redirect_url": "https://example.com/callback",
+        "expires_at": datetime.now(timezone.utc) + timedelta(minutes=5),
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_consume_returns_the_code_once(bootstrap_dynamo):
+
+    AuthActions.create(**_authorization("consume-once"))
+
+    record = AuthActions.consume(client=client, code="consume-once", client_id="web-app")
+    assert record.code == "consume-once"
+    assert record.subject == "user-1"
+
+    with pytest.raises(NotFoundException):
+        AuthActions.consume(client=client, code="consume-once", client_id="web-app")
+
+
+def test_consume_concurrent_redemptions_have_one_winner(bootstrap_dynamo):
+
+    AuthActions.create(**_authorization("consume-race"))
+
+    def redeem(_):
+        try:
+            return AuthActions.consume(client=client, code="consume-race", client_id="web-app")
+        except NotFoundException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(redeem, range(8)))
+
+    winners = [result for result in results if not isinstance(result, Exception)]
+    assert len(winners) == 1
+    assert winners[0].code == "consume-race"
+    assert all(isinstance(result, NotFoundException) for result in results if result is not winners[0])
+
+
+def test_consume_conflicts_leave_the_code(bootstrap_dynamo):
+
+    AuthActions.create(**_authorization("consume-expired", expires_at=datetime.now(timezone.utc) - timedelta(minutes=1)))
+    with pytest.raises(ConflictException):
+        AuthActions.consume(client=client, code="consume-expired", client_id="web-app")
+    assert AuthActions.get(client=client, code="consume-expired").code == "consume-expired"
+
+    AuthActions.create(**_authorization("consume-other-client"))
+    with pytest.raises(ConflictException):
+        AuthActions.consume(client=client, code="consume-other-client", client_id="mobile-app")
+    assert AuthActions.get(client=client, code="consume-other-client").client_id == "web-app"
+
+    AuthActions.create(**_authorization("consume-used", used=True))
+    with pytest.raises(ConflictException):
+        AuthActions.consume(client=client, code="consume-used", client_id="web-app")
+
+
+def test_consume_rejects_other_record_types(bootstrap_dynamo):
+
+    RateLimitActions.create(client=client, code="consume-rate-limit", attempts=[1], ttl=int(time.time()) + 60)
+
+    with pytest.raises(ConflictException):
+        AuthActions.consume(client=client, code="consume-rate-limit")
+
+    assert RateLimitActions.get(client=client, code="consume-rate-limit").attempts == [1]
+
+
+def test_list_reads_one_record_type(bootstrap_dynamo):
+
+    AuthActions.create(**_authorization("list-authorization"))
+    RateLimitActions.create(client=client, code="list-rate-limit", attempts=[1, 2], ttl=int(time.time()) + 60)
+    ForgotPasswordActions.create(
+        client=client,
+        code="list-forgot-password",
+        client_id="web-app",
+        user_id="user-1",
+        email="user-1@example.com",
+        reset_token="token",
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+    authorizations, _ = AuthActions.list(client=client)
+    codes = {record.code for record in authorizations}
+    assert "list-authorization" in codes
+    assert "list-rate-limit" not in codes and "list-forgot-password" not in codes
+
+    rate_limits, _ = RateLimitActions.list(client=client)
+    assert "list-rate-limit" in {record.code for record in rate_limits}
+
+    forgot_passwords, _ = ForgotPasswordActions.list(client=client)
+    assert {record.code for record in forgot_passwords} >= {"list-forgot-password"}
+    assert "list-authorization" not in {record.code for record in forgot_passwords}
+
+
+def test_list_walks_every_shard(bootstrap_dynamo):
+
+    codes = [f"shard-rate-limit-{i}" for i in range(40)]
+    for code in codes:
+        RateLimitActions.create(client=client, code=code, attempts=[1], ttl=int(time.time()) + 60)
+
+    # rate limits are spread over the index partitions
+    assert len({record_shard("rate-limit", code) for code in codes}) > 1
+
+    listed = []
+    cursor = None
+    while True:
+        page, paginator = RateLimitActions.list(client=client, limit=7, cursor=cursor)
+        assert len(page) <= 7
+        listed.extend(record.code for record in page)
+        cursor = paginator.cursor
+        if not cursor:
+            break
+
+    assert set(codes) <= set(listed)
+    assert len(listed) == len(set(listed))
+
+
+def test_record_shard():
+
+    assert record_shard("rate-limit", "abc") == record_shard("rate-limit", "abc")
+    assert record_shard("rate-limit", "abc") in record_shards("rate-limit")
+    assert len(record_shards("rate-limit")) == RECORD_TYPE_SHARDS
+
+    index_schema = OAuthTableModelFactory.get_model(client).record_type_index._get_schema()
+    assert index_schema["projection"] == {"ProjectionType": "KEYS_ONLY"}
+    assert {"AttributeName": "RecordShard", "KeyType": "HASH"} in index_schema["key_schema"]
+
+
+def test_records_carry_their_ttl(bootstrap_dynamo):
+
+    expires_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    AuthActions.create(**_authorization("ttl-authorization", expires_at=expires_at))
+
+    item = AuthorizationsModelFactory.get_model(client).get("ttl-authorization")
+    assert item.record_type == "authorization"
+    assert item.ttl == expires_at
+
+    RateLimitActions.create(client=client, code="ttl-rate-limit", attempts=[1], ttl=1893456000)
+    assert RateLimitActions.get(client=client, code="ttl-rate-limit").ttl == 1893456000
+
+
+def test_backfill_record_types(bootstrap_dynamo):
+
+    expires_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    AuthActions.create(**_authorization("legacy-authorization", expires_at=expires_at))
+
+    # a row written before record types existed has neither RecordType nor TTL
+    model_class = AuthorizationsModelFactory.get_model(client)
+    item = model_class.get("legacy-authorization")
+    item.update(actions=[model_class.record_type.remove(), model_class.record_shard.remove(), model_class.ttl.remove()])
+
+    authorizations, _ = AuthActions.list(client=client)
+    assert "legacy-authorization" not in {record.code for record in authorizations}
+
+    assert OAuthActions.backfill_record_types(client=client) >= 1
+
+    item = model_class.get("legacy-authorization")
+    assert item.record_type == "authorization"
+    assert item.record_shard == record_shard("authorization", "legacy-authorization")
+    assert item.ttl == expires_at
+
+    authorizations, _ = AuthActions.list(client=client)
+    assert "legacy-authorization" in {record.code for record in authorizations}
+
+    # reruns skip rows that have a record type
+    assert OAuthActions.backfill_record_types(client=client) == 0
+
+
+class FakeTTLClient:
+
+    def __init__(self, status: str):
+        self.status = status
+        self.updates = []
+
+    def describe_time_to_live(self, TableName):
+        return {"TimeToLiveDescription": {"TimeToLiveStatus": self.status}}
+
+    def update_time_to_live(self, TableName, TimeToLiveSpecification):
+        self.updates.append((TableName, TimeToLiveSpecification))
+        self.status = "ENABLED"
+
+
+def test_enable_ttl_on_existing_table(monkeypatch):
+
+    model_class = OAuthTableModelFactory.get_model(client)
+    botocore_client = FakeTTLClient("DISABLED")
+    connection = type("Connection", (), {"connection": type("Inner", (), {"client": botocore_client})()})()
+    monkeypatch.setattr(model_class, "_get_connection", classmethod(lambda cls: connection))
+
+    assert OAuthTableModelFactory.enable_ttl(client) is True
+    assert botocore_client.updates == [(model_class.Meta.table_name, {"Enabled": True, "AttributeName": "TTL"})]
+
+    # already enabled: no second UpdateTimeToLive
+    assert OAuthTableModelFactory.enable_ttl(client) is False
+    assert len(botocore_client.updates) == 1
@@ -0,0 +1,68 @@
+from pynamodb.pagination import ResultIterator
+
+from core_db.pagefill import fill_page
+
+
+class FakeTable:
+    """Serves fixed pages of rows keyed by "Id", the way TableConnection.scan does."""
+
+    def __init__(self, rows: list[int], page_size: int):
+        self.rows = [{"Id": {"N": str(i)}} for i in rows]
+        self.page_size = page_size
+        self.calls = 0
+
+    def get_meta_table(self):
+        return self
+
+    def get_key_names(self, index_name=None):
+        return ["Id"]
+
+    def scan(self, exclusive_start_key=None, **kwargs):
+        self.calls += 1
+        start = 0
+        if exclusive_start_key:
+            start = next(i for i, row in enumerate(self.rows) if row == exclusive_start_key) + 1
+        page = self.rows[start : start + self.page_size]
+        response = {"Items": page, "Count": len(page), "ScannedCount": len(page)}
+        if start + self.page_size < len(self.rows):
+            response["LastEvaluatedKey"] = page[-1]
+        return response
+
+    def results(self, cursor=None) -> ResultIterator:
+        return ResultIterator(self.scan, (), {"exclusive_start_key": cursor})
+
+
+def is_even(row) -> bool:
+    return int(row["Id"]["N"]) % 2 == 0
+
+
+def test_fill_page_collects_limit_across_pages():
+
+    table = FakeTable(list(range(1, 21)), page_size=3)
+
+    data, cursor = fill_page(table.results(), limit=4, accept=is_even)
+
+    assert [int(row["Id"]["N"]) for row in data] == [2, 4, 6, 8]
+    # resumes right after the last returned row, even mid-page
+    assert cursor == {"Id": {"N": "8"}}
+
+    data, cursor = fill_page(table.results(cursor), limit=100, accept=is_even)
+
+    assert [int(row["Id"]["N"]) for row in data] == [10, 12, 14, 16, 18, 20]
+    assert cursor is None
+
+
+def test_fill_page_stops_at_budget_on_page_boundary():
+
+    table = FakeTable(list(range(1, 21)), page_size=5)
+
+    data, cursor = fill_page(table.results(), limit=10, accept=lambda row: int(row["Id"]["N"]) > 15, max_scanned=6)
+
+    assert data == []
+    assert cursor == {"Id": {"N": "10"}}
+    assert table.calls == 2
+
+    data, cursor = fill_page(table.results(cursor), limit=10, accept=lambda row: int(row["Id"]["N"]) > 15)
+
+    assert [int(row["Id"]["N"]) for row in data] == [16, 17, 18, 19, 20]
+    assert cursor is None
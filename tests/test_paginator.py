@@ -6,7 +6,8 @@ from core_db.models import Paginator
 
 
 @pytest.fixture
-def cursor():
+def cursor(monkeypatch):
+    monkeypatch.setenv("CORE_DB_ACCEPT_LEGACY_CURSORS", "true")
     data = {"key": "value", "key2": "value2"}
     return base64.b64encode(util.to_json(data).encode()).decode()
 
@@ -36,11 +37,15 @@ def test_paginator_initialization(paginator_data, cursor):
     assert paginator.sort == "ascending"
     assert paginator.sort_forward is True
 
+    # Legacy base64 JSON cursors are accepted while CORE_DB_ACCEPT_LEGACY_CURSORS is on
+    assert paginator.last_evaluated_key == {"key": "value", "key2": "value2"}
+
     cursor2 = {"key2": "new_value", "key3": "new_value2"}
-    cursor2_encoded = base64.b64encode(util.to_json(cursor2).encode()).decode()
+    cursor2_legacy = base64.b64encode(util.to_json(cursor2).encode()).decode()
 
     paginator.last_evaluated_key = cursor2
-    assert paginator.cursor == cursor2_encoded
+    assert paginator.cursor != cursor2_legacy
+    assert len(paginator.cursor) < len(cursor2_legacy)
     assert paginator.last_evaluated_key["key2"] == "new_value"
     assert paginator.last_evaluated_key["key3"] == "new_value2"
 
@@ -59,3 +64,23 @@ def test_paginator_initialization(paginator_data, cursor):
 
     paginator.latest_time = strdate
     assert paginator.latest_time == date1
+
+
+def test_paginator_rejects_tampered_cursor():
+
+    paginator = Paginator()
+    paginator.last_evaluated_key = {"Prn": {"S": "prn:core:api"}, "Timestamp": {"S": "2024-01-15T14:30:45.123456+0000"}}
+
+    tampered = paginator.cursor[:-2] + ("AA" if paginator.cursor[-2:] != "AA" else "BB")
+
+    with pytest.raises(ValueError):
+        Paginator(cursor=tampered)
+
+
+def test_paginator_rejects_legacy_cursor_by_default(monkeypatch):
+
+    monkeypatch.delenv("CORE_DB_ACCEPT_LEGACY_CURSORS", raising=False)
+    legacy = base64.b64encode(util.to_json({"Prn": {"S": "prn:core:api"}}).encode()).decode()
+
+    with pytest.raises(ValueError):
+        Paginator(cursor=legacy)
@@ -0,0 +1,89 @@
+import pytest
+
+import core_framework as util
+
+from core_db.passkey import PassKey, PassKeyActions, PassKeysModelFactory
+from core_db.exceptions import ConflictException, NotFoundException
+
+from .bootstrap import *  # noqa: F403, F401
+
+
+@pytest.fixture(scope="module")
+def passkeys_table():
+
+    host = util.get_dynamodb_host()
+
+    assert host == "http://localhost:8000", "DYNAMODB_HOST must be set to http://localhost:8000"
+
+    # the passkeys table is global
+    if PassKeysModelFactory.exists(None):
+        PassKeysModelFactory.delete_table(None, wait=True)
+    PassKeysModelFactory.create_table(None, wait=True)
+
+    return True
+
+
+def _passkey(key_id: str, **kwargs) -> PassKey:
+    return PassKeyActions.create(user_id="bob", key_id=key_id, public_key="public-key", **kwargs)
+
+
+def test_get_by_key_id(passkeys_table):
+
+    _passkey("lookup-key")
+
+    passkey = PassKeyActions.get_by_key_id(key_id="lookup-key")
+    assert passkey.user_id == "bob"
+    assert passkey.key_id == "lookup-key"
+
+    with pytest.raises(NotFoundException):
+        PassKeyActions.get_by_key_id(key_id="no-such-key")
+
+
+def test_record_sign_count_increases(passkeys_table):
+
+    _passkey("counting-key", sign_count=5)
+
+    passkey = PassKeyActions.record_sign_count(user_id="bob", key_id="counting-key", sign_count=6, uv=True)
+    assert passkey.sign_count == 6
+    assert passkey.last_used_at is not None
+    assert passkey.last_uv_at is not None
+    assert not passkey.clone_warning
+
+    passkey = PassKeyActions.record_sign_count(user_id="bob", key_id="counting-key", sign_count=10)
+    assert passkey.sign_count == 10
+
+
+def test_record_sign_count_without_a_counter(passkeys_table):
+
+    # authenticators without a counter always report 0
+    _passkey("zero-key", sign_count=0)
+
+    assert PassKeyActions.record_sign_count(user_id="bob", key_id="zero-key", sign_count=0).sign_count == 0
+    assert PassKeyActions.record_sign_count(user_id="bob", key_id="zero-key", sign_count=0).sign_count == 0
+
+
+@pytest.mark.parametrize("sign_count", [7, 3, 0])
+def test_record_sign_count_that_did_not_increase_flags_a_clone(passkeys_table, sign_count):
+
+    key_id = f"cloned-key-{sign_count}"
+    _passkey(key_id, sign_count=7)
+
+    with pytest.raises(ConflictException):
+        PassKeyActions.record_sign_count(user_id="bob", key_id=key_id, sign_count=sign_count)
+
+    # the stored counter is kept and the key is flagged
+    passkey = PassKeyActions.get(user_id="bob", key_id=key_id)
+    assert passkey.sign_count == 7
+    assert passkey.clone_warning is True
+    assert passkey.last_used_at is None
+
+
+def test_record_sign_count_for_a_missing_key(passkeys_table):
+
+    with pytest.raises(NotFoundException):
+        PassKeyActions.record_sign_count(user_id="bob", key_id="no-such-key", sign_count=1)
+
+    # the failed update did not create the key
+    model_class = PassKey.get_model()
+    with pytest.raises(model_class.DoesNotExist):
+        model_class.get("bob", "no-such-key")
@@ -0,0 +1,121 @@
+import importlib.util
+import os
+
+import pytest
+
+LAMBDA_FILE = os.path.join(os.path.dirname(__file__), "..", "core_db", "platform", "files", "portfolio_lambda.py")
+
+ARN = "arn:aws:dynamodb:us-east-1:123456789012:table/core-automation-portfolios/stream/2024-01-01T00:00:00.000"
+
+
+class FakeBatch:
+
+    def __init__(self, table: "FakeTable"):
+        self.table = table
+
+    def __enter__(self):
+        return self
+
+    def delete_item(self, Key):
+        self.table.deleted.append(Key)
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeTable:
+    """Serves queries a page at a time, like DynamoDB with a small page size."""
+
+    def __init__(self, range_key: str, items: dict, page_size: int = 2, failing: str = None):
+        self.range_key = range_key
+        self.items = items
+        self.page_size = page_size
+        self.failing = failing
+        self.queries = []
+        self.deleted = []
+
+    def batch_writer(self):
+        return FakeBatch(self)
+
+    def query(self, KeyConditionExpression, ProjectionExpression, ExpressionAttributeNames, ExclusiveStartKey=None):
+        portfolio_facts = KeyConditionExpression.get_expression()["values"][1]
+        self.queries.append((portfolio_facts, ExclusiveStartKey))
+        if portfolio_facts == self.failing:
+            raise RuntimeError("ProvisionedThroughputExceededException")
+
+        keys = sorted(self.items.get(portfolio_facts, []))
+        start = keys.index(ExclusiveStartKey[self.range_key]) + 1 if ExclusiveStartKey else 0
+        page = keys[start : start + self.page_size]
+        response = {"Items": [{ExpressionAttributeNames["#rk"]: key} for key in page]}
+        if start + self.page_size < len(keys):
+            response["LastEvaluatedKey"] = {"ClientPortfolio": portfolio_facts, self.range_key: page[-1]}
+        return response
+
+
+@pytest.fixture
+def portfolio_lambda(monkeypatch):
+
+    # the lambda reads its table names at import, as it does when deployed
+    monkeypatch.setenv("APPS_TABLE", "core-automation-apps")
+    monkeypatch.setenv("ZONES_TABLE", "core-automation-zones")
+    spec = importlib.util.spec_from_file_location("portfolio_lambda", LAMBDA_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def stream_record(seq: int, event_name: str, client: str, portfolio: str) -> dict:
+    """A record as recorded from the portfolios table stream (OLD_IMAGE)."""
+    keys = {"Client": {"S": client}, "Portfolio": {"S": portfolio}}
+    stream = {"Keys": keys, "SequenceNumber": str(seq), "StreamViewType": "OLD_IMAGE"}
+    if event_name != "INSERT":
+        stream["OldImage"] = keys
+    return {
+        "eventID": f"event-{seq}",
+        "eventName": event_name,
+        "eventSource": "aws:dynamodb",
+        "eventSourceARN": ARN,
+        "dynamodb": stream,
+    }
+
+
+def test_remove_deletes_every_page_of_apps_and_zones(portfolio_lambda, monkeypatch):
+
+    apps = FakeTable("AppRegex", {"acme:web": [f"^app-{i}$" for i in range(5)], "acme:api": ["^api$"]})
+    zones = FakeTable("Zone", {"acme:web": ["dev", "prod", "test"]})
+    tables = {"core-automation-apps": apps, "core-automation-zones": zones}
+    monkeypatch.setattr(portfolio_lambda, "get_table", lambda name: tables[name])
+
+    event = {"Records": [stream_record(1, "INSERT", "acme", "web"), stream_record(2, "REMOVE", "acme", "web")]}
+
+    assert portfolio_lambda.handler(event, None) == {"batchItemFailures": []}
+
+    # five apps in pages of two: three queries, each continuing from the last key
+    assert apps.queries == [
+        ("acme:web", None),
+        ("acme:web", {"ClientPortfolio": "acme:web", "AppRegex": "^app-1$"}),
+        ("acme:web", {"ClientPortfolio": "acme:web", "AppRegex": "^app-3$"}),
+    ]
+    assert apps.deleted == [{"ClientPortfolio": "acme:web", "AppRegex": f"^app-{i}$"} for i in range(5)]
+    assert zones.deleted == [{"ClientPortfolio": "acme:web", "Zone": zone} for zone in ["dev", "prod", "test"]]
+
+
+def test_failed_record_is_reported_for_retry(portfolio_lambda, monkeypatch):
+
+    apps = FakeTable("AppRegex", {"acme:web": ["^web$"], "acme:api": ["^api$"], "acme:batch": ["^batch$"]}, failing="acme:api")
+    zones = FakeTable("Zone", {"acme:web": ["dev"], "acme:batch": ["prod"]})
+    tables = {"core-automation-apps": apps, "core-automation-zones": zones}
+    monkeypatch.setattr(portfolio_lambda, "get_table", lambda name: tables[name])
+
+    event = {
+        "Records": [
+            stream_record(1, "REMOVE", "acme", "web"),
+            stream_record(2, "REMOVE", "acme", "api"),
+            stream_record(3, "REMOVE", "acme", "batch"),
+        ]
+    }
+
+    # only the failed record is retried; the others are deleted
+    assert portfolio_lambda.handler(event, None) == {"batchItemFailures": [{"itemIdentifier": "2"}]}
+    assert sorted(key["AppRegex"] for key in apps.deleted) == ["^batch$", "^web$"]
+    assert sorted(key["Zone"] for key in zones.deleted) == ["dev", "prod"]
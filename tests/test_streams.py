@@ -0,0 +1,89 @@
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+from pynamodb.models import Model
+
+from core_db.platform.streams import MemoryCheckpoints, StreamProcessor
+
+ARN = "arn:aws:dynamodb:us-east-1:123456789012:table/acme-core-automation-portfolios/stream/2024-01-01T00:00:00.000"
+
+
+class PortfolioImage(Model):
+
+    class Meta:
+        table_name = "acme-core-automation-portfolios"
+
+    portfolio = UnicodeAttribute(hash_key=True, attr_name="Portfolio")
+    app_count = NumberAttribute(null=True, attr_name="AppCount")
+
+
+def stream_record(seq: int, event_name: str, portfolio: str, app_count: int = 0) -> dict:
+    """A record as recorded from a portfolios table stream (OLD_IMAGE / NEW_IMAGE)."""
+    image = {"Portfolio": {"S": portfolio}, "AppCount": {"N": str(app_count)}}
+    stream = {"Keys": {"Portfolio": {"S": portfolio}}, "SequenceNumber": str(seq), "StreamViewType": "NEW_AND_OLD_IMAGES"}
+    if event_name != "INSERT":
+        stream["OldImage"] = image
+    if event_name != "REMOVE":
+        stream["NewImage"] = image
+    return {
+        "eventID": f"event-{seq}",
+        "eventName": event_name,
+        "eventSource": "aws:dynamodb",
+        "eventSourceARN": ARN,
+        "dynamodb": stream,
+    }
+
+
+def test_stream_processor_handles_records_in_order_per_item():
+
+    processor = StreamProcessor(PortfolioImage, max_workers=4)
+    seen = []
+
+    @processor.on("INSERT", "MODIFY")
+    def on_change(record, effects):
+        assert record.table_name == "acme-core-automation-portfolios"
+        assert isinstance(record.new, PortfolioImage)
+        if record.new.portfolio == "broken" and record.event_name == "INSERT":
+            raise RuntimeError("handler failed")
+        seen.append((record.new.portfolio, record.sequence_number))
+
+    @processor.on("REMOVE")
+    def on_remove(record, effects):
+        assert record.new is None
+        effects.call(("invalidate", record.old.portfolio), lambda: seen.append(("invalidated", record.old.portfolio)))
+        effects.call(("invalidate", record.old.portfolio), lambda: seen.append(("invalidated", record.old.portfolio)))
+
+    event = {
+        "Records": [
+            stream_record(1, "INSERT", "web", 1),
+            stream_record(2, "INSERT", "broken"),
+            stream_record(3, "MODIFY", "web", 2),
+            stream_record(4, "MODIFY", "broken", 1),
+            stream_record(5, "REMOVE", "api"),
+        ]
+    }
+
+    response = processor(event, None)
+
+    # the failed record and the later change to the same item are retried
+    assert response == {"batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "4"}]}
+    assert [s for s in seen if s[0] == "web"] == [("web", "1"), ("web", "3")]
+    # callbacks with the same key run once
+    assert seen.count(("invalidated", "api")) == 1
+
+
+def test_stream_processor_skips_checkpointed_records():
+
+    checkpoints = MemoryCheckpoints()
+    processor = StreamProcessor(PortfolioImage, checkpoints=checkpoints)
+    calls = []
+
+    @processor.on()
+    def on_any(record, effects):
+        calls.append(record.event_id)
+
+    event = {"Records": [stream_record(1, "INSERT", "web"), stream_record(2, "MODIFY", "web")]}
+
+    assert processor(event) == {"batchItemFailures": []}
+    assert processor(event) == {"batchItemFailures": []}
+
+    assert calls == ["event-1", "event-2"]
+    assert checkpoints.seen("event-2")
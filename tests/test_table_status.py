@@ -0,0 +1,108 @@
+from pynamodb.attributes import UnicodeAttribute
+from pynamodb.exceptions import TableDoesNotExist
+from pynamodb.indexes import AllProjection, GlobalSecondaryIndex
+from pynamodb.models import Model
+
+from core_db.models import TableFactory
+
+
+class StatusIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "status-index"
+        projection = AllProjection()
+
+    status = UnicodeAttribute(hash_key=True, attr_name="Status")
+
+
+class StatusModel(Model):
+    class Meta:
+        table_name = "status-test"
+        region = "us-east-1"
+
+    pk = UnicodeAttribute(hash_key=True, attr_name="PK")
+    status = UnicodeAttribute(attr_name="Status")
+    status_index = StatusIndex()
+
+
+def table_description(indexes: list[dict]) -> dict:
+    return {"TableName": "status-test", "TableStatus": "ACTIVE", "GlobalSecondaryIndexes": indexes}
+
+
+class FakeConnection:
+    """Counts DescribeTable calls."""
+
+    def __init__(self, description: dict | None):
+        self.description = description
+        self.calls = 0
+
+    def describe_table(self):
+        self.calls += 1
+        if self.description is None:
+            raise TableDoesNotExist("status-test")
+        return self.description
+
+
+def use_connection(monkeypatch, connection: FakeConnection):
+    TableFactory.clear_cache()
+    monkeypatch.setattr(TableFactory, "get_model", classmethod(lambda cls, base_model, client=None: base_model))
+    monkeypatch.setattr(StatusModel, "_get_connection", classmethod(lambda cls: connection))
+
+
+def test_exists_is_cached_until_invalidated(monkeypatch):
+
+    connection = FakeConnection(None)
+    use_connection(monkeypatch, connection)
+
+    assert TableFactory.exists(StatusModel) is False
+    assert TableFactory.exists(StatusModel) is False
+    assert connection.calls == 1
+
+    connection.description = table_description(
+        [
+            {
+                "IndexName": "status-index",
+                "KeySchema": [{"AttributeName": "Status", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+        ]
+    )
+    TableFactory.invalidate(StatusModel)
+
+    assert TableFactory.exists(StatusModel) is True
+    assert TableFactory.exists(StatusModel) is True
+    assert connection.calls == 2
+
+    assert TableFactory.describe(StatusModel, refresh=True)["TableStatus"] == "ACTIVE"
+    assert connection.calls == 3
+
+    TableFactory.clear_cache()
+
+
+def test_verify_schema(monkeypatch):
+
+    connection = FakeConnection(table_description([]))
+    use_connection(monkeypatch, connection)
+
+    assert TableFactory.verify_schema(StatusModel) == ["index status-index is missing from table status-test"]
+
+    connection.description = table_description(
+        [
+            {
+                "IndexName": "status-index",
+                "KeySchema": [{"AttributeName": "Status", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "KEYS_ONLY"},
+            },
+            {
+                "IndexName": "old-index",
+                "KeySchema": [{"AttributeName": "Old", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ]
+    )
+
+    differences = TableFactory.verify_schema(StatusModel)
+    assert len(differences) == 2
+    assert differences[0].startswith("index status-index has projection")
+    assert differences[1] == "index old-index of table status-test is not declared by the model"
+
+    TableFactory.clear_cache()
@@ -0,0 +1,183 @@
+import pytest
+
+import core_framework as util
+
+from pynamodb.attributes import UnicodeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, IncludeProjection
+from pynamodb.models import Model
+
+import core_db.tenant as tenant_module
+from core_db.exceptions import BadRequestException
+from core_db.models import TableFactory
+from core_db.tenant import provision_global_tables, provision_tenant, teardown_tenant
+
+from .bootstrap import *  # noqa: F403, F401
+
+# A client of its own so the shared test tables are not touched
+tenant = "tenant-test"
+
+
+def test_provision_and_teardown_tenant():
+
+    host = util.get_dynamodb_host()
+
+    assert host == "http://localhost:8000", "DYNAMODB_HOST must be set to http://localhost:8000"
+
+    teardown_tenant(tenant)
+
+    result = provision_tenant(tenant)
+    assert len(result) == 7
+    assert set(result.values()) == {"created"}
+
+    # reruns leave the tables alone
+    result = provision_tenant(tenant)
+    assert set(result.values()) == {"exists"}
+
+    result = teardown_tenant(tenant)
+    assert set(result.values()) == {"deleted"}
+
+    result = teardown_tenant(tenant)
+    assert set(result.values()) == {"missing"}
+
+
+def test_provision_tenant_requires_client():
+
+    with pytest.raises(BadRequestException):
+        provision_tenant("")
+
+
+class FakeBotocoreClient:
+    """Adds indexes to a table description as UpdateTable would."""
+
+    def __init__(self, description: dict):
+        self.description = description
+        self.updates = []
+
+    def update_table(self, TableName, GlobalSecondaryIndexUpdates, AttributeDefinitions=None):
+        indexes = self.description["GlobalSecondaryIndexes"]
+        for update in GlobalSecondaryIndexUpdates:
+            if "Delete" in update:
+                self.updates.append((TableName, "delete", update["Delete"]["IndexName"]))
+                indexes[:] = [index for index in indexes if index["IndexName"] != update["Delete"]["IndexName"]]
+            else:
+                create = update["Create"]
+                self.updates.append((TableName, "create", create["IndexName"]))
+                indexes.append({"IndexName": create["IndexName"], "IndexStatus": "ACTIVE", "Projection": create["Projection"]})
+
+
+class FakeTableConnection:
+
+    def __init__(self, description: dict):
+        self.description = description
+        self.connection = type("Connection", (), {"client": FakeBotocoreClient(description)})()
+
+    def describe_table(self):
+        return self.description
+
+
+class KeyIdIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "key-id-index"
+        projection = IncludeProjection(["Status"])
+
+    key_id = UnicodeAttribute(hash_key=True, attr_name="KeyId")
+
+
+class SharedModel(Model):
+    class Meta:
+        table_name = "shared-test"
+        region = "us-east-1"
+        billing_mode = "PAY_PER_REQUEST"
+
+    pk = UnicodeAttribute(hash_key=True, attr_name="PK")
+    key_id = UnicodeAttribute(null=True, attr_name="KeyId")
+    status = UnicodeAttribute(null=True, attr_name="Status")
+    key_id_index = KeyIdIndex()
+
+
+def use_shared_table(monkeypatch, indexes: list[dict]) -> FakeTableConnection:
+    description = {
+        "TableName": "shared-test",
+        "TableStatus": "ACTIVE",
+        "BillingModeSummary": {"BillingMode": "PAY_PER_REQUEST"},
+        "GlobalSecondaryIndexes": indexes,
+    }
+    connection = FakeTableConnection(description)
+
+    monkeypatch.setattr(tenant_module, "global_models", lambda: [SharedModel])
+    monkeypatch.setattr(TableFactory, "get_model", classmethod(lambda cls, base_model, client=None: base_model))
+    monkeypatch.setattr(SharedModel, "_get_connection", classmethod(lambda cls: connection))
+    return connection
+
+
+def test_provision_global_tables_adds_missing_indexes(monkeypatch):
+
+    # an existing table created before the model declared key-id-index
+    connection = use_shared_table(monkeypatch, [])
+
+    assert provision_global_tables() == {"shared-test": "updated"}
+    assert connection.connection.client.updates == [("shared-test", "create", "key-id-index")]
+
+    # reruns leave the table alone
+    assert provision_global_tables() == {"shared-test": "exists"}
+    assert len(connection.connection.client.updates) == 1
+
+
+def test_provision_rebuilds_indexes_with_changed_projection(monkeypatch):
+
+    # the index was created when the model projected ALL
+    index = {"IndexName": "key-id-index", "IndexStatus": "ACTIVE", "Projection": {"ProjectionType": "ALL"}}
+    connection = use_shared_table(monkeypatch, [index])
+
+    # without rebuild_indexes the difference is only logged
+    assert provision_global_tables() == {"shared-test": "exists"}
+    assert connection.connection.client.updates == []
+
+    assert provision_global_tables(rebuild_indexes=True) == {"shared-test": "updated"}
+    assert connection.connection.client.updates == [
+        ("shared-test", "delete", "key-id-index"),
+        ("shared-test", "create", "key-id-index"),
+    ]
+    projection = connection.description["GlobalSecondaryIndexes"][0]["Projection"]
+    assert projection == {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["Status"]}
+
+    assert provision_global_tables(rebuild_indexes=True) == {"shared-test": "exists"}
+
+
+def test_provision_drops_indexes_the_model_no_longer_declares(monkeypatch):
+
+    # email-index style: an index the model replaced with a narrower one
+    indexes = [
+        {
+            "IndexName": "key-id-index",
+            "IndexStatus": "ACTIVE",
+            "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["Status"]},
+        },
+        {"IndexName": "old-index", "IndexStatus": "ACTIVE", "Projection": {"ProjectionType": "ALL"}},
+    ]
+    connection = use_shared_table(monkeypatch, indexes)
+
+    # without rebuild_indexes the extra index is only logged
+    assert provision_global_tables() == {"shared-test": "exists"}
+    assert connection.connection.client.updates == []
+
+    assert provision_global_tables(rebuild_indexes=True) == {"shared-test": "updated"}
+    assert connection.connection.client.updates == [("shared-test", "delete", "old-index")]
+    assert [index["IndexName"] for index in connection.description["GlobalSecondaryIndexes"]] == ["key-id-index"]
+
+
+def test_provision_rebuilds_indexes_with_changed_key_schema(monkeypatch):
+
+    index = {
+        "IndexName": "key-id-index",
+        "IndexStatus": "ACTIVE",
+        "KeySchema": [{"AttributeName": "Status", "KeyType": "HASH"}],
+        "Projection": {"ProjectionType": "INCLUDE", "NonKeyAttributes": ["Status"]},
+    }
+    connection = use_shared_table(monkeypatch, [index])
+
+    assert provision_global_tables(rebuild_indexes=True) == {"shared-test": "updated"}
+    assert connection.connection.client.updates == [
+        ("shared-test", "delete", "key-id-index"),
+        ("shared-test", "create", "key-id-index"),
+    ]
@@ -0,0 +1,46 @@
+import threading
+import time
+
+import core_db
+from core_db.event.models import EventModel
+from core_db.item.models import ItemModel
+from core_db.models import TableFactory
+
+
+def test_warmup_describes_each_table_once(monkeypatch):
+
+    described = []
+    lock = threading.Lock()
+
+    def describe(cls, base_model, client=None, refresh=False):
+        with lock:
+            described.append((base_model.__name__, client))
+        if base_model is ItemModel:
+            raise RuntimeError("no such table")
+        return {"TableStatus": "ACTIVE"}
+
+    monkeypatch.setattr(TableFactory, "describe", classmethod(describe))
+
+    report = core_db.warmup(clients=["acme", "other"], tables=[EventModel, ItemModel])
+
+    assert sorted(described) == [("EventModel", "acme"), ("EventModel", "other"), ("ItemModel", "acme"), ("ItemModel", "other")]
+    assert len(report["tasks"]) == 4
+    assert report["tasks"][f"table {TableFactory.get_model(EventModel, 'acme').Meta.table_name}"]["status"] == "ok"
+    assert report["tasks"][f"table {TableFactory.get_model(ItemModel, 'acme').Meta.table_name}"]["status"] == "error: no such table"
+
+
+def test_warmup_stops_waiting_at_the_budget(monkeypatch):
+
+    release = threading.Event()
+
+    def describe(cls, base_model, client=None, refresh=False):
+        release.wait(5)
+
+    monkeypatch.setattr(TableFactory, "describe", classmethod(describe))
+
+    start = time.perf_counter()
+    report = core_db.warmup(clients=["acme"], tables=[EventModel], budget=0.1)
+    release.set()
+
+    assert time.perf_counter() - start < 2
+    assert [task["status"] for task in report["tasks"].values()] == ["timeout"]